@@ -0,0 +1,110 @@
+"""
+JSON Decoding Benchmark
+
+Measures the cost of turning a /api/sdk/markets response body into a list of
+Market objects with each installed backend:
+
+- json:           json.loads + _parse_market (what response.json() did)
+- orjson:         orjson.loads + _parse_market
+- msgspec:        msgspec dict decoding + _parse_market
+- msgspec-typed:  decoded straight into Market objects (JSONDecoder default
+                  when msgspec is installed)
+
+Payloads are synthetic but shaped like real responses: every market carries
+the extra fields the server sends (description, outcomes, token IDs, tags,
+volume...) that the SDK does not keep. Nothing is sent anywhere.
+
+Usage:
+    pip install orjson msgspec
+    python benchmarks/bench_decoding.py [--markets 100 1000 5000] [--repeat 20]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from simmer_sdk.client import Market, _parse_market  # noqa: E402
+from simmer_sdk.decoding import JSONDecoder, available_backends  # noqa: E402
+
+
+def _market(i: int, rng: random.Random) -> dict:
+    price = rng.random()
+    external = rng.choice([None, round(rng.random(), 4)])
+    return {
+        "id": f"{rng.getrandbits(128):032x}",
+        "question": f"Will market #{i} resolve YES by {rng.randint(1, 28)} March 2026?",
+        "description": "This market resolves YES if the event happens before the deadline. " * 3,
+        "status": "active",
+        "current_probability": round(price, 4),
+        "import_source": rng.choice(["polymarket", "kalshi", None]),
+        "external_price_yes": external,
+        "divergence": None if external is None else round(price - external, 4),
+        "resolves_at": "2026-03-%02dT00:00:00Z" % rng.randint(1, 28),
+        "is_sdk_only": rng.random() < 0.05,
+        "outcomes": ["Yes", "No"],
+        "polymarket_token_id": str(rng.getrandbits(250)),
+        "polymarket_no_token_id": str(rng.getrandbits(250)),
+        "tags": rng.sample(["crypto", "politics", "sports", "weather", "tech", "elon"], 2),
+        "volume_24h": round(rng.uniform(0, 5e5), 2),
+        "created_at": "2026-01-01T00:00:00Z",
+    }
+
+
+def _payload(n: int) -> bytes:
+    rng = random.Random(n)
+    return json.dumps({"markets": [_market(i, rng) for i in range(n)], "has_more": False}).encode()
+
+
+def _variants() -> dict:
+    variants = {"json": lambda body: [_parse_market(m) for m in json.loads(body)["markets"]]}
+    backends = available_backends()
+    if "orjson" in backends:
+        loads = JSONDecoder("orjson", typed=False).loads
+        variants["orjson"] = lambda body: [_parse_market(m) for m in loads(body)["markets"]]
+    if "msgspec" in backends:
+        loads = JSONDecoder("msgspec", typed=False).loads
+        variants["msgspec"] = lambda body: [_parse_market(m) for m in loads(body)["markets"]]
+        typed = JSONDecoder("msgspec")
+        variants["msgspec-typed"] = lambda body: typed.decode_items(body, "markets", Market, _parse_market)
+    return variants
+
+
+def _time(fn, body: bytes, repeat: int) -> list:
+    fn(body)  # warm up (builds typed decoders)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(body)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--markets", type=int, nargs="+", default=[100, 1000, 5000],
+                        help="markets per payload (default: 100 1000 5000)")
+    parser.add_argument("--repeat", type=int, default=20, help="decodes per variant (default: 20)")
+    args = parser.parse_args()
+
+    variants = _variants()
+    print(f"Backends: {', '.join(variants)}")
+    for n in args.markets:
+        body = _payload(n)
+        expected = variants["json"](body)
+        print(f"\n{n} markets ({len(body) / 1e6:.2f} MB)")
+        baseline = None
+        for name, fn in variants.items():
+            assert fn(body) == expected, f"{name} decoded different markets"
+            p50 = statistics.median(_time(fn, body, args.repeat)) * 1e3
+            baseline = baseline or p50
+            print(f"  {name:<14} p50 {p50:8.2f} ms   {len(body) / p50 / 1e3:7.1f} MB/s   {baseline / p50:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
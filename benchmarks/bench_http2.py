@@ -0,0 +1,289 @@
+"""
+HTTP/1.1 vs HTTP/2 Throughput Benchmark
+
+Runs a concurrent scan (get_market_context for many markets) against two
+local stand-in servers, one speaking HTTP/1.1 and one speaking HTTP/2 (h2c,
+cleartext). It compares:
+
+- sync http/1.1:   SimmerClient with the default requests session, N threads
+- sync http/2:     SimmerClient(http2=True), N threads
+- async http/1.1:  AsyncSimmerClient, N concurrent tasks
+- async http/2:    AsyncSimmerClient(http2=True), N concurrent tasks
+
+Every run uses a fresh client, so connection setup is included. The servers
+run in a child process and add --latency ms to every response and --connect-delay ms to every new
+connection. On localhost, TCP setup is nearly free, so raise --connect-delay
+(e.g. 30-100) to mimic a TLS handshake over the internet. The server counts
+the connections each variant opens.
+
+Nothing is sent anywhere; both servers listen on 127.0.0.1.
+
+Usage:
+    pip install simmer-sdk[async,http2]
+    python benchmarks/bench_http2.py [--requests 500] [--concurrency 16 64] [--latency 20] [--connect-delay 0]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from simmer_sdk import AsyncSimmerClient, SimmerClient  # noqa: E402
+
+# Shaped like a /api/sdk/context response
+BODY = json.dumps({
+    "market": {
+        "id": "0" * 32,
+        "question": "Will the benchmark finish before the deadline?",
+        "current_probability": 0.42,
+        "resolution_criteria": "Resolves YES if it does. " * 10,
+    },
+    "position": {"shares_yes": 10.0, "shares_no": 0.0, "current_value": 4.2},
+    "discipline": {"is_flip_flop": False, "recent_trades": [{"side": "yes", "amount": 1.0}] * 10},
+    "slippage": {"estimates": [{"amount": a, "slippage_pct": a / 1000} for a in (10, 50, 100, 500)]},
+    "warnings": ["Market resolves in 2 hours"],
+}).encode()
+
+
+class _ServerStats:
+    """Server settings, plus a connection counter shared with the benchmark process."""
+
+    def __init__(self, latency: float, connect_delay: float):
+        self.latency = latency
+        self.connect_delay = connect_delay
+        self._connections = multiprocessing.Value("i", 0)
+
+    @property
+    def connections(self) -> int:
+        return self._connections.value
+
+    def connected(self) -> None:
+        with self._connections.get_lock():
+            self._connections.value += 1
+
+
+# =============================================================================
+# HTTP/1.1 stand-in
+# =============================================================================
+
+def _start_http1(stats: _ServerStats) -> str:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            # Headers and body are separate writes; without this, delayed ACKs add ~40 ms
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            stats.connected()
+            time.sleep(stats.connect_delay)
+
+        def do_GET(self):
+            time.sleep(stats.latency)
+            self.send_response(200 if self.path.startswith("/api/") else 404)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(BODY)
+
+        do_HEAD = do_GET  # warmup() / keep-alive pings
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 1024
+
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+# =============================================================================
+# HTTP/2 (h2c) stand-in
+# =============================================================================
+
+def _start_http2(stats: _ServerStats) -> str:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.exceptions
+
+    class Protocol(asyncio.Protocol):
+        def __init__(self):
+            self.conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+            self.transport = None
+            self.ready = stats.connect_delay == 0
+            self.pending = []
+            self.window_waiters = {}
+            self.requests = {}  # stream_id -> (method, path)
+
+        def connection_made(self, transport):
+            stats.connected()
+            self.transport = transport
+            self.conn.initiate_connection()
+            transport.write(self.conn.data_to_send())
+            if not self.ready:
+                asyncio.get_running_loop().call_later(stats.connect_delay, self._open)
+
+        def connection_lost(self, exc):
+            for waiter in self.window_waiters.values():
+                waiter.set()
+
+        def _open(self):
+            self.ready = True
+            for data in self.pending:
+                self._receive(data)
+            self.pending.clear()
+
+        def data_received(self, data):
+            if self.ready:
+                self._receive(data)
+            else:
+                self.pending.append(data)
+
+        def _receive(self, data):
+            try:
+                events = self.conn.receive_data(data)
+            except h2.exceptions.ProtocolError:
+                self.transport.write(self.conn.data_to_send())
+                self.transport.close()
+                return
+            for event in events:
+                if isinstance(event, h2.events.RequestReceived):
+                    headers = dict(event.headers)
+                    self.requests[event.stream_id] = (headers[b":method"], headers[b":path"])
+                elif isinstance(event, h2.events.StreamEnded):
+                    asyncio.ensure_future(self._respond(event.stream_id))
+                elif isinstance(event, h2.events.WindowUpdated):
+                    for stream_id in list(self.window_waiters):
+                        if event.stream_id in (0, stream_id):
+                            self.window_waiters.pop(stream_id).set()
+            self.transport.write(self.conn.data_to_send())
+
+        async def _respond(self, stream_id):
+            await asyncio.sleep(stats.latency)
+            method, path = self.requests.pop(stream_id)
+            head = method == b"HEAD"
+            try:
+                self.conn.send_headers(stream_id, [
+                    (":status", "200" if path.startswith(b"/api/") else "404"),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(BODY))),
+                ], end_stream=head)
+                body = b"" if head else BODY
+                while body:
+                    size = min(self.conn.local_flow_control_window(stream_id), self.conn.max_outbound_frame_size)
+                    if size <= 0:
+                        waiter = self.window_waiters[stream_id] = asyncio.Event()
+                        self.transport.write(self.conn.data_to_send())
+                        await waiter.wait()
+                        if self.transport.is_closing():
+                            return
+                        continue
+                    chunk, body = body[:size], body[size:]
+                    self.conn.send_data(stream_id, chunk, end_stream=not body)
+                self.transport.write(self.conn.data_to_send())
+            except h2.exceptions.H2Error:
+                pass  # stream reset or connection gone
+
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(loop.create_server(Protocol, "127.0.0.1", 0, backlog=1024))
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+
+def _serve(stats1: _ServerStats, stats2: _ServerStats, urls: "multiprocessing.Queue") -> None:
+    urls.put((_start_http1(stats1), _start_http2(stats2)))
+    threading.Event().wait()
+
+
+# =============================================================================
+# Workloads
+# =============================================================================
+
+def _client_kwargs(base_url: str, http2: bool) -> dict:
+    return dict(api_key="sk_test_bench", base_url=base_url, cache=False, instrumentation=False, http2=http2)
+
+
+def _run_sync(base_url: str, http2: bool, requests: int, concurrency: int) -> list:
+    client = SimmerClient(**_client_kwargs(base_url, http2))
+
+    def fetch(i: int) -> float:
+        start = time.perf_counter()
+        client.get_market_context(f"market-{i}")
+        return time.perf_counter() - start
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return list(pool.map(fetch, range(requests)))
+    finally:
+        client.close()
+
+
+def _run_async(base_url: str, http2: bool, requests: int, concurrency: int) -> list:
+    async def main() -> list:
+        semaphore = asyncio.Semaphore(concurrency)
+        async with AsyncSimmerClient(**_client_kwargs(base_url, http2)) as client:
+            async def fetch(i: int) -> float:
+                async with semaphore:
+                    start = time.perf_counter()
+                    await client.get_market_context(f"market-{i}")
+                    return time.perf_counter() - start
+
+            return await asyncio.gather(*(fetch(i) for i in range(requests)))
+
+    return asyncio.run(main())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500, help="requests per run (default: 500)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[16, 64],
+                        help="threads / tasks in flight (default: 16 64)")
+    parser.add_argument("--latency", type=float, default=20.0, help="server time per response, ms (default: 20)")
+    parser.add_argument("--connect-delay", type=float, default=0.0,
+                        help="server delay per new connection, ms; mimics TLS setup (default: 0)")
+    args = parser.parse_args()
+
+    stats1 = _ServerStats(args.latency / 1e3, args.connect_delay / 1e3)
+    stats2 = _ServerStats(args.latency / 1e3, args.connect_delay / 1e3)
+    # Servers get their own process, so they do not compete with the clients for the GIL
+    urls = multiprocessing.Queue()
+    multiprocessing.Process(target=_serve, args=(stats1, stats2, urls), daemon=True).start()
+    http1_url, http2_url = urls.get(timeout=30)
+    variants = [
+        ("sync http/1.1", _run_sync, http1_url, False, stats1),
+        ("sync http/2", _run_sync, http2_url, True, stats2),
+        ("async http/1.1", _run_async, http1_url, False, stats1),
+        ("async http/2", _run_async, http2_url, True, stats2),
+    ]
+
+    print(f"{args.requests} requests per run, {len(BODY)} byte responses, "
+          f"latency {args.latency:g} ms, connect delay {args.connect_delay:g} ms")
+    for concurrency in args.concurrency:
+        print(f"\nconcurrency {concurrency}")
+        for name, run, url, http2, stats in variants:
+            before = stats.connections
+            start = time.perf_counter()
+            samples = sorted(run(url, http2, args.requests, concurrency))
+            elapsed = time.perf_counter() - start
+            p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+            print(f"  {name:<15} {args.requests / elapsed:8.0f} req/s   "
+                  f"p50 {statistics.median(samples) * 1e3:6.1f} ms   p99 {p99 * 1e3:6.1f} ms   "
+                  f"{stats.connections - before:4d} connections")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Import / Startup Benchmark
+
+Measures cold-start cost the way cron-driven skills pay it: every sample is a
+fresh interpreter. Each scenario's time is the median wall time of the child
+process minus the median for a bare `python -c pass`, so it shows what the
+SDK adds on top of interpreter startup.
+
+Scenarios:
+- import:         import simmer_sdk
+- import-client:  from simmer_sdk import SimmerClient
+- init:           SimmerClient(api_key=...) with no wallet keys
+- init-wallets:   same, with WALLET_PRIVATE_KEY and SOLANA_PRIVATE_KEY set
+                  (addresses are derived on first use, not here)
+- wallet-address: init-wallets plus reading both wallet addresses, which
+                  imports eth_account and solders
+
+Nothing is sent anywhere; the client is never used for a request.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 15] [--importtime 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Throwaway keys. The Solana one is only a placeholder: deriving its address
+# fails (logged, address None) but still imports solders/base58.
+EVM_KEY = "0x" + "11" * 32
+SOLANA_KEY = "bench-placeholder"
+
+_INIT = "from simmer_sdk import SimmerClient; c = SimmerClient(api_key='sk_test_bench')"
+
+SCENARIOS = {
+    "import": ("import simmer_sdk", False),
+    "import-client": ("from simmer_sdk import SimmerClient", False),
+    "init": (_INIT, False),
+    "init-wallets": (_INIT, True),
+    "wallet-address": (_INIT + "; c.wallet_address; c.solana_wallet_address", True),
+}
+
+
+def _env(wallets: bool) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    for var in ("WALLET_PRIVATE_KEY", "SIMMER_PRIVATE_KEY", "SOLANA_PRIVATE_KEY"):
+        env.pop(var, None)
+    if wallets:
+        env["WALLET_PRIVATE_KEY"] = EVM_KEY
+        env["SOLANA_PRIVATE_KEY"] = SOLANA_KEY
+    return env
+
+
+def _run(code: str, env: dict) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], env=env, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def _median(code: str, env: dict, runs: int) -> float:
+    _run(code, env)  # warm the OS file cache and .pyc files
+    return statistics.median(_run(code, env) for _ in range(runs))
+
+
+def _importtime(code: str, env: dict, top: int) -> None:
+    """Print the slowest modules (cumulative) from python -X importtime."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], env=env,
+                            capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].strip()))
+    for cumulative, module in sorted(rows, reverse=True)[:top]:
+        print(f"  {cumulative / 1e3:8.1f} ms  {module}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=15, help="processes per scenario (default: 15)")
+    parser.add_argument("--importtime", type=int, default=15, metavar="N",
+                        help="show the N slowest imports for 'init-wallets' (0 to skip, default: 15)")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS),
+                        help="scenarios to run (default: all)")
+    args = parser.parse_args()
+
+    baseline = _median("pass", _env(False), args.runs)
+    print(f"Python {sys.version.split()[0]}, interpreter startup {baseline * 1e3:.1f} ms (subtracted below)\n")
+    for name in args.scenarios:
+        code, wallets = SCENARIOS[name]
+        try:
+            elapsed = _median(code, _env(wallets), args.runs)
+        except subprocess.CalledProcessError:
+            print(f"  {name:<15} failed (missing dependency?)")
+            continue
+        print(f"  {name:<15} {(elapsed - baseline) * 1e3:8.1f} ms")
+
+    if args.importtime:
+        print("\nSlowest imports (init-wallets, cumulative):")
+        _importtime(_INIT, _env(True), args.importtime)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Order Signing Micro-Benchmark
+
+Measures per-order cost of local Polymarket order signing:
+- build_and_sign_order(): one-shot, re-creates Signer/OrderBuilder per order
+- OrderSigner.sign():     reuses Signer/OrderBuilder/contract config
+
+Uses a throwaway random key; nothing is sent anywhere.
+
+Usage:
+    pip install py-order-utils py-clob-client eth-account
+    python benchmarks/bench_signing.py [--orders 500]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from simmer_sdk.signing import OrderSigner, build_and_sign_order, get_wallet_address  # noqa: E402
+
+# Any valid-looking ERC1155 token id works; signing never touches the chain
+TOKEN_ID = "71321045679252212594626385532706912750332728571942532289631379312455583992563"
+
+
+def _time_per_order(fn, orders: int) -> list:
+    samples = []
+    for i in range(orders):
+        price = 0.30 + (i % 40) / 100
+        start = time.perf_counter()
+        fn(price)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _report(label: str, samples: list) -> float:
+    samples_us = sorted(s * 1e6 for s in samples)
+    p50 = statistics.median(samples_us)
+    p99 = samples_us[int(len(samples_us) * 0.99) - 1]
+    print(f"  {label:<24} p50 {p50:9.1f} us   p99 {p99:9.1f} us   mean {statistics.fmean(samples_us):9.1f} us")
+    return p50
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=500, help="orders per variant (default: 500)")
+    parser.add_argument("--neg-risk", action="store_true", help="sign against the Neg Risk CTF exchange")
+    args = parser.parse_args()
+
+    private_key = "0x" + os.urandom(32).hex()
+    wallet = get_wallet_address(private_key)
+    signer = OrderSigner(private_key, wallet)
+
+    def one_shot(price: float) -> None:
+        build_and_sign_order(private_key, wallet, TOKEN_ID, "BUY", price, 10.0, neg_risk=args.neg_risk)
+
+    def reused(price: float) -> None:
+        signer.sign(TOKEN_ID, "BUY", price, 10.0, neg_risk=args.neg_risk)
+
+    # Warm up imports and builder caches so both variants start hot
+    one_shot(0.5)
+    reused(0.5)
+
+    print(f"Signing {args.orders} orders per variant (neg_risk={args.neg_risk})")
+    before = _report("build_and_sign_order", _time_per_order(one_shot, args.orders))
+    after = _report("OrderSigner.sign", _time_per_order(reused, args.orders))
+    print(f"  speedup (p50): {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
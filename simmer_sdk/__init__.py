@@ -15,6 +15,13 @@ Usage:
     # Get positions
     positions = client.get_positions()
 
+Async Usage:
+    from simmer_sdk import AsyncSimmerClient
+
+    async with AsyncSimmerClient(api_key="sk_live_...") as client:
+        markets = await client.get_markets(limit=50)
+        contexts = await asyncio.gather(*(client.get_market_context(m.id) for m in markets))
+
 External Wallet Trading (BYOW):
     The SDK supports trading with your own wallet (Bring Your Own Wallet).
 
@@ -54,32 +61,150 @@ External Wallet Trading (BYOW):
     - Use environment variables or secure secret management
 """
 
-from .client import SimmerClient
-from .approvals import (
-    get_required_approvals,
-    get_approval_transactions,
-    get_missing_approval_transactions,
-    format_approval_guide,
-)
-from .solana_signing import (
-    sign_solana_transaction,
-    has_solana_key,
-    get_solana_public_key,
-    validate_solana_key,
-)
-
-# Single source of truth: read version from package metadata (set in pyproject.toml)
-try:
-    from importlib.metadata import version as _get_version, PackageNotFoundError
-    __version__ = _get_version("simmer-sdk")
-except PackageNotFoundError:
-    # Package not installed (editable/dev install)
-    __version__ = "dev"
-except ImportError:
-    # Python < 3.8 (shouldn't happen, but fallback gracefully)
-    __version__ = "dev"
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import SimmerClient, OrderIntent
+    from .async_client import AsyncSimmerClient
+    from .retry import RetryPolicy, NO_RETRY
+    from .ratelimit import RateLimiter, BucketConfig
+    from .cache import ResponseCache
+    from .metadata import MarketMetadata, MarketMetadataCache
+    from .signing import OrderSigner, PresignedOrderPool
+    from .nonce import NonceManager
+    from .receipts import ReceiptWatcher
+    from .gas import GasFees, GasOracle
+    from .rpc import PolygonRPC
+    from .keepalive import KeepAlive
+    from .http2 import HTTP2Adapter
+    from .search import MarketIndex
+    from .tables import MarketRecord, PositionRecord, TradeRecord, MarketTable, PositionTable
+    from .decoding import JSONDecoder
+    from .instrumentation import Instrumentation, LatencyHistogram, RequestEvent, PhaseEvent
+    from .approvals import (
+        get_required_approvals,
+        get_approval_transactions,
+        get_missing_approval_transactions,
+        format_approval_guide,
+    )
+    from .solana_signing import (
+        sign_solana_transaction,
+        has_solana_key,
+        get_solana_public_key,
+        validate_solana_key,
+        SolanaSigner,
+    )
+
+# Public names are imported on first access (PEP 562), so `import simmer_sdk`
+# stays cheap for cron-driven skills: requests, asyncio, eth_account, solders
+# etc. only load when the module that needs them is used.
+_LAZY_ATTRS = {
+    "SimmerClient": "client",
+    "OrderIntent": "client",
+    "AsyncSimmerClient": "async_client",
+    "RetryPolicy": "retry",
+    "NO_RETRY": "retry",
+    "RateLimiter": "ratelimit",
+    "BucketConfig": "ratelimit",
+    "ResponseCache": "cache",
+    "MarketMetadata": "metadata",
+    "MarketMetadataCache": "metadata",
+    "OrderSigner": "signing",
+    "PresignedOrderPool": "signing",
+    "NonceManager": "nonce",
+    "ReceiptWatcher": "receipts",
+    "GasFees": "gas",
+    "GasOracle": "gas",
+    "PolygonRPC": "rpc",
+    "KeepAlive": "keepalive",
+    "HTTP2Adapter": "http2",
+    "MarketIndex": "search",
+    "MarketRecord": "tables",
+    "PositionRecord": "tables",
+    "TradeRecord": "tables",
+    "MarketTable": "tables",
+    "PositionTable": "tables",
+    "JSONDecoder": "decoding",
+    "Instrumentation": "instrumentation",
+    "LatencyHistogram": "instrumentation",
+    "RequestEvent": "instrumentation",
+    "PhaseEvent": "instrumentation",
+    "get_required_approvals": "approvals",
+    "get_approval_transactions": "approvals",
+    "get_missing_approval_transactions": "approvals",
+    "format_approval_guide": "approvals",
+    "sign_solana_transaction": "solana_signing",
+    "has_solana_key": "solana_signing",
+    "get_solana_public_key": "solana_signing",
+    "validate_solana_key": "solana_signing",
+    "SolanaSigner": "solana_signing",
+}
+
+
+def _read_version() -> str:
+    # Single source of truth: read version from package metadata (set in pyproject.toml)
+    try:
+        from importlib.metadata import version as _get_version, PackageNotFoundError
+    except ImportError:
+        # Python < 3.8 (shouldn't happen, but fallback gracefully)
+        return "dev"
+    try:
+        return _get_version("simmer-sdk")
+    except PackageNotFoundError:
+        # Package not installed (editable/dev install)
+        return "dev"
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        from importlib import import_module
+
+        value = getattr(import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+    elif name == "__version__":
+        # importlib.metadata is slow to import; only pay for it when asked
+        value = _read_version()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | {"__version__"})
+
+
 __all__ = [
     "SimmerClient",
+    "OrderIntent",
+    "AsyncSimmerClient",
+    "RetryPolicy",
+    "NO_RETRY",
+    "RateLimiter",
+    "BucketConfig",
+    "ResponseCache",
+    "KeepAlive",
+    "HTTP2Adapter",
+    "MarketMetadata",
+    "MarketMetadataCache",
+    "MarketIndex",
+    "MarketRecord",
+    "PositionRecord",
+    "TradeRecord",
+    "MarketTable",
+    "PositionTable",
+    "JSONDecoder",
+    "Instrumentation",
+    "LatencyHistogram",
+    "RequestEvent",
+    "PhaseEvent",
+    # Polymarket local signing
+    "OrderSigner",
+    "PresignedOrderPool",
+    "NonceManager",
+    "ReceiptWatcher",
+    "GasFees",
+    "GasOracle",
+    "PolygonRPC",
     # Polymarket approvals
     "get_required_approvals",
     "get_approval_transactions",
@@ -90,4 +215,5 @@ __all__ = [
     "has_solana_key",
     "get_solana_public_key",
     "validate_solana_key",
+    "SolanaSigner",
 ]
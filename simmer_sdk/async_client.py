@@ -0,0 +1,1119 @@
+"""
+Simmer SDK Async Client
+
+asyncio client for Simmer prediction markets. Mirrors SimmerClient's public
+surface but runs every request on a pooled async HTTP transport (httpx), so
+hundreds of requests can be in flight from a single event loop.
+
+Usage:
+    import asyncio
+    from simmer_sdk import AsyncSimmerClient
+
+    async def main():
+        async with AsyncSimmerClient(api_key="sk_live_...") as client:
+            markets = await client.get_markets(limit=50)
+            contexts = await asyncio.gather(
+                *(client.get_market_context(m.id) for m in markets)
+            )
+
+    asyncio.run(main())
+
+Requires: httpx (pip install simmer-sdk[async])
+"""
+
+import asyncio
+import time
+import logging
+from typing import Callable, Optional, List, Dict, Any, AsyncIterator, Tuple, Union
+
+from .client import (
+    SimmerClient,
+    OrderIntent,
+    Market,
+    Position,
+    TradeResult,
+    _parse_market,
+    _next_page_params,
+    _parse_trade_result,
+    _parse_kalshi_trade_result,
+    _market_side_price,
+)
+from .retry import RetryPolicy, IDEMPOTENCY_HEADER, parse_retry_after
+from .ratelimit import RateLimiter, MemoryBackend
+from .cache import ResponseCache, cache_category, cache_key
+from .decoding import JSONDecoder
+from .metadata import is_stale_metadata_error, DEFAULT_MAX_AGE as METADATA_MAX_AGE
+from .search import tokenize
+from .instrumentation import Instrumentation
+from . import tracing
+
+logger = logging.getLogger(__name__)
+
+
+@tracing.trace_public_methods
+class AsyncSimmerClient:
+    """
+    asyncio client for interacting with Simmer SDK API.
+
+    Returns the same Market / Position / TradeResult dataclasses as
+    SimmerClient, so strategy code ports over by adding ``await``.
+
+    Wallet configuration (private_key, WALLET_PRIVATE_KEY, SOLANA_PRIVATE_KEY)
+    is handled exactly as in SimmerClient. Order and transaction signing is
+    local CPU work and runs inline; one-time wallet setup (auto-link, CLOB
+    credential registration, approval warning) reuses the sync implementation
+    in a worker thread.
+
+    Example:
+        async with AsyncSimmerClient(api_key="sk_live_...") as client:
+            markets = await client.get_markets(limit=10)
+            result = await client.trade(markets[0].id, "yes", 10.0)
+    """
+
+    VENUES = SimmerClient.VENUES
+    ORDER_TYPES = SimmerClient.ORDER_TYPES
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.simmer.markets",
+        venue: str = "simmer",
+        private_key: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Union[RateLimiter, bool, None] = None,
+        cache: Union[ResponseCache, bool] = True,
+        market_metadata_path: Optional[str] = None,
+        market_metadata_max_age: Optional[float] = METADATA_MAX_AGE,
+        nonce_state_path: Optional[str] = None,
+        market_index_path: Optional[str] = None,
+        json_decoder: Union[JSONDecoder, str] = "auto",
+        instrumentation: Union[Instrumentation, bool] = True,
+        http2: bool = False,
+    ):
+        """
+        Initialize the async Simmer client.
+
+        Args:
+            api_key: Your SDK API key (sk_live_...)
+            base_url: API base URL (default: production)
+            venue: Trading venue (default: "simmer"). See SimmerClient.
+            private_key: Optional EVM wallet private key for Polymarket trading.
+                Falls back to WALLET_PRIVATE_KEY env var, as in SimmerClient.
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive_connections: Idle connections kept open for reuse
+            retry_policy: Retry, backoff and timeout settings (see SimmerClient)
+            rate_limiter: Client-side rate limiting (see SimmerClient). Waits
+                for a token with asyncio.sleep; a cross-process limiter takes
+                its file lock in the default executor, so neither blocks the
+                event loop.
+            cache: Response cache for repeated reads (see SimmerClient)
+            market_metadata_path: Persist signing metadata (see SimmerClient)
+            market_metadata_max_age: Seconds before signing metadata is refetched (see SimmerClient)
+            nonce_state_path: Persist in-flight nonces (see SimmerClient)
+            market_index_path: Persist the find_markets() search index (see SimmerClient)
+            json_decoder: JSON backend for response bodies (see SimmerClient)
+            instrumentation: Request and trade-phase timings (see SimmerClient)
+            http2: Multiplex requests over HTTP/2 instead of opening one
+                connection per in-flight request (see simmer_sdk.http2).
+                Requires pip install simmer-sdk[http2].
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "AsyncSimmerClient requires httpx. "
+                "Install with: pip install simmer-sdk[async]"
+            ) from e
+
+        # Sync client holds wallet state and the network-free helpers
+        self._sync = SimmerClient(
+            api_key=api_key, base_url=base_url, venue=venue, private_key=private_key,
+            retry_policy=retry_policy, rate_limiter=rate_limiter, cache=cache,
+            market_metadata_path=market_metadata_path, market_metadata_max_age=market_metadata_max_age,
+            nonce_state_path=nonce_state_path,
+            market_index_path=market_index_path, json_decoder=json_decoder,
+            instrumentation=instrumentation,
+        )
+        self.api_key = api_key
+        self.base_url = self._sync.base_url
+        self.venue = self._sync.venue
+        self.retry_policy = self._sync.retry_policy
+        self.rate_limiter = self._sync.rate_limiter
+        self.cache = self._sync.cache
+        self.market_metadata = self._sync.market_metadata
+        self.market_index = self._sync.market_index
+        self.json_decoder = self._sync.json_decoder
+        self.instrumentation = self._sync.instrumentation
+        self._wallet_setup_done = False
+
+        prior_knowledge = False
+        if http2:
+            from .http2 import require_http2, uses_prior_knowledge
+            require_http2()
+            prior_knowledge = uses_prior_knowledge(self.base_url)
+
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            http1=not prior_knowledge,
+            http2=http2,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+
+    async def __aenter__(self) -> "AsyncSimmerClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._http.aclose()
+        self._sync.close()
+
+    async def warmup(self, connections: int = 1) -> int:
+        """
+        Open keep-alive connections to the API ahead of time.
+
+        Same as SimmerClient.warmup(): DNS, TCP and TLS setup happen now
+        instead of on the first real request. The HEAD requests run
+        concurrently, so each one opens its own pooled connection.
+
+        Args:
+            connections: Connections to open
+
+        Returns:
+            Number of connections that got a response
+        """
+        import httpx
+
+        timeout = httpx.Timeout(self.retry_policy.read_timeout, connect=self.retry_policy.connect_timeout)
+
+        async def ping() -> bool:
+            try:
+                await self._http.head(SimmerClient.PING_PATH, timeout=timeout)
+                return True
+            except httpx.HTTPError as e:
+                logger.debug("Connection ping failed: %s", e)
+                return False
+
+        return sum(await asyncio.gather(*(ping() for _ in range(max(1, connections)))))
+
+    @property
+    def wallet_address(self) -> Optional[str]:
+        """Get the EVM wallet address (only available when private_key is set)."""
+        return self._sync.wallet_address
+
+    @property
+    def has_external_wallet(self) -> bool:
+        """Check if client is configured for external EVM wallet trading (Polymarket)."""
+        return self._sync.has_external_wallet
+
+    @property
+    def solana_wallet_address(self) -> Optional[str]:
+        """Get the Solana wallet address (only available when SOLANA_PRIVATE_KEY is set)."""
+        return self._sync.solana_wallet_address
+
+    @property
+    def has_solana_wallet(self) -> bool:
+        """Check if client is configured for external Solana wallet trading (Kalshi)."""
+        return self._sync.has_solana_wallet
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotency_key: Optional[str] = None,
+        use_cache: bool = True,
+        decode: Optional[Callable[[bytes], Any]] = None
+    ) -> Any:
+        """Make an authenticated request to the API. See SimmerClient._request."""
+        with tracing.http_span(method, endpoint) as span:
+            category = None
+            if self.cache is not None and use_cache and method == "GET":
+                category = cache_category(endpoint)
+                if category:
+                    key = cache_key(endpoint, params)
+                    if decode is not None:
+                        key += (decode,)
+                    hit, cached = self.cache.get(key, category)
+                    if hit:
+                        span.set_attribute("simmer.cache_hit", True)
+                        return cached
+
+            data = await self._send_request(method, endpoint, params, json, retry_policy, idempotency_key, decode)
+            if category:
+                self.cache.set(key, category, data)
+            return data
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict],
+        json: Optional[Dict],
+        retry_policy: Optional[RetryPolicy],
+        idempotency_key: Optional[str],
+        decode: Optional[Callable[[bytes], Any]] = None
+    ) -> Any:
+        """Send a request over the wire, applying rate limiting and retries."""
+        import httpx
+
+        policy = retry_policy or self.retry_policy
+        headers = {IDEMPOTENCY_HEADER: idempotency_key} if idempotency_key else None
+        can_retry = policy.is_retryable_request(method, endpoint, idempotency_key)
+        timeout = httpx.Timeout(
+            policy.read_timeout, connect=policy.connect_timeout
+        )
+
+        instrumentation = self.instrumentation
+        started = time.perf_counter()
+        status: Optional[int] = None
+        error: Optional[str] = None
+        size: Optional[int] = None
+        attempt = 0
+        try:
+            while True:
+                if self.rate_limiter is not None:
+                    if isinstance(self.rate_limiter.backend, MemoryBackend):
+                        wait = self.rate_limiter.reserve(method, endpoint)
+                    else:
+                        # FileLockBackend blocks on flock while another process holds the lock
+                        wait = await self._run_sync(self.rate_limiter.reserve, method, endpoint)
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                status = None
+                try:
+                    response = await self._http.request(
+                        method,
+                        endpoint,
+                        params=params,
+                        json=json,
+                        headers=headers,
+                        timeout=timeout,
+                    )
+                    status = response.status_code
+                except (httpx.TransportError, httpx.TimeoutException) as e:
+                    delay = policy.backoff(attempt + 1) if can_retry and attempt < policy.max_retries else None
+                    if delay is None:
+                        raise
+                    attempt += 1
+                    logger.debug("%s %s failed (%s), retry %d/%d in %.2fs",
+                                 method, endpoint, type(e).__name__, attempt, policy.max_retries, delay)
+                    await asyncio.sleep(delay)
+                    continue
+
+                if can_retry and attempt < policy.max_retries and policy.should_retry_status(response.status_code):
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    delay = policy.backoff(attempt + 1, retry_after)
+                    if delay is not None:
+                        attempt += 1
+                        logger.debug("%s %s returned HTTP %s, retry %d/%d in %.2fs",
+                                     method, endpoint, response.status_code, attempt, policy.max_retries, delay)
+                        await asyncio.sleep(delay)
+                        continue
+
+                response.raise_for_status()
+                body = response.content
+                size = len(body)
+                return (decode or self.json_decoder.loads)(body)
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            if instrumentation is not None:
+                instrumentation.record_request(
+                    method, endpoint, status, time.perf_counter() - started, attempt + 1, error, started
+                )
+            span = tracing.current_span()
+            if span.is_recording():
+                span.set_attribute("simmer.attempts", attempt + 1)
+                if status is not None:
+                    span.set_attribute("http.response.status_code", status)
+                if size is not None:
+                    span.set_attribute("http.response.body.size", size)
+
+    async def _run_sync(self, fn, *args):
+        """Run a blocking SimmerClient helper in the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, fn, *args)
+
+    # ==========================================
+    # MARKETS
+    # ==========================================
+
+    async def get_markets(
+        self,
+        status: str = "active",
+        import_source: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Market]:
+        """Get available markets. See SimmerClient.get_markets."""
+        params = {"status": status, "limit": limit}
+        if import_source:
+            params["import_source"] = import_source
+
+        return await self._request("GET", "/api/sdk/markets", params=params, decode=self._sync._decode_markets)
+
+    async def iter_markets(
+        self,
+        status: str = "active",
+        import_source: Optional[str] = None,
+        page_size: int = 100,
+        max_markets: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Market]:
+        """
+        Iterate over every market, page by page. See SimmerClient.iter_markets.
+
+        Example:
+            async for market in client.iter_markets(import_source="polymarket"):
+                ...
+        """
+        pages = self._iter_market_pages(status, import_source, page_size, max_markets, prefetch)
+        try:
+            async for page in pages:
+                for raw in page:
+                    yield _parse_market(raw)
+        finally:
+            await pages.aclose()  # Cancels a prefetch still in flight
+
+    async def _iter_market_pages(
+        self,
+        status: str = "active",
+        import_source: Optional[str] = None,
+        page_size: int = 100,
+        max_markets: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Raw /api/sdk/markets pages, prefetching the next as a task."""
+        params: Optional[Dict[str, Any]] = {"status": status, "limit": page_size}
+        if import_source:
+            params["import_source"] = import_source
+
+        async def _fetch(page_params: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+            return page_params, await self._request("GET", "/api/sdk/markets", params=page_params)
+
+        pending: Optional[asyncio.Task] = None
+        yielded = 0
+        seen_first: Optional[str] = None
+        try:
+            while params is not None:
+                if pending is not None:
+                    page_params, data = await pending
+                    pending = None
+                else:
+                    page_params, data = await _fetch(params)
+                page = data.get("markets", [])
+
+                # Stop if the server ignored the offset and served page one again
+                if page and seen_first is not None and page[0].get("id") == seen_first:
+                    break
+                if seen_first is None and page:
+                    seen_first = page[0].get("id")
+
+                params = _next_page_params(page_params, data, page, page_size)
+                if max_markets is not None and yielded + len(page) >= max_markets:
+                    params = None
+                if params is not None and prefetch:
+                    pending = asyncio.ensure_future(_fetch(params))
+
+                if max_markets is not None:
+                    page = page[:max_markets - yielded]
+                yielded += len(page)
+                if page:
+                    yield page
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def get_market_by_id(self, market_id: str) -> Optional[Market]:
+        """Get a specific market by ID, or None if not found."""
+        try:
+            data = await self._request("GET", f"/api/sdk/markets/{market_id}")
+            m = data.get("market")
+            if not m:
+                return None
+            return _parse_market(m)
+        except Exception:
+            return None
+
+    async def find_markets(self, query: str, limit: Optional[int] = None, refresh: Optional[bool] = None) -> List[Market]:
+        """Search active markets by question text. See SimmerClient.find_markets."""
+        if refresh is None and (self.market_index.stale or not tokenize(query)):
+            return SimmerClient._match_markets(await self.get_markets(limit=100), query, limit)
+        if refresh:
+            await self.refresh_market_index()
+        return [_parse_market(m) for m in self.market_index.search(query, limit=limit, status="active")]
+
+    async def refresh_market_index(self, status: str = "active", import_source: Optional[str] = None) -> int:
+        """Rebuild the local market index from the paginated feed. See SimmerClient.refresh_market_index."""
+        seen: List[str] = []
+        async for page in self._iter_market_pages(status=status, import_source=import_source):
+            page = [m if "status" in m else {**m, "status": status} for m in page]
+            self.market_index.add_many(page, save=False)
+            seen.extend(m["id"] for m in page if m.get("id"))
+        self.market_index.prune(seen, status=status, import_source=import_source, save=False)
+        self.market_index.save()
+        return len(seen)
+
+    async def import_market(self, polymarket_url: str) -> Dict[str, Any]:
+        """Import a Polymarket market to Simmer. See SimmerClient.import_market."""
+        return await self._request(
+            "POST",
+            "/api/sdk/markets/import",
+            json={"polymarket_url": polymarket_url}
+        )
+
+    async def import_kalshi_market(self, kalshi_url: str) -> Dict[str, Any]:
+        """Import a Kalshi market to Simmer. See SimmerClient.import_kalshi_market."""
+        return await self._request(
+            "POST",
+            "/api/sdk/markets/import/kalshi",
+            json={"kalshi_url": kalshi_url}
+        )
+
+    async def list_importable_markets(
+        self,
+        min_volume: float = 10000,
+        limit: int = 50,
+        category: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """List active Polymarket markets that can be imported."""
+        params = {
+            "min_volume": min_volume,
+            "limit": limit,
+        }
+        if category:
+            params["category"] = category
+
+        data = await self._request("GET", "/api/sdk/markets/importable", params=params)
+        return data.get("markets", [])
+
+    async def warm_market_metadata(self, market_ids: List[str]) -> int:
+        """Prefetch signing metadata concurrently. See SimmerClient.warm_market_metadata."""
+        missing = [mid for mid in dict.fromkeys(market_ids) if self.market_metadata.get(mid) is None]
+
+        async def _fetch(market_id: str) -> None:
+            try:
+                resp = await self._request("GET", f"/api/sdk/markets/{market_id}")
+                market_data = resp.get("market") if isinstance(resp, dict) else None
+                if market_data:
+                    self._sync._remember_market_metadata(market_id, market_data)
+            except Exception as e:
+                logger.debug("Could not warm metadata for %s: %s", market_id, e)
+
+        await asyncio.gather(*(_fetch(mid) for mid in missing))
+        return sum(1 for mid in market_ids if self.market_metadata.get(mid) is not None)
+
+    async def get_market_context(self, market_id: str) -> Optional[Dict[str, Any]]:
+        """Get market context with trading safeguards. See SimmerClient.get_market_context."""
+        return await self._request("GET", f"/api/sdk/context/{market_id}")
+
+    async def get_price_history(self, market_id: str) -> List[Dict[str, Any]]:
+        """Get price history for trend detection."""
+        data = await self._request("GET", f"/api/sdk/markets/{market_id}/history")
+        return data.get("points", []) if data else []
+
+    # ==========================================
+    # TRADING
+    # ==========================================
+
+    async def trade(
+        self,
+        market_id: str,
+        side: str,
+        amount: float = 0,
+        shares: float = 0,
+        action: str = "buy",
+        venue: Optional[str] = None,
+        order_type: str = "FAK",
+        reasoning: Optional[str] = None,
+        source: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        price: Optional[float] = None,
+        idempotency_key: Optional[str] = None
+    ) -> TradeResult:
+        """Execute a trade on a market. See SimmerClient.trade for arguments."""
+        with self._sync._operation("trade", venue=venue or self.venue):
+            effective_venue, payload = self._sync._prepare_trade_payload(
+                market_id, side, amount, shares, action, venue, order_type, reasoning, source
+            )
+            is_sell = action == "sell"
+            signed_from_cache = False
+
+            # External wallet: ensure linked, check approvals, sign locally
+            if self._sync.has_external_wallet and effective_venue == "polymarket":
+                if not self._wallet_setup_done:
+                    with self._sync._phase("wallet_link"):
+                        await self._run_sync(self._sync._ensure_wallet_linked)
+                    with self._sync._phase("approvals"):
+                        await self._run_sync(self._sync._warn_approvals_once)
+                    self._wallet_setup_done = True
+
+                signed_from_cache = self._sync.market_metadata.get(market_id) is not None
+                payload["signed_order"] = await self._build_signed_order(
+                    market_id, side, amount if not is_sell else 0,
+                    shares if is_sell else 0, action, order_type, price
+                )
+
+            if effective_venue == "kalshi":
+                result = await self._execute_kalshi_byow_trade(
+                    market_id=market_id,
+                    side=side,
+                    amount=amount,
+                    shares=shares,
+                    action=action,
+                    reasoning=reasoning,
+                    source=source
+                )
+                self._sync._record_stage_timings("trade", result.timings)
+            else:
+                async def _submit(key: Optional[str]) -> TradeResult:
+                    with self._sync._phase("submit"):
+                        data = await self._request(
+                            "POST", "/api/sdk/trade", json=payload,
+                            retry_policy=retry_policy, idempotency_key=key
+                        )
+                    return _parse_trade_result(data, market_id, side, effective_venue)
+
+                result = await _submit(idempotency_key)
+                if signed_from_cache and not result.success and is_stale_metadata_error(result.error):
+                    # Tick size or fee changed since the metadata was cached: refetch and resubmit once
+                    logger.info("Order for %s rejected (%s); refetching market metadata", market_id, result.error)
+                    self._sync.market_metadata.discard(market_id)
+                    payload["signed_order"] = await self._build_signed_order(
+                        market_id, side, amount if not is_sell else 0,
+                        shares if is_sell else 0, action, order_type, price
+                    )
+                    # A re-signed order is a different order, so it needs its own key
+                    result = await _submit(f"{idempotency_key}-refetch" if idempotency_key else None)
+
+            if result.success:
+                self._sync._invalidate_after_trade(market_id)
+        return result
+
+    async def _build_signed_order(
+        self,
+        market_id: str,
+        side: str,
+        amount: float,
+        shares: float,
+        action: str,
+        order_type: str,
+        price: Optional[float],
+    ) -> Dict[str, Any]:
+        """Sign a Polymarket order locally. See SimmerClient._build_signed_order."""
+        metadata = self._sync.market_metadata.get(market_id)
+        if metadata is None or price is None:
+            with self._sync._phase("market_fetch"):
+                markets_resp = await self._request("GET", f"/api/sdk/markets/{market_id}")
+            market_data = markets_resp.get("market") if isinstance(markets_resp, dict) else None
+            if not market_data:
+                raise ValueError(f"Market {market_id} not found")
+            metadata = self._sync._remember_market_metadata(market_id, market_data)
+            if price is None:
+                price = _market_side_price(market_data, side)
+        with self._sync._phase("sign"):
+            return self._sync._sign_order(metadata, side, price, amount, shares, action, order_type)
+
+    async def _execute_kalshi_byow_trade(
+        self,
+        market_id: str,
+        side: str,
+        amount: float = 0,
+        shares: float = 0,
+        action: str = "buy",
+        reasoning: Optional[str] = None,
+        source: Optional[str] = None,
+        quote_ttl: Optional[float] = None,
+    ) -> TradeResult:
+        """Kalshi BYOW trade: quote, sign locally with SOLANA_PRIVATE_KEY, submit (with per-stage timings)."""
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
+
+        def _fail(error: str) -> TradeResult:
+            timings["total"] = (time.perf_counter() - started) * 1000
+            return TradeResult(success=False, market_id=market_id, side=side, venue="kalshi",
+                               error=error, timings=timings)
+
+        if not self._sync.has_solana_wallet:
+            return _fail(
+                "SOLANA_PRIVATE_KEY environment variable required for Kalshi trading. "
+                "Set it to your base58-encoded Solana secret key."
+            )
+
+        try:
+            solana_signer = self._sync._get_solana_signer()
+        except (ImportError, ValueError) as e:
+            return _fail(f"Solana signing not available: {e}")
+
+        is_sell = action == "sell"
+        if quote_ttl is None:
+            quote_ttl = self._sync.KALSHI_QUOTE_TTL
+
+        stage = time.perf_counter()
+        quote_deadline = stage + quote_ttl
+        try:
+            quote = await self._request("POST", "/api/sdk/trade/kalshi/quote", json={
+                "market_id": market_id,
+                "side": side,
+                "amount": amount,
+                "shares": shares,
+                "action": action,
+                "wallet_address": self._sync.solana_wallet_address
+            })
+        except Exception as e:
+            return _fail(f"Failed to get quote: {e}")
+        finally:
+            timings["quote"] = (time.perf_counter() - stage) * 1000
+
+        if not quote.get("success"):
+            return _fail(quote.get("error", "Failed to get quote from Simmer"))
+
+        unsigned_tx = quote.get("transaction")
+        if not unsigned_tx:
+            return _fail("Quote missing transaction data")
+
+        stage = time.perf_counter()
+        try:
+            signed_tx = solana_signer.sign(unsigned_tx)
+        except Exception as e:
+            return _fail(f"Local signing failed: {e}")
+        finally:
+            timings["sign"] = (time.perf_counter() - stage) * 1000
+
+        if time.perf_counter() > quote_deadline:
+            return _fail(f"Quote expired before submission (older than {quote_ttl:g}s)")
+
+        stage = time.perf_counter()
+        try:
+            data = await self._request("POST", "/api/sdk/trade/kalshi/submit", json={
+                "market_id": market_id,
+                "side": side,
+                "action": action,
+                "signed_transaction": signed_tx,
+                "quote_id": quote.get("quote_id"),
+                "reasoning": reasoning,
+                "source": source
+            })
+        except Exception as e:
+            return _fail(f"Failed to submit trade: {e}")
+        finally:
+            timings["submit"] = (time.perf_counter() - stage) * 1000
+
+        result = _parse_kalshi_trade_result(data, market_id, side, is_sell)
+        timings["total"] = (time.perf_counter() - started) * 1000
+        result.timings = timings
+        return result
+
+    async def trade_many(
+        self,
+        intents: List[OrderIntent],
+        venue: Optional[str] = None,
+        max_concurrency: int = 8,
+        quote_ttl: Optional[float] = None,
+    ) -> List[TradeResult]:
+        """
+        Execute several trades concurrently. See SimmerClient.trade_many.
+
+        Each trade runs its own pipeline (for Kalshi: quote -> sign ->
+        submit), so signing and submission of one market overlap with
+        quotes still in flight for the others.
+
+        Returns:
+            One TradeResult per intent, in input order
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        effective_venue = venue or self._sync.venue
+
+        async def _one(it: OrderIntent) -> TradeResult:
+            async with semaphore:
+                try:
+                    if effective_venue == "kalshi":
+                        self._sync._prepare_trade_payload(
+                            it.market_id, it.side, it.amount, it.shares, it.action,
+                            venue, it.order_type, it.reasoning, it.source
+                        )
+                        result = await self._execute_kalshi_byow_trade(
+                            market_id=it.market_id, side=it.side, amount=it.amount, shares=it.shares,
+                            action=it.action, reasoning=it.reasoning, source=it.source,
+                            quote_ttl=quote_ttl
+                        )
+                        if result.success:
+                            self._sync._invalidate_after_trade(it.market_id)
+                        return result
+                    return await self.trade(
+                        it.market_id, it.side, amount=it.amount, shares=it.shares, action=it.action,
+                        venue=venue, order_type=it.order_type, reasoning=it.reasoning,
+                        source=it.source, price=it.price
+                    )
+                except Exception as e:
+                    return TradeResult(success=False, market_id=it.market_id, side=it.side, error=str(e))
+
+        if effective_venue == "polymarket" and self._sync.has_external_wallet and not self._wallet_setup_done:
+            await self._run_sync(self._sync._ensure_wallet_linked)
+            await self._run_sync(self._sync._warn_approvals_once)
+            self._wallet_setup_done = True
+        return list(await asyncio.gather(*(_one(it) for it in intents)))
+
+    # ==========================================
+    # POSITIONS & PORTFOLIO
+    # ==========================================
+
+    async def get_positions(self, venue: Optional[str] = None, source: Optional[str] = None) -> List[Position]:
+        """Get all positions for this agent. See SimmerClient.get_positions."""
+        params = {}
+        if venue:
+            params["venue"] = venue
+        if source:
+            params["source"] = source
+
+        return await self._request(
+            "GET", "/api/sdk/positions", params=params if params else None, decode=self._sync._decode_positions
+        )
+
+    async def get_total_pnl(self) -> float:
+        """Get total unrealized P&L across all positions."""
+        data = await self._request("GET", "/api/sdk/positions")
+        return data.get("total_pnl", 0.0)
+
+    async def get_portfolio(self) -> Optional[Dict[str, Any]]:
+        """Get portfolio summary with balance, exposure, and positions by source."""
+        return await self._request("GET", "/api/sdk/portfolio")
+
+    # ==========================================
+    # SETTINGS
+    # ==========================================
+
+    async def get_settings(self) -> Dict[str, Any]:
+        """Get your SDK trading settings."""
+        return await self._request("GET", "/api/sdk/user/settings")
+
+    async def update_settings(self, **kwargs) -> Dict[str, Any]:
+        """Update your SDK trading settings. See SimmerClient.update_settings."""
+        if not kwargs:
+            raise ValueError("No settings provided. Pass keyword arguments to update.")
+        result = await self._request("PATCH", "/api/sdk/user/settings", json=kwargs)
+        if self.cache is not None:
+            self.cache.invalidate_categories("settings")
+        return result
+
+    # ==========================================
+    # RISK MONITORS (Stop-Loss / Take-Profit)
+    # ==========================================
+
+    async def set_monitor(
+        self,
+        market_id: str,
+        side: str,
+        stop_loss_pct: Optional[float] = None,
+        take_profit_pct: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Set a stop-loss and/or take-profit monitor on a position."""
+        payload: Dict[str, Any] = {"side": side}
+        if stop_loss_pct is not None:
+            payload["stop_loss_pct"] = stop_loss_pct
+        if take_profit_pct is not None:
+            payload["take_profit_pct"] = take_profit_pct
+        return await self._request("POST", f"/api/sdk/positions/{market_id}/monitor", json=payload)
+
+    async def list_monitors(self) -> List[Dict[str, Any]]:
+        """List all active risk monitors with current position P&L."""
+        resp = await self._request("GET", "/api/sdk/positions/monitors")
+        return resp.get("monitors", []) if isinstance(resp, dict) else resp
+
+    async def delete_monitor(self, market_id: str, side: str) -> Dict[str, Any]:
+        """Remove a risk monitor from a position."""
+        return await self._request("DELETE", f"/api/sdk/positions/{market_id}/monitor", params={"side": side})
+
+    # ==========================================
+    # REDEMPTIONS
+    # ==========================================
+
+    async def redeem(self, market_id: str, side: str) -> Dict[str, Any]:
+        """
+        Redeem a winning Polymarket position for USDC.e.
+
+        See SimmerClient.redeem. The receipt is awaited through the client's
+        shared ReceiptWatcher (wait_async), whose poller runs on its own
+        thread, so other coroutines keep running while the transaction confirms.
+        """
+        result = await self._redeem(market_id, side)
+        if result.get("success"):
+            self._sync._invalidate_after_trade(market_id)
+        return result
+
+    async def _redeem(self, market_id: str, side: str) -> Dict[str, Any]:
+        """Redeem implementation; see redeem()."""
+        result = (await self._redeem_batch([(market_id, side)]))[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def redeem_many(self, positions: List[Tuple[str, str]], timeout: float = 60.0) -> List[Dict[str, Any]]:
+        """Redeem several positions at once. See SimmerClient.redeem_many."""
+        results = []
+        for (market_id, side), result in zip(positions, await self._redeem_batch(positions, timeout)):
+            if isinstance(result, Exception):
+                result = {"success": False, "error": str(result)}
+            result = {"market_id": market_id, "side": side, **result}
+            if result.get("success"):
+                self._sync._invalidate_after_trade(market_id)
+            results.append(result)
+        return results
+
+    async def redeem_all(self, timeout: float = 60.0) -> List[Dict[str, Any]]:
+        """Redeem every redeemable Polymarket position. See SimmerClient.redeem_all."""
+        positions = [
+            (p.market_id, p.redeemable_side)
+            for p in await self.get_positions(venue="polymarket")
+            if p.redeemable and p.redeemable_side
+        ]
+        if not positions:
+            return []
+        return await self.redeem_many(positions, timeout=timeout)
+
+    async def _redeem_batch(
+        self,
+        positions: List[Tuple[str, str]],
+        timeout: float = 60.0,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Prepare, sign, broadcast and confirm redemptions; one result dict or exception per position."""
+        prepared = await asyncio.gather(
+            *(self._request("POST", "/api/sdk/redeem", json={"market_id": m, "side": sd}) for m, sd in positions),
+            return_exceptions=True,
+        )
+
+        results: List[Any] = [None] * len(positions)
+        to_sign: List[int] = []
+        for i, prep in enumerate(prepared):
+            if isinstance(prep, Exception):
+                results[i] = prep
+            elif not prep.get("unsigned_tx"):
+                # Managed wallet — server already signed and submitted
+                results[i] = prep
+            elif not self._sync.has_external_wallet:
+                results[i] = ValueError(
+                    "Redemption requires signing. Set WALLET_PRIVATE_KEY env var or pass private_key to constructor."
+                )
+            else:
+                error = self._sync._validate_redeem_tx(prep["unsigned_tx"])
+                if error:
+                    results[i] = {"success": False, "error": error}
+                else:
+                    to_sign.append(i)
+
+        if not to_sign:
+            return results
+
+        nonces = self._sync._get_nonce_manager()
+        backend_nonces = [n for n in (self._sync._backend_nonce(prepared[i]["unsigned_tx"]) for i in to_sign) if n is not None]
+        chain_nonce = max(backend_nonces) if backend_nonces else None
+        # Gas and nonce reads overlap, so they share one RPC batch
+        fees_future = asyncio.ensure_future(self._run_sync(self._sync.gas_oracle.fees))  # Shared, cached reading
+        try:
+            if chain_nonce is None and nonces.needs_sync:
+                chain_nonce = await self._run_sync(self._sync.rpc.get_transaction_count, self._sync.wallet_address)
+            reserved = nonces.reserve_many(len(to_sign), chain_nonce=chain_nonce)
+        except Exception as e:
+            fees_future.cancel()
+            for i in to_sign:
+                results[i] = e
+            return results
+        try:
+            fees = await fees_future
+        except Exception as e:
+            for n in reversed(reserved):
+                nonces.release(n)
+            for i in to_sign:
+                results[i] = e
+            return results
+
+        signed = self._sync._sign_redemptions(to_sign, prepared, reserved, fees, results)
+
+        # In nonce order; after a failed broadcast later nonces could never be mined (see SimmerClient)
+        pending: Dict[str, Tuple[int, int]] = {}  # tx_hash -> (result index, nonce)
+        for k, (i, nonce, signed_tx_hex) in enumerate(signed):
+            try:
+                broadcast = await self._request("POST", "/api/sdk/wallet/broadcast-tx", json={"signed_tx": signed_tx_hex})
+            except Exception as e:
+                broadcast = {"success": False, "error": str(e)}
+            tx_hash = broadcast.get("tx_hash")
+            if broadcast.get("success") and tx_hash:
+                nonces.mark_sent(nonce, tx_hash)
+                pending[tx_hash] = (i, nonce)
+                continue
+            self._sync._abandon_redemptions(signed[k:], broadcast.get("error", "Broadcast failed"), results)
+            break
+
+        # Shared watcher polls all hashes with one batched RPC request per tick
+        watcher = self._sync._get_receipt_watcher()
+        hashes = list(pending)
+        receipts = await asyncio.gather(*(watcher.wait_async(h, timeout) for h in hashes))
+        for tx_hash, receipt_data in zip(hashes, receipts):
+            i, nonce = pending[tx_hash]
+            if receipt_data is None:
+                # Timed out but tx may still confirm
+                results[i] = {"success": True, "tx_hash": tx_hash, "note": "confirmation_timeout"}
+                continue
+            nonces.confirm(nonce)
+            status = receipt_data.get("status", 0)
+            block = receipt_data.get("blockNumber", 0)
+            if status == 1:
+                results[i] = {"success": True, "tx_hash": tx_hash}
+            else:
+                results[i] = {"success": False, "tx_hash": tx_hash, "error": f"Transaction reverted in block {block}"}
+        return results
+
+    # ==========================================
+    # PRICE ALERTS
+    # ==========================================
+
+    async def create_alert(
+        self,
+        market_id: str,
+        side: str,
+        condition: str,
+        threshold: float,
+        webhook_url: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a price alert. See SimmerClient.create_alert."""
+        return await self._request("POST", "/api/sdk/alerts", json={
+            "market_id": market_id,
+            "side": side,
+            "condition": condition,
+            "threshold": threshold,
+            "webhook_url": webhook_url
+        })
+
+    async def get_alerts(self, include_triggered: bool = False) -> List[Dict[str, Any]]:
+        """List alerts."""
+        # httpx serialises bools as "true"/"false"; match requests' "True"/"False"
+        params = {"include_triggered": str(include_triggered)}
+        data = await self._request("GET", "/api/sdk/alerts", params=params)
+        return data.get("alerts", [])
+
+    async def delete_alert(self, alert_id: str) -> Dict[str, Any]:
+        """Delete an alert."""
+        return await self._request("DELETE", f"/api/sdk/alerts/{alert_id}")
+
+    async def get_triggered_alerts(self, hours: int = 24) -> List[Dict[str, Any]]:
+        """Get alerts that triggered within the last N hours."""
+        data = await self._request("GET", "/api/sdk/alerts/triggered", params={"hours": hours})
+        return data.get("alerts", [])
+
+    # ==========================================
+    # WEBHOOKS
+    # ==========================================
+
+    async def register_webhook(
+        self,
+        url: str,
+        events: List[str] = None,
+        secret: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Register a webhook URL to receive event notifications."""
+        if events is None:
+            events = ["trade.executed", "market.resolved", "price.movement"]
+        payload = {"url": url, "events": events}
+        if secret:
+            payload["secret"] = secret
+        return await self._request("POST", "/api/sdk/webhooks", json=payload)
+
+    async def list_webhooks(self) -> List[Dict[str, Any]]:
+        """List all webhook subscriptions."""
+        data = await self._request("GET", "/api/sdk/webhooks")
+        return data.get("webhooks", [])
+
+    async def delete_webhook(self, webhook_id: str) -> Dict[str, Any]:
+        """Delete a webhook subscription."""
+        return await self._request("DELETE", f"/api/sdk/webhooks/{webhook_id}")
+
+    async def test_webhook(self) -> Dict[str, Any]:
+        """Send a test payload to all active webhook subscriptions."""
+        return await self._request("POST", "/api/sdk/webhooks/test")
+
+    # ==========================================
+    # EXTERNAL WALLET SUPPORT
+    # ==========================================
+
+    async def link_wallet(self, signature_type: int = 0) -> Dict[str, Any]:
+        """Link an external wallet to your Simmer account. See SimmerClient.link_wallet."""
+        wallet_address = self._sync.wallet_address
+        if not self._sync.has_external_wallet or not wallet_address:
+            raise ValueError(
+                "private_key required for wallet linking. "
+                "Initialize client with private_key parameter."
+            )
+        if signature_type not in (0, 1, 2):
+            raise ValueError(
+                f"Invalid signature_type {signature_type}. "
+                "Must be 0 (EOA), 1 (Polymarket proxy), or 2 (Gnosis Safe)"
+            )
+
+        from .signing import sign_message
+
+        challenge = await self._request(
+            "GET",
+            "/api/sdk/wallet/link/challenge",
+            params={"address": wallet_address}
+        )
+        nonce = challenge.get("nonce")
+        message = challenge.get("message")
+        if not nonce or not message:
+            raise ValueError("Failed to get challenge from server")
+
+        signature = sign_message(self._sync._private_key, message)
+        result = await self._request("POST", "/api/sdk/wallet/link", json={
+            "address": wallet_address,
+            "signature": signature,
+            "nonce": nonce,
+            "signature_type": signature_type
+        })
+
+        if self.cache is not None:
+            self.cache.invalidate_categories("settings")
+        return result
+
+    async def check_approvals(self, address: Optional[str] = None, no_cache: bool = False) -> Dict[str, Any]:
+        """Check Polymarket token approvals for a wallet."""
+        check_address = address or self._sync.wallet_address
+        if not check_address:
+            raise ValueError(
+                "No wallet address provided. Either pass address parameter "
+                "or initialize client with private_key."
+            )
+        path = f"/api/polymarket/allowances/{check_address}"
+        if no_cache:
+            # In the path, not params: the response cache only honours no_cache=1 in the query string
+            path += "?no_cache=1"
+        return await self._request("GET", path)
+
+    async def ensure_approvals(self) -> Dict[str, Any]:
+        """Check approvals and return transaction data for any missing ones."""
+        if not self._sync.wallet_address:
+            raise ValueError(
+                "No wallet configured. Initialize client with private_key."
+            )
+
+        from .approvals import get_missing_approval_transactions, format_approval_guide
+
+        status = await self.check_approvals()
+        return {
+            "ready": status.get("all_set", False),
+            "missing_transactions": get_missing_approval_transactions(status),
+            "guide": format_approval_guide(status),
+            "raw_status": status,
+        }
@@ -0,0 +1,170 @@
+"""
+Response Cache
+
+In-memory TTL + LRU cache for read endpoints that strategies and trade()
+itself hit repeatedly within one cycle (market lookups, context, settings,
+portfolio, positions, approval status).
+
+Each cacheable endpoint belongs to a category with its own TTL. Entries are
+evicted least-recently-used once the cache reaches max_size. SimmerClient
+invalidates the affected market, position and portfolio entries after a
+successful trade() or redeem(), so reads after a write are never stale.
+
+Usage:
+    client = SimmerClient(api_key="...")                    # cache on, default TTLs
+    client = SimmerClient(api_key="...", cache=False)       # disable
+    client = SimmerClient(api_key="...", cache=ResponseCache(ttls={"context": 2.0}))
+
+    print(client.cache.stats())
+    # {'hits': 12, 'misses': 4, 'evictions': 0, 'size': 4, 'hit_rate': 0.75, ...}
+"""
+
+import copy
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Category TTLs in seconds
+DEFAULT_TTLS: Dict[str, float] = {
+    "market": 5.0,       # GET /api/sdk/markets/{id}
+    "context": 5.0,      # GET /api/sdk/context/{id}
+    "positions": 5.0,    # GET /api/sdk/positions
+    "portfolio": 5.0,    # GET /api/sdk/portfolio
+    "settings": 60.0,    # GET /api/sdk/user/settings, /api/sdk/settings
+    "approvals": 30.0,   # GET /api/polymarket/allowances/{address}
+}
+
+DEFAULT_MAX_SIZE = 512
+
+_CATEGORY_PATTERNS = (
+    ("market", re.compile(r"^/api/sdk/markets/(?!import)(?P<market_id>[^/?]+)$")),
+    ("context", re.compile(r"^/api/sdk/context/(?P<market_id>[^/?]+)$")),
+    ("positions", re.compile(r"^/api/sdk/positions$")),
+    ("portfolio", re.compile(r"^/api/sdk/portfolio$")),
+    ("settings", re.compile(r"^/api/sdk/(user/)?settings$")),
+    ("approvals", re.compile(r"^/api/polymarket/allowances/[^/?]+$")),
+)
+
+
+def cache_category(endpoint: str) -> Optional[str]:
+    """Category of a GET endpoint, or None if it should not be cached."""
+    path, _, query = endpoint.partition("?")
+    if "no_cache=1" in query:
+        return None
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.match(path):
+            return category
+    return None
+
+
+def cache_key(endpoint: str, params: Optional[Dict[str, Any]]) -> Tuple:
+    """Cache key for a GET request."""
+    if not params:
+        return (endpoint,)
+    return (endpoint,) + tuple(sorted((k, str(v)) for k, v in params.items()))
+
+
+class ResponseCache:
+    """Thread-safe TTL cache with LRU eviction and hit/miss counters."""
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Args:
+            ttls: Per-category TTL overrides in seconds (0 disables a category)
+            max_size: Maximum number of cached responses
+        """
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple, Tuple[float, str, Any]]" = OrderedDict()
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._evictions = 0
+
+    def ttl_for(self, category: Optional[str]) -> float:
+        return self.ttls.get(category, 0.0) if category else 0.0
+
+    def get(self, key: Tuple, category: str) -> Tuple[bool, Any]:
+        """
+        Look up a response.
+
+        Returns:
+            (hit, value) — value is a private copy the caller may mutate
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._hits[category] = self._hits.get(category, 0) + 1
+                value = entry[2]
+            else:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses[category] = self._misses.get(category, 0) + 1
+                return False, None
+        return True, copy.deepcopy(value)
+
+    def set(self, key: Tuple, category: str, value: Any) -> None:
+        """Store a response under its category's TTL."""
+        ttl = self.ttl_for(category)
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, category, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, predicate: Callable[[Tuple, str], bool]) -> int:
+        """Drop every entry for which predicate(key, category) is true. Returns count."""
+        with self._lock:
+            doomed = [k for k, (_, cat, _) in self._entries.items() if predicate(k, cat)]
+            for k in doomed:
+                del self._entries[k]
+        return len(doomed)
+
+    def invalidate_categories(self, *categories: str) -> int:
+        """Drop every entry in the given categories."""
+        return self.invalidate(lambda key, cat: cat in categories)
+
+    def invalidate_market(self, market_id: str) -> int:
+        """Drop market and context entries for one market."""
+        paths = (f"/api/sdk/markets/{market_id}", f"/api/sdk/context/{market_id}")
+        return self.invalidate(lambda key, cat: key[0] in paths)
+
+    def invalidate_after_trade(self, market_id: Optional[str] = None) -> int:
+        """Drop everything a trade or redemption can change."""
+        count = self.invalidate_categories("positions", "portfolio")
+        if market_id:
+            count += self.invalidate_market(market_id)
+        return count
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, overall and per category."""
+        with self._lock:
+            hits = sum(self._hits.values())
+            misses = sum(self._misses.values())
+            categories = set(self._hits) | set(self._misses)
+            return {
+                "hits": hits,
+                "misses": misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "by_category": {
+                    cat: {"hits": self._hits.get(cat, 0), "misses": self._misses.get(cat, 0)}
+                    for cat in sorted(categories)
+                },
+            }
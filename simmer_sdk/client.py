@@ -6,21 +6,46 @@ Simple Python client for trading on Simmer prediction markets.
 
 import os
 import time
+import contextlib
 import logging
 import requests
-from typing import Optional, List, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import TYPE_CHECKING, Callable, Optional, List, Dict, Any, Iterator, Set, Tuple, Union
 from dataclasses import dataclass
 
+from .retry import RetryPolicy, IDEMPOTENCY_HEADER, parse_retry_after
+from .ratelimit import RateLimiter
+from .cache import ResponseCache, cache_category, cache_key
+from .metadata import MarketMetadata, MarketMetadataCache, is_stale_metadata_error, DEFAULT_MAX_AGE as METADATA_MAX_AGE
+from .nonce import NonceManager
+from .receipts import ReceiptWatcher
+from .gas import GasFees, GasOracle
+from .rpc import PolygonRPC
+from .search import MarketIndex, tokenize
+from .decoding import JSONDecoder
+from .instrumentation import Instrumentation
+from .keepalive import KeepAlive, DEFAULT_INTERVAL as KEEPALIVE_INTERVAL
+from . import tracing
+
+if TYPE_CHECKING:
+    from .tables import MarketTable, PositionTable
+
 logger = logging.getLogger(__name__)
 
+# Stand-in for an instrumentation phase when instrumentation is disabled
+_NO_PHASE = contextlib.nullcontext()
+
 
 @dataclass
 class Market:
-    """Represents a Simmer market."""
+    """Represents a Simmer market.
+
+    Defaults match what the API parser assumes for a missing field.
+    """
     id: str
     question: str
-    status: str
-    current_probability: float
+    status: str = "active"
+    current_probability: float = 0.5
     import_source: Optional[str] = None
     external_price_yes: Optional[float] = None
     divergence: Optional[float] = None
@@ -34,20 +59,23 @@ class Position:
     
     For simmer venue: sim_balance tracks remaining paper trading balance.
     For polymarket venue: cost_basis tracks real USDC spent.
+    Defaults match what the API parser assumes for a missing field.
     """
     market_id: str
-    question: str
-    shares_yes: float
-    shares_no: float
-    current_value: float
-    pnl: float
-    status: str
+    question: str = ""
+    shares_yes: float = 0
+    shares_no: float = 0
+    current_value: float = 0
+    pnl: float = 0
+    status: str = "active"
     venue: str = "simmer"  # "simmer" or "polymarket"
     sim_balance: Optional[float] = None  # Simmer only: remaining $SIM balance
     cost_basis: Optional[float] = None  # Polymarket only: USDC spent
     avg_cost: Optional[float] = None  # Average cost per share
     current_price: Optional[float] = None  # Current market price
     sources: Optional[List[str]] = None  # Trade sources (e.g., ["sdk:weather"])
+    redeemable: bool = False  # Resolved, winning and ready to redeem
+    redeemable_side: Optional[str] = None  # Side to pass to redeem() ('yes' or 'no')
 
 
 @dataclass
@@ -65,6 +93,7 @@ class TradeResult:
     new_price: float = 0
     balance: Optional[float] = None  # Remaining $SIM balance (simmer only, None for real venues)
     error: Optional[str] = None
+    timings: Optional[Dict[str, float]] = None  # Per-stage milliseconds (Kalshi: quote, sign, submit, total)
 
     @property
     def fully_filled(self) -> bool:
@@ -96,6 +125,162 @@ class RealTradeResult:
     error: Optional[str] = None
 
 
+@dataclass
+class OrderIntent:
+    """One order for trade_many() / sign_orders(). Fields mirror trade() arguments."""
+    market_id: str
+    side: str
+    amount: float = 0
+    shares: float = 0
+    action: str = "buy"
+    order_type: str = "FAK"
+    price: Optional[float] = None  # Limit price; defaults to current market price
+    reasoning: Optional[str] = None
+    source: Optional[str] = None
+
+
+def _parse_market(m: Dict[str, Any]) -> Market:
+    """Build a Market from an API market dict."""
+    return Market(
+        id=m["id"],
+        question=m["question"],
+        status=m.get("status", "active"),
+        current_probability=m.get("current_probability", 0.5),
+        import_source=m.get("import_source"),
+        external_price_yes=m.get("external_price_yes"),
+        divergence=m.get("divergence"),
+        resolves_at=m.get("resolves_at"),
+        is_sdk_only=m.get("is_sdk_only", False),
+    )
+
+
+def _next_page_params(
+    params: Dict[str, Any], data: Dict[str, Any], page: List[Dict[str, Any]], page_size: int,
+) -> Optional[Dict[str, Any]]:
+    """
+    Query params for the page after ``page`` of /api/sdk/markets, or None if it was the last.
+
+    Follows the server's cursor (next_cursor) when it returns one and falls
+    back to offset paging otherwise.
+    """
+    if not page or data.get("has_more") is False:
+        return None
+    next_params = dict(params)
+    cursor = data.get("next_cursor")
+    if cursor:
+        next_params.pop("offset", None)
+        next_params["cursor"] = cursor
+        return next_params
+    if len(page) < page_size:
+        return None
+    next_params.pop("cursor", None)
+    next_params["offset"] = params.get("offset", 0) + len(page)
+    return next_params
+
+
+def _parse_position(p: Dict[str, Any]) -> Position:
+    """Build a Position from an API position dict."""
+    return Position(
+        market_id=p["market_id"],
+        question=p.get("question", ""),
+        shares_yes=p.get("shares_yes", 0),
+        shares_no=p.get("shares_no", 0),
+        current_value=p.get("current_value", 0),
+        pnl=p.get("pnl", 0),
+        status=p.get("status", "active"),
+        venue=p.get("venue", "simmer"),
+        sim_balance=p.get("sim_balance"),  # Only present for simmer
+        cost_basis=p.get("cost_basis"),  # Only present for polymarket
+        avg_cost=p.get("avg_cost"),
+        current_price=p.get("current_price"),
+        sources=p.get("sources"),
+        redeemable=bool(p.get("redeemable", False)),
+        redeemable_side=p.get("redeemable_side"),
+    )
+
+
+def _parse_trade_result(data: Dict[str, Any], market_id: str, side: str, venue: str) -> TradeResult:
+    """Build a TradeResult from a /api/sdk/trade response."""
+    # Extract balance: only meaningful for simmer venue ($SIM balance)
+    # Polymarket/Kalshi trades don't return a balance (use get_portfolio() instead)
+    position = data.get("position") or {}
+    balance = position.get("sim_balance") if venue == "simmer" else None
+
+    return TradeResult(
+        success=data.get("success", False),
+        trade_id=data.get("trade_id"),
+        market_id=data.get("market_id", market_id),
+        side=data.get("side", side),
+        venue=venue,
+        shares_bought=data.get("shares_bought", 0),
+        shares_requested=data.get("shares_requested", 0),
+        order_status=data.get("order_status"),
+        cost=data.get("cost", 0),
+        new_price=data.get("new_price", 0),
+        balance=balance,
+        error=data.get("error")
+    )
+
+
+def _parse_kalshi_trade_result(data: Dict[str, Any], market_id: str, side: str, is_sell: bool) -> TradeResult:
+    """Build a TradeResult from a /api/sdk/trade/kalshi/submit response."""
+    return TradeResult(
+        success=data.get("success", False),
+        trade_id=data.get("trade_id"),
+        market_id=data.get("market_id", market_id),
+        side=data.get("side", side),
+        venue="kalshi",
+        shares_bought=data.get("shares_bought", 0) if not is_sell else 0,
+        shares_requested=data.get("shares_requested", 0),
+        order_status=data.get("order_status"),
+        cost=data.get("cost", 0),
+        new_price=data.get("new_price", 0),
+        balance=None,  # Real trading doesn't track $SIM balance
+        error=data.get("error")
+    )
+
+
+def _market_side_price(market_data: Dict[str, Any], side: str) -> float:
+    """Current external price for one side of a market (YES price, or 1 - YES for NO)."""
+    external_yes = market_data.get("external_price_yes") or 0.5
+    return external_yes if side.lower() == "yes" else 1.0 - external_yes
+
+
+def _order_spec(
+    metadata: "MarketMetadata",
+    side: str,
+    price: float,
+    amount: float,
+    shares: float,
+    action: str,
+    order_type: str,
+) -> Dict[str, Any]:
+    """Keyword arguments for OrderSigner.sign() for one order."""
+    is_sell = action == "sell"
+
+    # Clamp price to valid range to avoid division issues
+    if price <= 0 or price >= 1:
+        price = 0.5  # Fallback to 50%
+
+    # Calculate size based on action
+    if is_sell:
+        size = shares  # Sell uses shares directly
+    else:
+        size = amount / price  # Buy calculates shares from amount
+
+    return {
+        "token_id": metadata.token_id(side),
+        "side": "SELL" if is_sell else "BUY",  # CLOB side
+        "price": price,
+        "size": size,
+        "neg_risk": metadata.neg_risk,
+        "tick_size": metadata.tick_size,
+        "fee_rate_bps": metadata.fee_rate_bps,
+        "order_type": order_type,
+    }
+
+
+@tracing.trace_public_methods
 class SimmerClient:
     """
     Client for interacting with Simmer SDK API.
@@ -122,15 +307,33 @@ class SimmerClient:
     # Primary: WALLET_PRIVATE_KEY. Fallback: SIMMER_PRIVATE_KEY (deprecated, backward compat)
     PRIVATE_KEY_ENV_VAR = "WALLET_PRIVATE_KEY"
     PRIVATE_KEY_ENV_VAR_LEGACY = "SIMMER_PRIVATE_KEY"
+    # Seconds a Kalshi quote is trusted before submission (DFlow quotes are short-lived)
+    KALSHI_QUOTE_TTL = 30.0
+
     # Environment variable for Solana private key (Kalshi via DFlow)
     SOLANA_PRIVATE_KEY_ENV_VAR = "SOLANA_PRIVATE_KEY"
+    # Requested by warmup() and keep-alive pings (HEAD; any status keeps the connection)
+    PING_PATH = "/"
 
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://api.simmer.markets",
         venue: str = "simmer",
-        private_key: Optional[str] = None
+        private_key: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Union[RateLimiter, bool, None] = None,
+        cache: Union[ResponseCache, bool] = True,
+        market_metadata_path: Optional[str] = None,
+        market_metadata_max_age: Optional[float] = METADATA_MAX_AGE,
+        nonce_state_path: Optional[str] = None,
+        market_index_path: Optional[str] = None,
+        json_decoder: Union[JSONDecoder, str] = "auto",
+        instrumentation: Union[Instrumentation, bool] = True,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        keepalive_interval: Optional[float] = None,
+        http2: bool = False
     ):
         """
         Initialize the Simmer client.
@@ -160,6 +363,49 @@ class SimmerClient:
                 - Never commit it to version control
                 - Use environment variables or secure secret management
                 - Ensure your bot runs in a secure environment
+            retry_policy: Retry, backoff and timeout settings for API requests
+                (default: RetryPolicy() — 3 retries, 5s connect / 30s read timeout).
+                Pass RetryPolicy(max_retries=0) to disable retries.
+            rate_limiter: Client-side token-bucket rate limiting (default: off).
+                - True: share one in-process budget with every client using this API key
+                - RateLimiter: use the given limiter, e.g.
+                  RateLimiter.shared(api_key, cross_process=True) to share one
+                  budget with every process on this machine
+            cache: In-memory TTL cache for repeated reads (market lookups,
+                context, settings, portfolio, positions, approval status).
+                Default True uses ResponseCache() defaults; pass False to
+                disable or a ResponseCache to tune TTLs and size. Entries
+                touched by trade() and redeem() are invalidated automatically.
+            market_metadata_path: Optional JSON file that persists the token
+                IDs, tick size, neg-risk flag and fee rate used for local
+                order signing, so they survive restarts.
+            market_metadata_max_age: Seconds before cached signing metadata
+                is refetched (default 15 minutes; None = never). Tick size
+                and fee rate can change while a market is open.
+            nonce_state_path: Optional JSON file that persists nonces of
+                external-wallet transactions broadcast but not yet mined, so a
+                restarted process never reuses one (see NonceManager).
+            market_index_path: Optional JSON file that persists the local
+                market search index used by find_markets(), so it is not
+                rebuilt from the network on every run (see MarketIndex).
+            json_decoder: JSON backend for response bodies: "auto" (orjson
+                or msgspec when installed, else json), a backend name, or a
+                JSONDecoder. With msgspec, market and position lists decode
+                straight into Market / Position objects (see JSONDecoder).
+            instrumentation: Per-request and per-trade-phase timings with
+                latency histograms (see simmer_sdk.instrumentation). Default
+                True creates an Instrumentation(); pass False to disable, or
+                an Instrumentation to share one across clients.
+            pool_connections: Hosts to keep a connection pool for
+            pool_maxsize: Connections kept open per host. Threads sharing
+                the client beyond this still get a connection, but it is
+                closed after the request instead of being reused.
+            keepalive_interval: Seconds of idleness after which a background
+                ping keeps pooled connections open (default: off). See
+                start_keepalive().
+            http2: Send API requests over HTTP/2, so concurrent requests from
+                many threads share one connection (see simmer_sdk.http2).
+                Requires pip install simmer-sdk[http2].
         """
         if venue not in self.VENUES:
             raise ValueError(f"Invalid venue '{venue}'. Must be one of: {self.VENUES}")
@@ -177,12 +423,35 @@ class SimmerClient:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.venue = venue
+        self.retry_policy = retry_policy or RetryPolicy()
+        if rate_limiter is True:
+            rate_limiter = RateLimiter.shared(api_key)
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter or None
+        if cache is True:
+            cache = ResponseCache()
+        self.cache: Optional[ResponseCache] = cache or None
+        self.market_metadata = MarketMetadataCache(market_metadata_path, max_age=market_metadata_max_age)
+        self.market_index = MarketIndex(market_index_path)
+        self.json_decoder = json_decoder if isinstance(json_decoder, JSONDecoder) else JSONDecoder(json_decoder)
+        if instrumentation is True:
+            instrumentation = Instrumentation()
+        self.instrumentation: Optional[Instrumentation] = instrumentation or None
+        self._nonce_state_path = nonce_state_path
+        self._nonce_manager: Optional[NonceManager] = None  # Built on first external-wallet tx
+        self._receipt_watcher: Optional[ReceiptWatcher] = None  # Built on first broadcast
+        self._rpc: Optional[PolygonRPC] = None  # Built on first chain read
+        self._gas_oracle: Optional[GasOracle] = None  # Built on first external-wallet tx
         self._private_key: Optional[str] = None  # EVM private key (Polymarket)
-        self._wallet_address: Optional[str] = None  # EVM wallet address
+        self._evm_address: Optional[str] = None  # Derived from _private_key on first use
+        self._order_signer = None  # Reusable OrderSigner, built on first local signature
+        self._presigned: Dict[str, Any] = {}  # market_id -> PresignedOrderPool
         self._wallet_linked: Optional[bool] = None  # Cached linking status
         self._approvals_checked: bool = False  # Track if we've warned about approvals
         self._solana_key_available: bool = False  # Solana key configured (Kalshi)
-        self._solana_wallet_address: Optional[str] = None  # Solana wallet address
+        self._solana_address: Optional[str] = None  # Derived from SOLANA_PRIVATE_KEY on first use
+        self._solana_address_derived: bool = False
+        self._solana_signer = None  # Reusable SolanaSigner, built on first Kalshi trade
+        self._keepalive: Optional[KeepAlive] = None
 
         # EVM key: Use provided private_key, or auto-detect from environment
         # Check WALLET_PRIVATE_KEY first, fall back to deprecated SIMMER_PRIVATE_KEY
@@ -210,51 +479,74 @@ class SimmerClient:
             self._private_key = effective_key
             # Log that external wallet mode is active (but never log the key!)
             if not private_key and env_key:
-                logger.info(
-                    "External wallet mode (EVM): detected %s env var, wallet %s",
-                    self.PRIVATE_KEY_ENV_VAR,
-                    self._wallet_address[:10] + "..." if self._wallet_address else "unknown"
-                )
+                logger.info("External wallet mode (EVM): detected %s env var", self.PRIVATE_KEY_ENV_VAR)
 
-        # Solana key: Auto-detect from environment for Kalshi trading
+        # Solana key: Auto-detect from environment for Kalshi trading.
+        # The address is derived on first use (imports solders/base58).
         if os.environ.get(self.SOLANA_PRIVATE_KEY_ENV_VAR):
             self._solana_key_available = True
-            # Derive wallet address (deferred until needed to avoid import if not used)
-            try:
-                from .solana_signing import get_solana_public_key
-                self._solana_wallet_address = get_solana_public_key()
-                if self._solana_wallet_address:
-                    logger.info(
-                        "External wallet mode (Solana): detected %s env var, wallet %s",
-                        self.SOLANA_PRIVATE_KEY_ENV_VAR,
-                        self._solana_wallet_address[:10] + "..."
-                    )
-            except Exception as e:
-                logger.warning("Could not derive Solana wallet address: %s", e)
-                self._solana_key_available = False
+            logger.info("External wallet mode (Solana): detected %s env var", self.SOLANA_PRIVATE_KEY_ENV_VAR)
 
         self._session = requests.Session()
         self._session.headers.update({
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         })
+        self._pool_maxsize = pool_maxsize
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        if http2:
+            from .http2 import HTTP2Adapter, uses_prior_knowledge
+            self._session.mount(
+                self.base_url + "/", HTTP2Adapter(prior_knowledge=uses_prior_knowledge(self.base_url))
+            )
+        if keepalive_interval:
+            self.start_keepalive(keepalive_interval)
 
     def _validate_and_set_wallet(self, private_key: str) -> None:
-        """Validate private key format and derive wallet address."""
+        """
+        Validate private key format.
+
+        The wallet address is derived on first use (see _wallet_address), so
+        eth_account is only imported by bots that actually use the wallet. A
+        missing eth_account still fails here rather than mid-trade.
+        """
         if not private_key.startswith("0x"):
             raise ValueError("Private key must start with '0x'")
         if len(private_key) != self.PRIVATE_KEY_LENGTH:
             raise ValueError("Invalid private key length")
-
         try:
-            from .signing import get_wallet_address
-            self._wallet_address = get_wallet_address(private_key)
-        except ImportError as e:
-            # eth_account not installed - raise clear error
+            int(private_key[2:], 16)
+        except ValueError:
+            raise ValueError("Private key must be a hex string") from None
+
+        import importlib.util
+        if importlib.util.find_spec("eth_account") is None:
             raise ImportError(
                 "External wallet requires eth_account package. "
                 "Install with: pip install eth-account"
-            ) from e
+            )
+
+    @property
+    def _wallet_address(self) -> Optional[str]:
+        """EVM address for _private_key, derived on first access."""
+        if self._evm_address is None and self._private_key is not None:
+            from .signing import get_wallet_address
+            self._evm_address = get_wallet_address(self._private_key)
+            logger.info("External wallet (EVM): %s", self._evm_address[:10] + "...")
+        return self._evm_address
+
+    @property
+    def _solana_wallet_address(self) -> Optional[str]:
+        """Solana address for SOLANA_PRIVATE_KEY, derived on first access."""
+        if not self._solana_address_derived and self._solana_key_available:
+            from .solana_signing import get_solana_public_key
+            self._solana_address = get_solana_public_key()  # None (and logs) on failure
+            self._solana_address_derived = True
+            if self._solana_address:
+                logger.info("External wallet (Solana): %s", self._solana_address[:10] + "...")
+        return self._solana_address
 
     @property
     def wallet_address(self) -> Optional[str]:
@@ -408,24 +700,254 @@ class SimmerClient:
         except Exception as e:
             logger.debug("Could not check approvals: %s", e)
 
+    # ==========================================
+    # CONNECTIONS
+    # ==========================================
+
+    def __enter__(self) -> "SimmerClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop keep-alive pings and pre-signing, and close pooled connections."""
+        self.stop_keepalive()
+        self.cancel_presigned()
+        self._session.close()
+
+    def warmup(self, connections: int = 1) -> int:
+        """
+        Open keep-alive connections to the API ahead of time.
+
+        Resolves DNS and completes the TCP and TLS handshakes now, so the
+        first real request (e.g. a trade at the start of a fast-market
+        window) reuses a warm connection. Each connection sends one HEAD
+        request to PING_PATH; they run concurrently so that each gets its own
+        connection. Warmup requests skip retries, rate limiting and
+        instrumentation.
+
+        Args:
+            connections: Connections to open, e.g. the number of threads
+                that will trade at once (capped at pool_maxsize)
+
+        Returns:
+            Number of connections that got a response
+
+        Example:
+            client = SimmerClient(api_key="sk_live_...", keepalive_interval=30)
+            client.warmup(connections=4)
+        """
+        connections = min(connections, self._pool_maxsize)
+        if connections <= 1:
+            return int(self._ping())
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        barrier = threading.Barrier(connections)
+
+        def ping() -> bool:
+            try:
+                barrier.wait(timeout=5)
+            except threading.BrokenBarrierError:
+                pass
+            return self._ping()
+
+        with ThreadPoolExecutor(max_workers=connections, thread_name_prefix="simmer-warmup") as pool:
+            return sum(pool.map(lambda _: ping(), range(connections)))
+
+    def start_keepalive(self, interval: float = KEEPALIVE_INTERVAL) -> KeepAlive:
+        """
+        Keep pooled connections open with background pings.
+
+        A daemon thread sends a HEAD request to PING_PATH whenever no request
+        has gone out for `interval` seconds, so the connection is not closed
+        as idle by the server or a load balancer. Real traffic postpones the
+        pings. Calling it again changes the interval.
+
+        Args:
+            interval: Idle seconds before a ping (keep it below the server's
+                idle timeout, typically 60s)
+
+        Returns:
+            The running KeepAlive (see .pings / .failures)
+        """
+        if self._keepalive is None:
+            self._keepalive = KeepAlive(self._ping, interval)
+        self._keepalive.interval = interval
+        return self._keepalive.start()
+
+    def stop_keepalive(self) -> None:
+        """Stop background keep-alive pings."""
+        if self._keepalive is not None:
+            self._keepalive.stop()
+            self._keepalive = None
+
+    def _ping(self) -> bool:
+        """HEAD PING_PATH over the session; True if the server answered."""
+        try:
+            self._session.head(
+                f"{self.base_url}{self.PING_PATH}",
+                timeout=self.retry_policy.timeout,
+                allow_redirects=False,
+            ).close()
+            return True
+        except requests.exceptions.RequestException as e:
+            logger.debug("Connection ping failed: %s", e)
+            return False
+
     def _request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict] = None,
-        json: Optional[Dict] = None
-    ) -> Dict[str, Any]:
-        """Make an authenticated request to the API."""
+        json: Optional[Dict] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotency_key: Optional[str] = None,
+        use_cache: bool = True,
+        decode: Optional[Callable[[bytes], Any]] = None
+    ) -> Any:
+        """
+        Make an authenticated request to the API.
+
+        Retries transient failures (connection errors, 429, 5xx) according to
+        the retry policy, but only for requests that are safe to repeat. See
+        simmer_sdk.retry for the rules. When a rate limiter is configured,
+        every attempt first waits for a token from its endpoint-class bucket.
+
+        Args:
+            retry_policy: Override the client's retry policy for this call
+            idempotency_key: Sent as Idempotency-Key header; makes POST
+                /api/sdk/trade safe to retry
+            use_cache: Set False to bypass the response cache for this GET
+            decode: Body decoder, e.g. self._decode_markets (default:
+                decode to dicts with the client's JSONDecoder)
+        """
+        with tracing.http_span(method, endpoint) as span:
+            category = None
+            if self.cache is not None and use_cache and method == "GET":
+                category = cache_category(endpoint)
+                if category:
+                    key = cache_key(endpoint, params)
+                    if decode is not None:
+                        key += (decode,)
+                    hit, cached = self.cache.get(key, category)
+                    if hit:
+                        span.set_attribute("simmer.cache_hit", True)
+                        return cached
+
+            data = self._send_request(method, endpoint, params, json, retry_policy, idempotency_key, decode)
+            if category:
+                self.cache.set(key, category, data)
+            return data
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict],
+        json: Optional[Dict],
+        retry_policy: Optional[RetryPolicy],
+        idempotency_key: Optional[str],
+        decode: Optional[Callable[[bytes], Any]] = None
+    ) -> Any:
+        """Send a request over the wire, applying rate limiting and retries."""
+        policy = retry_policy or self.retry_policy
         url = f"{self.base_url}{endpoint}"
-        response = self._session.request(
-            method=method,
-            url=url,
-            params=params,
-            json=json,
-            timeout=30
-        )
-        response.raise_for_status()
-        return response.json()
+        headers = {IDEMPOTENCY_HEADER: idempotency_key} if idempotency_key else None
+        can_retry = policy.is_retryable_request(method, endpoint, idempotency_key)
+
+        instrumentation = self.instrumentation
+        started = time.perf_counter()
+        status: Optional[int] = None
+        error: Optional[str] = None
+        size: Optional[int] = None
+        attempt = 0
+        try:
+            while True:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(method, endpoint)
+                status = None
+                try:
+                    response = self._session.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        json=json,
+                        headers=headers,
+                        timeout=policy.timeout
+                    )
+                    status = response.status_code
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    delay = policy.backoff(attempt + 1) if can_retry and attempt < policy.max_retries else None
+                    if delay is None:
+                        raise
+                    attempt += 1
+                    logger.debug("%s %s failed (%s), retry %d/%d in %.2fs",
+                                 method, endpoint, type(e).__name__, attempt, policy.max_retries, delay)
+                    time.sleep(delay)
+                    continue
+
+                if can_retry and attempt < policy.max_retries and policy.should_retry_status(response.status_code):
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    delay = policy.backoff(attempt + 1, retry_after)
+                    if delay is not None:
+                        attempt += 1
+                        logger.debug("%s %s returned HTTP %s, retry %d/%d in %.2fs",
+                                     method, endpoint, response.status_code, attempt, policy.max_retries, delay)
+                        response.close()
+                        time.sleep(delay)
+                        continue
+
+                response.raise_for_status()
+                body = response.content
+                size = len(body)
+                return (decode or self.json_decoder.loads)(body)
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            if self._keepalive is not None:
+                self._keepalive.touch()
+            if instrumentation is not None:
+                instrumentation.record_request(
+                    method, endpoint, status, time.perf_counter() - started, attempt + 1, error, started
+                )
+            span = tracing.current_span()
+            if span.is_recording():
+                span.set_attribute("simmer.attempts", attempt + 1)
+                if status is not None:
+                    span.set_attribute("http.response.status_code", status)
+                if size is not None:
+                    span.set_attribute("http.response.body.size", size)
+
+    def _decode_markets(self, body: bytes) -> List[Market]:
+        """Decode a /api/sdk/markets body straight into Market objects."""
+        return self.json_decoder.decode_items(body, "markets", Market, _parse_market)
+
+    def _decode_positions(self, body: bytes) -> List[Position]:
+        """Decode a /api/sdk/positions body straight into Position objects."""
+        return self.json_decoder.decode_items(body, "positions", Position, _parse_position)
+
+    def _operation(self, name: str, **attrs: Any):
+        """Instrumentation context for a whole operation (no-op when disabled)."""
+        if self.instrumentation is None:
+            return _NO_PHASE
+        return self.instrumentation.operation(name, **attrs)
+
+    def _phase(self, name: str):
+        """Instrumentation context for one phase of the current operation."""
+        if self.instrumentation is None:
+            return _NO_PHASE
+        return self.instrumentation.phase(name)
+
+    def _record_stage_timings(self, operation: str, timings: Optional[Dict[str, float]]) -> None:
+        """Feed per-stage millisecond timings (e.g. Kalshi quote/sign/submit) to instrumentation."""
+        if self.instrumentation is None or not timings:
+            return
+        for stage, ms in timings.items():
+            if stage != "total":
+                self.instrumentation.record_phase(operation, stage, ms / 1000)
 
     def get_markets(
         self,
@@ -448,22 +970,120 @@ class SimmerClient:
         if import_source:
             params["import_source"] = import_source
 
-        data = self._request("GET", "/api/sdk/markets", params=params)
-
-        return [
-            Market(
-                id=m["id"],
-                question=m["question"],
-                status=m["status"],
-                current_probability=m["current_probability"],
-                import_source=m.get("import_source"),
-                external_price_yes=m.get("external_price_yes"),
-                divergence=m.get("divergence"),
-                resolves_at=m.get("resolves_at"),
-                is_sdk_only=m.get("is_sdk_only", False)
-            )
-            for m in data.get("markets", [])
-        ]
+        return self._request("GET", "/api/sdk/markets", params=params, decode=self._decode_markets)
+
+    def iter_markets(
+        self,
+        status: str = "active",
+        import_source: Optional[str] = None,
+        page_size: int = 100,
+        max_markets: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[Market]:
+        """
+        Iterate over every market, page by page.
+
+        Unlike get_markets(), which returns a single page, this walks the whole
+        catalog. The next page is fetched in the background while the caller
+        works through the current one. Markets are built from the raw page one
+        at a time as they are yielded, so memory use does not grow with
+        the catalog size.
+
+        Args:
+            status: Filter by status ('active', 'resolved')
+            import_source: Filter by source ('polymarket', 'kalshi', or None for all)
+            page_size: Markets per request
+            max_markets: Stop after this many markets (None = all)
+            prefetch: Fetch the next page while the current one is consumed
+
+        Yields:
+            Market objects
+
+        Example:
+            for market in client.iter_markets(import_source="polymarket"):
+                if market.divergence and abs(market.divergence) > 0.1:
+                    print(market.question)
+        """
+        for page in self._iter_market_pages(status, import_source, page_size, max_markets, prefetch):
+            for raw in page:
+                yield _parse_market(raw)
+
+    def get_market_table(
+        self,
+        status: str = "active",
+        import_source: Optional[str] = None,
+        max_markets: Optional[int] = None,
+    ) -> "MarketTable":
+        """
+        Fetch markets into a columnar MarketTable (requires numpy).
+
+        Walks every page like iter_markets() but skips per-market objects.
+        Probabilities, prices and divergence are NumPy columns for vectorized
+        filtering and sorting (see simmer_sdk.tables).
+
+        Example:
+            table = client.get_market_table(import_source="polymarket")
+            for m in table.where(min_abs_divergence=0.1).top(10, "divergence", absolute=True):
+                print(m.question, m.divergence)
+        """
+        from .tables import MarketTable
+
+        pages = self._iter_market_pages(status=status, import_source=import_source, max_markets=max_markets)
+        return MarketTable.from_api(m for page in pages for m in page)
+
+    def _iter_market_pages(
+        self,
+        status: str = "active",
+        import_source: Optional[str] = None,
+        page_size: int = 100,
+        max_markets: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Raw /api/sdk/markets pages, prefetching the next while the caller works on the current one."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        params: Optional[Dict[str, Any]] = {"status": status, "limit": page_size}
+        if import_source:
+            params["import_source"] = import_source
+
+        def _fetch(page_params: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+            return page_params, self._request("GET", "/api/sdk/markets", params=page_params)
+
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="simmer-markets") if prefetch else None
+        pending = None
+        yielded = 0
+        seen_first: Optional[str] = None
+        try:
+            while params is not None:
+                if pending is not None:
+                    page_params, data = pending.result()
+                    pending = None
+                else:
+                    page_params, data = _fetch(params)
+                page = data.get("markets", [])
+
+                # Stop if the server ignored the offset and served page one again
+                if page and seen_first is not None and page[0].get("id") == seen_first:
+                    break
+                if seen_first is None and page:
+                    seen_first = page[0].get("id")
+
+                params = _next_page_params(page_params, data, page, page_size)
+                if max_markets is not None and yielded + len(page) >= max_markets:
+                    params = None
+                if params is not None and pool is not None:
+                    pending = pool.submit(_fetch, params)
+
+                if max_markets is not None:
+                    page = page[:max_markets - yielded]
+                yielded += len(page)
+                if page:
+                    yield page
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if pool is not None:
+                pool.shutdown(wait=False)
 
     def trade(
         self,
@@ -475,7 +1095,10 @@ class SimmerClient:
         venue: Optional[str] = None,
         order_type: str = "FAK",
         reasoning: Optional[str] = None,
-        source: Optional[str] = None
+        source: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        price: Optional[float] = None,
+        idempotency_key: Optional[str] = None
     ) -> TradeResult:
         """
         Execute a trade on a market.
@@ -503,6 +1126,19 @@ class SimmerClient:
                 to see why your bot made this trade.
             source: Optional source tag for tracking (e.g., "sdk:weather", "sdk:copytrading").
                 Used to track which strategy opened each position.
+            retry_policy: Override the client's retry policy for this trade.
+                Only applies when idempotency_key is set; without a key the
+                submission is sent once and never retried.
+            price: Limit price (0-1) for locally signed Polymarket orders.
+                Defaults to the market's current external price. When set
+                and the market's metadata is cached (see
+                warm_market_metadata()), the order is signed without any
+                market lookup. Ignored for other venues.
+            idempotency_key: Caller-chosen key sent as the Idempotency-Key
+                header. Setting it lets the client retry the submission on
+                connection errors, 429 and 5xx responses; reuse the same key
+                only for the same order. The client does not verify that the
+                server de-duplicates on it.
 
         Returns:
             TradeResult with execution details
@@ -539,6 +1175,193 @@ class SimmerClient:
             client = SimmerClient(api_key="sk_live_...", venue="kalshi")
             result = client.trade(market_id, "yes", 10.0)  # Signs locally with Solana key
         """
+        with self._operation("trade", venue=venue or self.venue):
+            effective_venue, payload = self._prepare_trade_payload(
+                market_id, side, amount, shares, action, venue, order_type, reasoning, source
+            )
+            is_sell = action == "sell"
+            signed_from_cache = False
+
+            # External wallet: ensure linked, check approvals, sign locally
+            if self._private_key and effective_venue == "polymarket":
+                # Auto-link wallet if not already linked
+                with self._phase("wallet_link"):
+                    self._ensure_wallet_linked()
+                # Warn about missing approvals (once per session)
+                with self._phase("approvals"):
+                    self._warn_approvals_once()
+                # Sign order locally
+                signed_from_cache = self.market_metadata.get(market_id) is not None
+                signed_order = self._build_signed_order(
+                    market_id, side, amount if not is_sell else 0,
+                    shares if is_sell else 0, action, order_type, price
+                )
+                if signed_order:
+                    payload["signed_order"] = signed_order
+
+            # Kalshi BYOW: sign transactions locally using SOLANA_PRIVATE_KEY
+            if effective_venue == "kalshi":
+                result = self._execute_kalshi_byow_trade(
+                    market_id=market_id,
+                    side=side,
+                    amount=amount,
+                    shares=shares,
+                    action=action,
+                    reasoning=reasoning,
+                    source=source
+                )
+                self._record_stage_timings("trade", result.timings)
+            else:
+                def _submit(key: Optional[str]) -> TradeResult:
+                    with self._phase("submit"):
+                        data = self._request(
+                            "POST",
+                            "/api/sdk/trade",
+                            json=payload,
+                            retry_policy=retry_policy,
+                            idempotency_key=key
+                        )
+                    return _parse_trade_result(data, market_id, side, effective_venue)
+
+                result = _submit(idempotency_key)
+                if signed_from_cache and not result.success and is_stale_metadata_error(result.error):
+                    # Tick size or fee changed since the metadata was cached: refetch and resubmit once
+                    logger.info("Order for %s rejected (%s); refetching market metadata", market_id, result.error)
+                    self.market_metadata.discard(market_id)
+                    payload["signed_order"] = self._build_signed_order(
+                        market_id, side, amount if not is_sell else 0,
+                        shares if is_sell else 0, action, order_type, price
+                    )
+                    # A re-signed order is a different order, so it needs its own key
+                    result = _submit(f"{idempotency_key}-refetch" if idempotency_key else None)
+
+            if result.success:
+                self._invalidate_after_trade(market_id)
+        return result
+
+    def trade_many(
+        self,
+        intents: List[OrderIntent],
+        venue: Optional[str] = None,
+        max_workers: int = 8,
+        processes: int = 0,
+        quote_ttl: Optional[float] = None,
+    ) -> List[TradeResult]:
+        """
+        Execute several trades at once.
+
+        For external-wallet Polymarket trading, all orders are signed up front
+        in one loop with the cached signer (optionally across worker
+        processes), then submitted concurrently. Kalshi trades are pipelined:
+        each market runs quote -> sign -> submit on its own worker, so one
+        market's order is signed and submitted while other quotes are still
+        in flight, and each result carries per-stage ``timings``. Other
+        venues submit the trades concurrently. Failures are reported per
+        order; one bad intent does not abort the batch.
+
+        Args:
+            intents: Orders to place
+            venue: Venue for every order (default: client's venue)
+            max_workers: Concurrent submissions
+            processes: Worker processes for signing (0 = sign in-thread)
+            quote_ttl: Kalshi only; seconds a quote stays valid before
+                submission (default: KALSHI_QUOTE_TTL)
+
+        Returns:
+            One TradeResult per intent, in input order
+
+        Example:
+            from simmer_sdk import OrderIntent
+
+            results = client.trade_many([
+                OrderIntent(market_a, "yes", amount=10.0, price=0.42),
+                OrderIntent(market_b, "no", amount=5.0),
+                OrderIntent(market_c, "yes", shares=12.0, action="sell"),
+            ])
+            for r in results:
+                print(r.market_id, r.success, r.error)
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        results: List[Optional[TradeResult]] = [None] * len(intents)
+        payloads: Dict[int, Dict[str, Any]] = {}
+        effective_venue = venue or self.venue
+        for i, it in enumerate(intents):
+            try:
+                effective_venue, payloads[i] = self._prepare_trade_payload(
+                    it.market_id, it.side, it.amount, it.shares, it.action,
+                    venue, it.order_type, it.reasoning, it.source
+                )
+            except ValueError as e:
+                results[i] = TradeResult(success=False, market_id=it.market_id, side=it.side, error=str(e))
+
+        if effective_venue == "polymarket" and self._private_key and payloads:
+            self._ensure_wallet_linked()
+            self._warn_approvals_once()
+            pending = sorted(payloads)
+            signed = self._sign_intents([intents[i] for i in pending], processes, max_workers)
+            for i, order in zip(pending, signed):
+                if isinstance(order, Exception):
+                    results[i] = TradeResult(
+                        success=False, market_id=intents[i].market_id, side=intents[i].side,
+                        error=f"Local signing failed: {order}"
+                    )
+                    del payloads[i]
+                else:
+                    payloads[i]["signed_order"] = order
+
+        if effective_venue == "kalshi" and self._solana_key_available and payloads:
+            try:
+                self._get_solana_signer()  # Decode the key once, before the workers start
+            except (ImportError, ValueError):
+                pass  # Reported per trade by _execute_kalshi_byow_trade
+
+        def _submit(i: int) -> TradeResult:
+            it = intents[i]
+            try:
+                if effective_venue == "kalshi":
+                    return self._execute_kalshi_byow_trade(
+                        market_id=it.market_id, side=it.side, amount=it.amount, shares=it.shares,
+                        action=it.action, reasoning=it.reasoning, source=it.source,
+                        quote_ttl=quote_ttl
+                    )
+                data = self._request("POST", "/api/sdk/trade", json=payloads[i])
+                return _parse_trade_result(data, it.market_id, it.side, effective_venue)
+            except Exception as e:
+                return TradeResult(success=False, market_id=it.market_id, side=it.side, error=str(e))
+
+        if payloads:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(payloads)))) as pool:
+                for i, result in zip(sorted(payloads), pool.map(_submit, sorted(payloads))):
+                    results[i] = result
+
+        for i, result in enumerate(results):
+            if result is not None and result.success:
+                self._invalidate_after_trade(intents[i].market_id)
+        return results
+
+    def _invalidate_after_trade(self, market_id: Optional[str] = None) -> None:
+        """Drop cached market, position and portfolio reads a write may have changed."""
+        if self.cache is not None:
+            self.cache.invalidate_after_trade(market_id)
+
+    def _prepare_trade_payload(
+        self,
+        market_id: str,
+        side: str,
+        amount: float,
+        shares: float,
+        action: str,
+        venue: Optional[str],
+        order_type: str,
+        reasoning: Optional[str],
+        source: Optional[str],
+    ) -> tuple:
+        """Validate trade arguments and build the /api/sdk/trade payload.
+
+        Returns:
+            (effective_venue, payload)
+        """
         effective_venue = venue or self.venue
         if effective_venue not in self.VENUES:
             raise ValueError(f"Invalid venue '{effective_venue}'. Must be one of: {self.VENUES}")
@@ -554,7 +1377,7 @@ class SimmerClient:
         if not is_sell and amount <= 0:
             raise ValueError("amount required for buy orders")
 
-        payload = {
+        payload: Dict[str, Any] = {
             "market_id": market_id,
             "side": side,
             "amount": amount,
@@ -568,57 +1391,7 @@ class SimmerClient:
         if source:
             payload["source"] = source
 
-        # External wallet: ensure linked, check approvals, sign locally
-        if self._private_key and effective_venue == "polymarket":
-            # Auto-link wallet if not already linked
-            self._ensure_wallet_linked()
-            # Warn about missing approvals (once per session)
-            self._warn_approvals_once()
-            # Sign order locally
-            signed_order = self._build_signed_order(
-                market_id, side, amount if not is_sell else 0,
-                shares if is_sell else 0, action, order_type
-            )
-            if signed_order:
-                payload["signed_order"] = signed_order
-
-        # Kalshi BYOW: sign transactions locally using SOLANA_PRIVATE_KEY
-        if effective_venue == "kalshi":
-            return self._execute_kalshi_byow_trade(
-                market_id=market_id,
-                side=side,
-                amount=amount,
-                shares=shares,
-                action=action,
-                reasoning=reasoning,
-                source=source
-            )
-
-        data = self._request(
-            "POST",
-            "/api/sdk/trade",
-            json=payload
-        )
-
-        # Extract balance: only meaningful for simmer venue ($SIM balance)
-        # Polymarket/Kalshi trades don't return a balance (use get_portfolio() instead)
-        position = data.get("position") or {}
-        balance = position.get("sim_balance") if effective_venue == "simmer" else None
-
-        return TradeResult(
-            success=data.get("success", False),
-            trade_id=data.get("trade_id"),
-            market_id=data.get("market_id", market_id),
-            side=data.get("side", side),
-            venue=effective_venue,
-            shares_bought=data.get("shares_bought", 0),
-            shares_requested=data.get("shares_requested", 0),
-            order_status=data.get("order_status"),
-            cost=data.get("cost", 0),
-            new_price=data.get("new_price", 0),
-            balance=balance,
-            error=data.get("error")
-        )
+        return effective_venue, payload
 
     def prepare_real_trade(
         self,
@@ -711,28 +1484,27 @@ class SimmerClient:
             params["venue"] = venue
         if source:
             params["source"] = source
-            
-        data = self._request("GET", "/api/sdk/positions", params=params if params else None)
 
-        positions = []
-        for p in data.get("positions", []):
-            pos_venue = p.get("venue", "simmer")
-            positions.append(Position(
-                market_id=p["market_id"],
-                question=p.get("question", ""),
-                shares_yes=p.get("shares_yes", 0),
-                shares_no=p.get("shares_no", 0),
-                current_value=p.get("current_value", 0),
-                pnl=p.get("pnl", 0),
-                status=p.get("status", "active"),
-                venue=pos_venue,
-                sim_balance=p.get("sim_balance"),  # Only present for simmer
-                cost_basis=p.get("cost_basis"),  # Only present for polymarket
-                avg_cost=p.get("avg_cost"),
-                current_price=p.get("current_price"),
-                sources=p.get("sources"),
-            ))
-        return positions
+        return self._request(
+            "GET", "/api/sdk/positions", params=params if params else None, decode=self._decode_positions
+        )
+
+    def get_position_table(self, venue: Optional[str] = None, source: Optional[str] = None) -> "PositionTable":
+        """
+        Get positions as a columnar PositionTable (requires numpy).
+
+        Same filters as get_positions(). Shares, value and P&L are NumPy
+        columns (see simmer_sdk.tables).
+        """
+        from .tables import PositionTable
+
+        params = {}
+        if venue:
+            params["venue"] = venue
+        if source:
+            params["source"] = source
+        data = self._request("GET", "/api/sdk/positions", params=params if params else None)
+        return PositionTable.from_api(data.get("positions", []))
 
     def get_total_pnl(self) -> float:
         """Get total unrealized P&L across all positions."""
@@ -754,33 +1526,68 @@ class SimmerClient:
             m = data.get("market")
             if not m:
                 return None
-            return Market(
-                id=m["id"],
-                question=m["question"],
-                status=m.get("status", "active"),
-                current_probability=m.get("current_probability", 0.5),
-                import_source=m.get("import_source"),
-                external_price_yes=m.get("external_price_yes"),
-                divergence=m.get("divergence"),
-                resolves_at=m.get("resolves_at"),
-                is_sdk_only=m.get("is_sdk_only", False),
-            )
+            return _parse_market(m)
         except Exception:
             return None
 
-    def find_markets(self, query: str) -> List[Market]:
+    def find_markets(self, query: str, limit: Optional[int] = None, refresh: Optional[bool] = None) -> List[Market]:
         """
-        Search markets by question text.
+        Search active markets by question text.
+
+        When the local market index (see MarketIndex) is fresh, the search
+        runs against it without a network request: every query term must
+        appear in the question, the last one may be a prefix, and results
+        are ranked by relevance. The index covers the whole catalog once
+        refresh_market_index() (or refresh=True) has built it, and can be
+        persisted with market_index_path. Prices on indexed markets are as
+        of that refresh.
+
+        When the index is empty or older than market_index.max_age (15
+        minutes by default), or the query has no searchable words (e.g. only
+        stopwords), this falls back to one server request for the first 100
+        active markets and a substring match, rather than crawling the
+        whole catalog.
 
         Args:
-            query: Search string
+            query: Search string, e.g. "bitcoin 100k"
+            limit: Maximum number of results (None = all matches)
+            refresh: True to rebuild the index first, False to search the
+                index as it is (default: use the index only while fresh)
 
         Returns:
-            List of matching markets
+            List of matching markets, best match first
         """
-        markets = self.get_markets(limit=100)
+        if refresh is None and (self.market_index.stale or not tokenize(query)):
+            return self._match_markets(self.get_markets(limit=100), query, limit)
+        if refresh:
+            self.refresh_market_index()
+        return [_parse_market(m) for m in self.market_index.search(query, limit=limit, status="active")]
+
+    @staticmethod
+    def _match_markets(markets: List[Market], query: str, limit: Optional[int]) -> List[Market]:
+        """Markets whose question contains query (case-insensitive), in server order."""
         query_lower = query.lower()
-        return [m for m in markets if query_lower in m.question.lower()]
+        matches = [m for m in markets if query_lower in m.question.lower()]
+        return matches if limit is None else matches[:limit]
+
+    def refresh_market_index(self, status: str = "active", import_source: Optional[str] = None) -> int:
+        """
+        Rebuild the local market index from the paginated market feed.
+
+        Markets are indexed page by page as they arrive; markets with this
+        status (and source, if given) that are no longer listed are dropped.
+
+        Returns:
+            Number of markets indexed
+        """
+        seen: List[str] = []
+        for page in self._iter_market_pages(status=status, import_source=import_source):
+            page = [m if "status" in m else {**m, "status": status} for m in page]
+            self.market_index.add_many(page, save=False)
+            seen.extend(m["id"] for m in page if m.get("id"))
+        self.market_index.prune(seen, status=status, import_source=import_source, save=False)
+        self.market_index.save()
+        return len(seen)
 
     def import_market(self, polymarket_url: str, sandbox: bool = None) -> Dict[str, Any]:
         """
@@ -1038,7 +1845,10 @@ class SimmerClient:
         """
         if not kwargs:
             raise ValueError("No settings provided. Pass keyword arguments to update.")
-        return self._request("PATCH", "/api/sdk/user/settings", json=kwargs)
+        result = self._request("PATCH", "/api/sdk/user/settings", json=kwargs)
+        if self.cache is not None:
+            self.cache.invalidate_categories("settings")
+        return result
 
     # ==========================================
     # RISK MONITORS (Stop-Loss / Take-Profit)
@@ -1139,125 +1949,347 @@ class SimmerClient:
             # Check for redeemable positions
             positions = client.get_positions()
             for p in positions:
-                if p.get('redeemable'):
-                    result = client.redeem(p['market_id'], p['redeemable_side'])
+                if p.redeemable:
+                    result = client.redeem(p.market_id, p.redeemable_side)
                     print(f"Redeemed: {result['tx_hash']}")
         """
-        result = self._request("POST", "/api/sdk/redeem", json={
-            "market_id": market_id,
-            "side": side,
-        })
+        result = self._redeem(market_id, side)
+        if result.get("success"):
+            self._invalidate_after_trade(market_id)
+        return result
 
-        # Managed wallet — server already signed and submitted
-        if not result.get("unsigned_tx"):
-            return result
+    def _redeem(self, market_id: str, side: str) -> Dict[str, Any]:
+        """Redeem implementation; see redeem()."""
+        result = self._redeem_batch([(market_id, side)])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
 
-        # External wallet — sign locally and broadcast
-        if not self._private_key:
-            raise ValueError(
-                "Redemption requires signing. Set WALLET_PRIVATE_KEY env var or pass private_key to constructor."
-            )
+    def redeem_many(
+        self,
+        positions: List[Tuple[str, str]],
+        max_workers: int = 8,
+        timeout: float = 60.0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Redeem several winning positions at once.
+
+        Redemption transactions are requested concurrently. For external
+        wallets they are then all signed up front with consecutive nonces
+        and broadcast back to back in nonce order. The call waits for every
+        receipt together, so N redemptions take about as long as one. If a
+        broadcast fails, the positions after it are not sent (their nonces
+        could never be mined) and are reported as failed.
+
+        Args:
+            positions: (market_id, side) pairs
+            max_workers: Concurrent API requests
+            timeout: Seconds to wait for all receipts
+
+        Returns:
+            One dict per position, in input order, with 'market_id', 'side',
+            'success' and 'tx_hash' or 'error'
 
+        Example:
+            results = client.redeem_many([(m1, "yes"), (m2, "no")])
+            for r in results:
+                print(r["market_id"], r["success"], r.get("tx_hash") or r.get("error"))
+        """
+        results = []
+        for (market_id, side), result in zip(positions, self._redeem_batch(positions, max_workers, timeout)):
+            if isinstance(result, Exception):
+                result = {"success": False, "error": str(result)}
+            result = {"market_id": market_id, "side": side, **result}
+            if result.get("success"):
+                self._invalidate_after_trade(market_id)
+            results.append(result)
+        return results
+
+    def redeem_all(self, max_workers: int = 8, timeout: float = 60.0) -> List[Dict[str, Any]]:
+        """
+        Redeem every redeemable Polymarket position.
+
+        Returns:
+            Per-position results as for redeem_many() (empty if nothing to redeem)
+
+        Example:
+            for r in client.redeem_all():
+                print(r["market_id"], r["success"])
+        """
+        positions = [
+            (p.market_id, p.redeemable_side)
+            for p in self.get_positions(venue="polymarket")
+            if p.redeemable and p.redeemable_side
+        ]
+        if not positions:
+            return []
+        return self.redeem_many(positions, max_workers=max_workers, timeout=timeout)
+
+    def _redeem_batch(
+        self,
+        positions: List[Tuple[str, str]],
+        max_workers: int = 8,
+        timeout: float = 60.0,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Prepare, sign, broadcast and confirm redemptions; one result dict or exception per position."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _prepare(item: Tuple[str, str]) -> Union[Dict[str, Any], Exception]:
+            try:
+                return self._request("POST", "/api/sdk/redeem", json={
+                    "market_id": item[0],
+                    "side": item[1],
+                })
+            except Exception as e:
+                return e
+
+        workers = max(1, min(max_workers, len(positions)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            prepared = list(pool.map(_prepare, positions))
+
+        results: List[Any] = [None] * len(positions)
+        to_sign: List[int] = []
+        for i, prep in enumerate(prepared):
+            if isinstance(prep, Exception):
+                results[i] = prep
+            elif not prep.get("unsigned_tx"):
+                # Managed wallet — server already signed and submitted
+                results[i] = prep
+            elif not self._private_key:
+                results[i] = ValueError(
+                    "Redemption requires signing. Set WALLET_PRIVATE_KEY env var or pass private_key to constructor."
+                )
+            else:
+                error = self._validate_redeem_tx(prep["unsigned_tx"])
+                if error:
+                    results[i] = {"success": False, "error": error}
+                else:
+                    to_sign.append(i)
+
+        if not to_sign:
+            return results
+
+        # External wallet — sign everything locally with consecutive nonces
+        if len(to_sign) == 1:
+            print(f"  Signing redemption transaction locally...")
+        else:
+            print(f"  Signing {len(to_sign)} redemption transactions locally...")
+        nonces = self._get_nonce_manager()
+        backend_nonces = [n for n in (self._backend_nonce(prepared[i]["unsigned_tx"]) for i in to_sign) if n is not None]
         try:
-            from eth_account import Account
-        except ImportError:
-            raise ImportError(
-                "eth-account is required for external wallet redemption. "
-                "Install with: pip install eth-account"
+            # Read gas alongside the nonce sync so both share one RPC batch
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                fees_future = pool.submit(self.gas_oracle.fees)  # One shared reading for the whole batch
+                reserved = nonces.reserve_many(len(to_sign), chain_nonce=max(backend_nonces) if backend_nonces else None)
+        except Exception as e:
+            for i in to_sign:
+                results[i] = e
+            return results
+        try:
+            fees = fees_future.result()
+        except Exception as e:
+            for n in reversed(reserved):
+                nonces.release(n)
+            for i in to_sign:
+                results[i] = e
+            return results
+
+        signed = self._sign_redemptions(to_sign, prepared, reserved, fees, results)
+
+        # Broadcast via Simmer's Alchemy relay in nonce order. A tx can only be
+        # mined after every lower nonce, so once one broadcast fails the rest
+        # would be stuck in the mempool: stop and hand their nonces back.
+        pending: Dict[str, Tuple[int, int]] = {}  # tx_hash -> (result index, nonce)
+        for k, (i, nonce, signed_tx_hex) in enumerate(signed):
+            try:
+                broadcast = self._request("POST", "/api/sdk/wallet/broadcast-tx", json={"signed_tx": signed_tx_hex})
+            except Exception as e:
+                broadcast = {"success": False, "error": str(e)}
+            tx_hash = broadcast.get("tx_hash")
+            if broadcast.get("success") and tx_hash:
+                nonces.mark_sent(nonce, tx_hash)
+                pending[tx_hash] = (i, nonce)
+                print(f"  Broadcast OK ({tx_hash[:18]}...) — waiting for confirmation...")
+                continue
+            self._abandon_redemptions(signed[k:], broadcast.get("error", "Broadcast failed"), results)
+            break
+
+        # Wait for all receipts together (one batched RPC request per tick)
+        receipts = self._get_receipt_watcher().wait(
+            list(pending), timeout,
+            on_progress=lambda left, waited: print(f"  Still waiting for confirmation... ({waited:.0f}s)"),
+        )
+        for tx_hash, receipt_data in receipts.items():
+            i, nonce = pending[tx_hash]
+            if receipt_data is None:
+                # Timed out but tx may still confirm
+                print(f"  Confirmation timed out. Check: https://polygonscan.com/tx/{tx_hash}")
+                results[i] = {"success": True, "tx_hash": tx_hash, "note": "confirmation_timeout"}
+                continue
+            status = receipt_data.get("status", 0)
+            block = receipt_data.get("blockNumber", 0)
+            nonces.confirm(nonce)
+            if status == 1:
+                print(f"  Confirmed in block {block}")
+                results[i] = {"success": True, "tx_hash": tx_hash}
+            else:
+                results[i] = {"success": False, "tx_hash": tx_hash, "error": f"Transaction reverted in block {block}"}
+        return results
+
+    def _sign_redemptions(
+        self,
+        to_sign: List[int],
+        prepared: List[Any],
+        reserved: List[int],
+        fees: GasFees,
+        results: List[Any],
+    ) -> List[Tuple[int, int, str]]:
+        """
+        Sign redemption txs with the reserved nonces, lowest first.
+
+        Nonces go to successfully signed txs in order, so a signing failure
+        (recorded in results) leaves no gap; unused nonces are handed back.
+
+        Returns:
+            (result index, nonce, signed tx hex) per signed tx, in nonce order
+        """
+        nonces = self._get_nonce_manager()
+        signed: List[Tuple[int, int, str]] = []
+        for i in to_sign:
+            nonce = reserved[len(signed)]
+            try:
+                signed.append((i, nonce, self._sign_redeem_tx(prepared[i]["unsigned_tx"], nonce, fees)))
+            except Exception as e:
+                results[i] = e
+        for n in reversed(reserved[len(signed):]):
+            nonces.release(n)
+        return signed
+
+    def _abandon_redemptions(self, unsent: List[Tuple[int, int, str]], error: str, results: List[Any]) -> None:
+        """
+        Handle a failed broadcast of unsent[0].
+
+        Later nonces could never be mined without it, so those txs are not
+        broadcast either: every nonce is handed back (highest first) and each
+        position is reported as failed.
+        """
+        nonces = self._get_nonce_manager()
+        i, failed_nonce, _ = unsent[0]
+        results[i] = {"success": False, "error": error}
+        for j, nonce, _ in reversed(unsent[1:]):
+            nonces.release(nonce)
+            results[j] = {"success": False, "error": f"Not broadcast: earlier redemption (nonce {failed_nonce}) failed: {error}"}
+        nonces.release(failed_nonce, error)
+
+    @property
+    def rpc(self) -> PolygonRPC:
+        """
+        Batching JSON-RPC client for Simmer's Polygon RPC proxy.
+
+        Calls made within a few milliseconds of each other (from any thread)
+        share one HTTP request; rpc.call_many() batches explicitly.
+        """
+        if self._rpc is None:
+            self._rpc = PolygonRPC(lambda payload: self._request("POST", "/api/rpc/polygon", json=payload))
+        return self._rpc
+
+    def _get_receipt_watcher(self) -> ReceiptWatcher:
+        """Lazily build the shared ReceiptWatcher."""
+        if self._receipt_watcher is None:
+            self._receipt_watcher = ReceiptWatcher(self.rpc)
+        return self._receipt_watcher
+
+    @property
+    def gas_oracle(self) -> GasOracle:
+        """
+        Shared EIP-1559 fee estimator for external-wallet transactions.
+
+        Readings are cached for a few seconds and shared by concurrent
+        transactions. Replace it to change the strategy, e.g.
+        client.gas_oracle = GasOracle(client.rpc, percentile=75).
+        """
+        if self._gas_oracle is None:
+            self._gas_oracle = GasOracle(self.rpc)
+        return self._gas_oracle
+
+    @gas_oracle.setter
+    def gas_oracle(self, oracle: GasOracle) -> None:
+        self._gas_oracle = oracle
+
+    def _get_nonce_manager(self) -> NonceManager:
+        """Lazily build the NonceManager for the external wallet."""
+        if self._nonce_manager is None:
+            address = self._wallet_address
+            self._nonce_manager = NonceManager(
+                address,
+                lambda: self.rpc.get_transaction_count(address),
+                path=self._nonce_state_path,
             )
+        return self._nonce_manager
 
-        unsigned_tx = result["unsigned_tx"]
+    # Contracts a redemption tx may target, mapped to the expected function selector
+    _REDEEM_CONTRACT_WHITELIST = {
+        "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045".lower(): "0x01b7037c",   # CTF: redeemPositions(address,bytes32,bytes32,uint256[])
+        "0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296".lower(): "0xdbeccb23",   # NegRiskAdapter: redeemPositions(bytes32,uint256[])
+    }
 
-        # Validate unsigned tx before signing
-        _REDEEM_CONTRACT_WHITELIST = {
-            "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045".lower(): "0x01b7037c",   # CTF: redeemPositions(address,bytes32,bytes32,uint256[])
-            "0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296".lower(): "0xdbeccb23",   # NegRiskAdapter: redeemPositions(bytes32,uint256[])
-        }
+    def _validate_redeem_tx(self, unsigned_tx: Dict[str, Any]) -> Optional[str]:
+        """Check a backend-built redemption tx before signing. Returns an error or None."""
         tx_to = unsigned_tx.get("to", "")
-        if not tx_to or tx_to.lower() not in _REDEEM_CONTRACT_WHITELIST:
-            return {"success": False, "error": "Unsigned tx targets unknown contract"}
+        if not tx_to or tx_to.lower() not in self._REDEEM_CONTRACT_WHITELIST:
+            return "Unsigned tx targets unknown contract"
         tx_from = unsigned_tx.get("from", "")
         if tx_from and tx_from.lower() != self._wallet_address.lower():
-            return {"success": False, "error": "Unsigned tx is for wrong wallet"}
+            return "Unsigned tx is for wrong wallet"
 
         # Validate calldata targets expected function selector
         tx_data = unsigned_tx.get("data", "")
-        expected_selector = _REDEEM_CONTRACT_WHITELIST[tx_to.lower()]
+        expected_selector = self._REDEEM_CONTRACT_WHITELIST[tx_to.lower()]
         if not tx_data or not tx_data.lower().startswith(expected_selector):
-            return {"success": False, "error": f"Unsigned tx has unexpected function selector (expected {expected_selector})"}
+            return f"Unsigned tx has unexpected function selector (expected {expected_selector})"
 
         # Cap gas limit to prevent POL drain
         tx_gas = int(unsigned_tx.get("gas", 200000))
         if tx_gas > 500_000:
-            return {"success": False, "error": f"Gas limit too high ({tx_gas}), max 500000"}
+            return f"Gas limit too high ({tx_gas}), max 500000"
+        return None
 
-        print(f"  Signing redemption transaction locally...")
-
-        # Use Simmer's RPC proxy for chain queries
-        def _rpc_call(method: str, params: list) -> Any:
-            resp = self._request("POST", "/api/rpc/polygon", json={
-                "jsonrpc": "2.0", "method": method, "params": params, "id": 1,
-            })
-            return resp.get("result")
-
-        # Use nonce from backend unsigned_tx (freshest), fall back to RPC
+    @staticmethod
+    def _backend_nonce(unsigned_tx: Dict[str, Any]) -> Optional[int]:
+        """Nonce supplied by the backend with an unsigned tx, if any."""
         backend_nonce = unsigned_tx.get("nonce")
-        if backend_nonce is not None:
-            nonce = int(backend_nonce) if isinstance(backend_nonce, (int, float)) else int(str(backend_nonce), 0)
-        else:
-            nonce = int(_rpc_call("eth_getTransactionCount", [self._wallet_address, "pending"]) or "0x0", 16)
+        if backend_nonce is None:
+            return None
+        if isinstance(backend_nonce, (int, float)):
+            return int(backend_nonce)
+        return int(str(backend_nonce), 0)
+
+    def _sign_redeem_tx(self, unsigned_tx: Dict[str, Any], nonce: int, fees: GasFees) -> str:
+        """Sign a validated redemption tx locally. Returns the raw signed tx hex."""
+        try:
+            from eth_account import Account
+        except ImportError:
+            raise ImportError(
+                "eth-account is required for external wallet redemption. "
+                "Install with: pip install eth-account"
+            )
 
-        gas_price = int(_rpc_call("eth_gasPrice", []) or "0x0", 16)
-        priority_fee = max(30_000_000_000, gas_price // 4)
-        max_fee = gas_price * 2
+        tx_data = unsigned_tx["data"]
 
         tx_fields = {
-            "to": tx_to,
+            "to": unsigned_tx["to"],
             "data": bytes.fromhex(tx_data[2:] if tx_data.startswith("0x") else tx_data),
             "value": 0,
             "chainId": 137,
             "nonce": nonce,
-            "gas": tx_gas,
-            "maxFeePerGas": max_fee,
-            "maxPriorityFeePerGas": priority_fee,
+            "gas": int(unsigned_tx.get("gas", 200000)),
+            "maxFeePerGas": fees.max_fee_per_gas,
+            "maxPriorityFeePerGas": fees.max_priority_fee_per_gas,
             "type": 2,
         }
 
         signed = Account.sign_transaction(tx_fields, self._private_key)
-        signed_tx_hex = "0x" + signed.raw_transaction.hex()
-
-        # Broadcast via Simmer's Alchemy relay
-        broadcast = self._request("POST", "/api/sdk/wallet/broadcast-tx", json={
-            "signed_tx": signed_tx_hex,
-        })
-
-        tx_hash = broadcast.get("tx_hash")
-        if not broadcast.get("success") or not tx_hash:
-            return {"success": False, "error": broadcast.get("error", "Broadcast failed")}
-
-        print(f"  Broadcast OK ({tx_hash[:18]}...) — waiting for confirmation...")
-
-        # Poll for receipt
-        for attempt in range(30):
-            time.sleep(2)
-            try:
-                receipt_data = _rpc_call("eth_getTransactionReceipt", [tx_hash])
-                if receipt_data:
-                    status = int(receipt_data.get("status", "0x0"), 16)
-                    block = int(receipt_data.get("blockNumber", "0x0"), 16)
-                    if status == 1:
-                        print(f"  Confirmed in block {block}")
-                        return {"success": True, "tx_hash": tx_hash}
-                    else:
-                        return {"success": False, "tx_hash": tx_hash, "error": f"Transaction reverted in block {block}"}
-            except Exception:
-                pass
-            if attempt > 0 and attempt % 5 == 0:
-                print(f"  Still waiting for confirmation... ({attempt * 2}s)")
-
-        # Timed out but tx may still confirm
-        print(f"  Confirmation timed out. Check: https://polygonscan.com/tx/{tx_hash}")
-        return {"success": True, "tx_hash": tx_hash, "note": "confirmation_timeout"}
+        return "0x" + signed.raw_transaction.hex()
 
     # ==========================================
     # PRICE ALERTS
@@ -1456,11 +2488,14 @@ class SimmerClient:
         shares: float = 0,
         action: str = "buy",
         order_type: str = "FAK",
+        price: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Build and sign a Polymarket order locally.
 
-        Internal method used when private_key is set.
+        Internal method used when private_key is set. Static market fields
+        come from the market metadata cache; the market is only fetched when
+        its metadata is not cached yet or no price was supplied.
 
         Args:
             market_id: Market to trade on
@@ -1468,75 +2503,270 @@ class SimmerClient:
             amount: Dollar amount (for buys)
             shares: Number of shares (for sells)
             action: 'buy' or 'sell'
+            price: Limit price for the side; defaults to the market's
+                current external price
         """
         if not self._private_key or not self._wallet_address:
             return None
 
-        try:
-            from .signing import build_and_sign_order
-        except ImportError:
-            raise ImportError(
-                "Local signing requires py_order_utils. "
-                "Install with: pip install py-order-utils py-clob-client eth-account"
-            )
+        metadata = self.market_metadata.get(market_id)
+        if metadata is None or price is None:
+            # Get market data to find token IDs, price, and tick_size
+            with self._phase("market_fetch"):
+                market_data = self._fetch_market_data(market_id)
+            metadata = self._remember_market_metadata(market_id, market_data)
+            if price is None:
+                price = _market_side_price(market_data, side)
 
-        is_sell = action == "sell"
+        with self._phase("sign"):
+            return self._sign_order(metadata, side, price, amount, shares, action, order_type)
 
-        # Get market data to find token IDs, price, and tick_size
+    def _fetch_market_data(self, market_id: str) -> Dict[str, Any]:
+        """Raw market dict from GET /api/sdk/markets/{id}."""
         markets_resp = self._request("GET", f"/api/sdk/markets/{market_id}")
         market_data = markets_resp.get("market") if isinstance(markets_resp, dict) else None
         if not market_data:
             raise ValueError(f"Market {market_id} not found")
+        return market_data
 
-        # Get token ID based on side
-        if side.lower() == "yes":
-            token_id = market_data.get("polymarket_token_id")
-        else:
-            token_id = market_data.get("polymarket_no_token_id")
-
-        if not token_id:
+    def _remember_market_metadata(self, market_id: str, market_data: Dict[str, Any]) -> MarketMetadata:
+        """Extract signing metadata from a market dict and cache it."""
+        metadata = MarketMetadata.from_market_data(market_id, market_data)
+        if metadata is None:
             raise ValueError(f"Market {market_id} does not have Polymarket token IDs")
+        self.market_metadata.put(metadata)
+        return metadata
 
-        # Get price - use external price for the side
-        if side.lower() == "yes":
-            price = market_data.get("external_price_yes") or 0.5
-        else:
-            external_yes = market_data.get("external_price_yes") or 0.5
-            price = 1.0 - external_yes
+    def warm_market_metadata(self, market_ids: List[str], max_workers: int = 8) -> int:
+        """
+        Prefetch signing metadata for markets you expect to trade.
 
-        # Clamp price to valid range to avoid division issues
-        if price <= 0 or price >= 1:
-            price = 0.5  # Fallback to 50%
+        After warm-up, trade(..., price=...) on these markets signs locally
+        without any market lookup. Markets already cached are skipped.
 
-        # Calculate size based on action
-        if is_sell:
-            size = shares  # Sell uses shares directly
-        else:
-            size = amount / price  # Buy calculates shares from amount
-
-        # Determine CLOB side
-        clob_side = "SELL" if is_sell else "BUY"
-
-        neg_risk = market_data.get("polymarket_neg_risk", False)
-        tick_size = market_data.get("tick_size", 0.01)
-        fee_rate_bps = market_data.get("fee_rate_bps", 0)
-
-        # Build and sign the order
-        signed = build_and_sign_order(
-            private_key=self._private_key,
-            wallet_address=self._wallet_address,
-            token_id=token_id,
-            side=clob_side,
-            price=price,
-            size=size,
-            neg_risk=neg_risk,
-            signature_type=0,  # EOA
-            tick_size=tick_size,
-            fee_rate_bps=fee_rate_bps,
-            order_type=order_type,
+        Args:
+            market_ids: Markets to warm
+            max_workers: Concurrent market lookups
+
+        Returns:
+            Number of markets now cached (of those requested)
+
+        Example:
+            markets = client.get_markets(import_source="polymarket")
+            client.warm_market_metadata([m.id for m in markets])
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        missing = [mid for mid in dict.fromkeys(market_ids) if self.market_metadata.get(mid) is None]
+
+        def _fetch(market_id: str) -> Optional[MarketMetadata]:
+            try:
+                return MarketMetadata.from_market_data(market_id, self._fetch_market_data(market_id))
+            except Exception as e:
+                logger.debug("Could not warm metadata for %s: %s", market_id, e)
+                return None
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as pool:
+                fetched = [m for m in pool.map(_fetch, missing) if m is not None]
+            self.market_metadata.put_many(fetched)
+
+        return sum(1 for mid in market_ids if self.market_metadata.get(mid) is not None)
+
+    def _sign_order(
+        self,
+        metadata: MarketMetadata,
+        side: str,
+        price: float,
+        amount: float = 0,
+        shares: float = 0,
+        action: str = "buy",
+        order_type: str = "FAK",
+    ) -> Dict[str, Any]:
+        """
+        Sign a Polymarket order from cached market metadata.
+
+        Pure CPU work (no network), shared by the sync and async clients.
+        """
+        signer = self._get_order_signer()
+        spec = _order_spec(metadata, side, price, amount, shares, action, order_type)
+        pool = self._presigned.get(metadata.market_id)
+        if pool is not None:
+            order = pool.take(spec)
+            if order is not None:
+                return order.to_dict()
+        return signer.sign(**spec).to_dict()
+
+    def presign_orders(
+        self,
+        market_id: str,
+        prices: List[float],
+        amounts: List[float] = (),
+        shares: List[float] = (),
+        sides: List[str] = ("yes", "no"),
+        order_type: str = "FAK",
+        depth: int = 1,
+        max_age: Optional[float] = 300.0,
+    ):
+        """
+        Keep signed orders ready for a market so trade() can skip signing.
+
+        Signs every combination of side x price x size up front and keeps
+        the pool topped up from a background thread. A later
+        trade(market_id, side, amount, price=p) whose side, price and size
+        match a ladder entry submits a ready order; anything else is signed
+        inline as usual.
+
+        Args:
+            market_id: Market to pre-sign for
+            prices: Limit prices (per side) to pre-sign at
+            amounts: Buy sizes in USDC
+            shares: Sell sizes in shares
+            sides: Outcomes to cover ('yes', 'no')
+            order_type: Order type the trades will use
+            depth: Orders kept per ladder entry (trades between refills)
+            max_age: Re-sign orders older than this many seconds
+
+        Returns:
+            The PresignedOrderPool (see pool.stats())
+
+        Example:
+            # 5-minute crypto market: have $5/$10 YES and NO buys ready
+            client.presign_orders(market_id, prices=[0.45, 0.5, 0.55], amounts=[5.0, 10.0])
+            ...
+            client.trade(market_id, "yes", 10.0, price=0.5)  # no signing on the hot path
+            client.cancel_presigned(market_id)
+        """
+        from .signing import PresignedOrderPool
+
+        if not self._private_key or not self._wallet_address:
+            raise ValueError(
+                "No wallet configured. Set WALLET_PRIVATE_KEY env var or pass private_key to constructor."
+            )
+        for p in prices:
+            if p <= 0 or p >= 1:
+                raise ValueError(f"Invalid price {p}. Must be between 0 and 1")
+
+        metadata = self.market_metadata.get(market_id)
+        if metadata is None:
+            metadata = self._remember_market_metadata(market_id, self._fetch_market_data(market_id))
+
+        specs = []
+        for side in sides:
+            for price in prices:
+                specs.extend(_order_spec(metadata, side, price, a, 0, "buy", order_type) for a in amounts)
+                specs.extend(_order_spec(metadata, side, price, 0, n, "sell", order_type) for n in shares)
+
+        self.cancel_presigned(market_id)
+        pool = PresignedOrderPool(self._get_order_signer(), specs, depth=depth, max_age=max_age)
+        self._presigned[market_id] = pool.start()
+        return pool
+
+    def cancel_presigned(self, market_id: Optional[str] = None) -> None:
+        """Stop and discard the pre-signed order pool for a market (or all markets)."""
+        market_ids = [market_id] if market_id else list(self._presigned)
+        for mid in market_ids:
+            pool = self._presigned.pop(mid, None)
+            if pool is not None:
+                pool.stop()
+
+    def sign_orders(self, intents: List["OrderIntent"], processes: int = 0) -> List[Dict[str, Any]]:
+        """
+        Sign a batch of Polymarket orders locally, without submitting them.
+
+        Market metadata (and current prices, for intents without a price) is
+        fetched concurrently for markets not already cached; signing then
+        runs in one tight loop with the cached OrderSigner.
+
+        Args:
+            intents: Orders to sign
+            processes: Sign across this many worker processes (0 = in-thread)
+
+        Returns:
+            Signed order dicts, in input order
+
+        Raises:
+            ValueError: If no private key is configured or an order is invalid
+        """
+        if not self._private_key or not self._wallet_address:
+            raise ValueError(
+                "No wallet configured. Set WALLET_PRIVATE_KEY env var or pass private_key to constructor."
+            )
+        results = self._sign_intents(intents, processes)
+        for r in results:
+            if isinstance(r, Exception):
+                raise r
+        return results
+
+    def _sign_intents(self, intents: List["OrderIntent"], processes: int = 0, max_workers: int = 8) -> List[Any]:
+        """Sign intents; returns one signed order dict or exception per intent."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Markets we must fetch: metadata not cached, or no caller-supplied price
+        to_fetch = list(dict.fromkeys(
+            it.market_id for it in intents
+            if it.price is None or self.market_metadata.get(it.market_id) is None
+        ))
+        market_data: Dict[str, Any] = {}
+
+        def _fetch(market_id: str) -> None:
+            try:
+                data = self._fetch_market_data(market_id)
+                self._remember_market_metadata(market_id, data)
+                market_data[market_id] = data
+            except Exception as e:
+                market_data[market_id] = e
+
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(to_fetch)))) as pool:
+                list(pool.map(_fetch, to_fetch))
+
+        results: List[Any] = [None] * len(intents)
+        specs: List[Dict[str, Any]] = []
+        spec_index: List[int] = []
+        for i, it in enumerate(intents):
+            data = market_data.get(it.market_id)
+            if isinstance(data, Exception):
+                results[i] = data
+                continue
+            metadata = self.market_metadata.get(it.market_id)
+            price = it.price if it.price is not None else _market_side_price(data, it.side)
+            is_sell = it.action == "sell"
+            specs.append(_order_spec(
+                metadata, it.side, price, it.amount if not is_sell else 0,
+                it.shares if is_sell else 0, it.action, it.order_type
+            ))
+            spec_index.append(i)
+
+        signed = self._get_order_signer().sign_many(
+            specs, processes=processes, return_exceptions=True,
+            private_key=self._private_key if processes > 1 else None,
         )
+        for i, order in zip(spec_index, signed):
+            results[i] = order if isinstance(order, Exception) else order.to_dict()
+        return results
 
-        return signed.to_dict()
+    def _get_order_signer(self):
+        """OrderSigner for the configured wallet, created on first use and reused."""
+        if self._order_signer is None:
+            try:
+                from .signing import OrderSigner
+                self._order_signer = OrderSigner(
+                    self._private_key, self._wallet_address, signature_type=0  # EOA
+                )
+            except ImportError:
+                raise ImportError(
+                    "Local signing requires py_order_utils. "
+                    "Install with: pip install py-order-utils py-clob-client eth-account"
+                )
+        return self._order_signer
+
+    def _get_solana_signer(self):
+        """Lazily build the SolanaSigner for the SOLANA_PRIVATE_KEY wallet."""
+        if self._solana_signer is None:
+            from .solana_signing import SolanaSigner
+            self._solana_signer = SolanaSigner.from_env()
+        return self._solana_signer
 
     def _execute_kalshi_byow_trade(
         self,
@@ -1546,7 +2776,8 @@ class SimmerClient:
         shares: float = 0,
         action: str = "buy",
         reasoning: Optional[str] = None,
-        source: Optional[str] = None
+        source: Optional[str] = None,
+        quote_ttl: Optional[float] = None,
     ) -> TradeResult:
         """
         Execute a Kalshi trade using BYOW (Bring Your Own Wallet).
@@ -1559,6 +2790,9 @@ class SimmerClient:
         2. Sign locally using SOLANA_PRIVATE_KEY
         3. Submit signed transaction to Simmer API
 
+        The result's ``timings`` holds milliseconds spent in each stage
+        ("quote", "sign", "submit", "total").
+
         Args:
             market_id: Market ID to trade on
             side: 'yes' or 'no'
@@ -1567,35 +2801,40 @@ class SimmerClient:
             action: 'buy' or 'sell'
             reasoning: Optional trade explanation
             source: Optional source tag
+            quote_ttl: Seconds a quote stays valid, counted from the quote
+                request; a signed quote older than this is not submitted
+                (default: KALSHI_QUOTE_TTL)
 
         Returns:
             TradeResult with execution details
         """
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
+
+        def _fail(error: str) -> TradeResult:
+            timings["total"] = (time.perf_counter() - started) * 1000
+            return TradeResult(success=False, market_id=market_id, side=side, venue="kalshi",
+                               error=error, timings=timings)
+
         # Check for Solana key
         if not self._solana_key_available:
-            return TradeResult(
-                success=False,
-                market_id=market_id,
-                side=side,
-                error=(
-                    "SOLANA_PRIVATE_KEY environment variable required for Kalshi trading. "
-                    "Set it to your base58-encoded Solana secret key."
-                )
+            return _fail(
+                "SOLANA_PRIVATE_KEY environment variable required for Kalshi trading. "
+                "Set it to your base58-encoded Solana secret key."
             )
 
         try:
-            from .solana_signing import sign_solana_transaction
-        except ImportError as e:
-            return TradeResult(
-                success=False,
-                market_id=market_id,
-                side=side,
-                error=f"Solana signing not available: {e}"
-            )
+            solana_signer = self._get_solana_signer()
+        except (ImportError, ValueError) as e:
+            return _fail(f"Solana signing not available: {e}")
 
         is_sell = action == "sell"
+        if quote_ttl is None:
+            quote_ttl = self.KALSHI_QUOTE_TTL
 
         # Step 1: Get unsigned transaction from Simmer API
+        stage = time.perf_counter()
+        quote_deadline = stage + quote_ttl
         try:
             quote_payload = {
                 "market_id": market_id,
@@ -1611,42 +2850,31 @@ class SimmerClient:
                 json=quote_payload
             )
         except Exception as e:
-            return TradeResult(
-                success=False,
-                market_id=market_id,
-                side=side,
-                error=f"Failed to get quote: {e}"
-            )
+            return _fail(f"Failed to get quote: {e}")
+        finally:
+            timings["quote"] = (time.perf_counter() - stage) * 1000
 
         if not quote.get("success"):
-            return TradeResult(
-                success=False,
-                market_id=market_id,
-                side=side,
-                error=quote.get("error", "Failed to get quote from Simmer")
-            )
+            return _fail(quote.get("error", "Failed to get quote from Simmer"))
 
         unsigned_tx = quote.get("transaction")
         if not unsigned_tx:
-            return TradeResult(
-                success=False,
-                market_id=market_id,
-                side=side,
-                error="Quote missing transaction data"
-            )
+            return _fail("Quote missing transaction data")
 
         # Step 2: Sign locally
+        stage = time.perf_counter()
         try:
-            signed_tx = sign_solana_transaction(unsigned_tx)
+            signed_tx = solana_signer.sign(unsigned_tx)
         except Exception as e:
-            return TradeResult(
-                success=False,
-                market_id=market_id,
-                side=side,
-                error=f"Local signing failed: {e}"
-            )
+            return _fail(f"Local signing failed: {e}")
+        finally:
+            timings["sign"] = (time.perf_counter() - stage) * 1000
+
+        if time.perf_counter() > quote_deadline:
+            return _fail(f"Quote expired before submission (older than {quote_ttl:g}s)")
 
         # Step 3: Submit signed transaction
+        stage = time.perf_counter()
         try:
             submit_payload = {
                 "market_id": market_id,
@@ -1663,27 +2891,14 @@ class SimmerClient:
                 json=submit_payload
             )
         except Exception as e:
-            return TradeResult(
-                success=False,
-                market_id=market_id,
-                side=side,
-                error=f"Failed to submit trade: {e}"
-            )
+            return _fail(f"Failed to submit trade: {e}")
+        finally:
+            timings["submit"] = (time.perf_counter() - stage) * 1000
 
-        return TradeResult(
-            success=data.get("success", False),
-            trade_id=data.get("trade_id"),
-            market_id=data.get("market_id", market_id),
-            side=data.get("side", side),
-            venue="kalshi",
-            shares_bought=data.get("shares_bought", 0) if not is_sell else 0,
-            shares_requested=data.get("shares_requested", 0),
-            order_status=data.get("order_status"),
-            cost=data.get("cost", 0),
-            new_price=data.get("new_price", 0),
-            balance=None,  # Real trading doesn't track $SIM balance
-            error=data.get("error")
-        )
+        result = _parse_kalshi_trade_result(data, market_id, side, is_sell)
+        timings["total"] = (time.perf_counter() - started) * 1000
+        result.timings = timings
+        return result
 
     def link_wallet(self, signature_type: int = 0) -> Dict[str, Any]:
         """
@@ -1763,6 +2978,8 @@ class SimmerClient:
             }
         )
 
+        if self.cache is not None:
+            self.cache.invalidate_categories("settings")
         return result
 
     def check_approvals(self, address: Optional[str] = None, no_cache: bool = False, include_tx_params: bool = False) -> Dict[str, Any]:
@@ -1849,7 +3066,7 @@ class SimmerClient:
             "raw_status": status,
         }
 
-    def set_approvals(self) -> Dict[str, Any]:
+    def set_approvals(self, parallel: bool = False, stall_timeout: float = 20.0) -> Dict[str, Any]:
         """
         Set all required Polymarket token approvals for trading.
 
@@ -1861,6 +3078,14 @@ class SimmerClient:
 
         Requires: eth-account package (pip install eth-account)
 
+        Args:
+            parallel: Sign every missing approval up front with consecutive
+                nonces, broadcast them together and wait for all receipts at
+                once, instead of one transaction at a time. Only transactions
+                that stall are re-sent with bumped gas.
+            stall_timeout: In parallel mode, seconds without a receipt before
+                a transaction is replaced with a higher-fee copy
+
         Returns:
             Dict containing:
             - set: Number of approvals successfully set
@@ -1875,7 +3100,7 @@ class SimmerClient:
         Example:
             client = SimmerClient(api_key="...")  # WALLET_PRIVATE_KEY auto-detected
             client.link_wallet()
-            result = client.set_approvals()
+            result = client.set_approvals(parallel=True)
             print(f"Set {result['set']} approvals, skipped {result['skipped']}")
         """
         if not self._private_key or not self._wallet_address:
@@ -1893,59 +3118,7 @@ class SimmerClient:
 
         from .approvals import get_missing_approval_transactions, get_approval_transactions
 
-        # --- Helper functions (use Simmer's Alchemy RPC proxy for all chain queries) ---
-
-        def _rpc_call(method: str, params: list) -> Any:
-            """Make a JSON-RPC call through Simmer's Alchemy proxy."""
-            resp = self._request("POST", "/api/rpc/polygon", json={
-                "jsonrpc": "2.0", "method": method, "params": params, "id": 1,
-            })
-            return resp.get("result")
-
-        def _fetch_nonce() -> int:
-            """Fetch fresh nonce from chain (includes pending mempool txs)."""
-            result = _rpc_call("eth_getTransactionCount", [self._wallet_address, "pending"])
-            return int(result or "0x0", 16)
-
-        def _fetch_gas_price() -> int:
-            """Fetch current gas price from chain."""
-            result = _rpc_call("eth_gasPrice", [])
-            return int(result or "0x0", 16)
-
-        def _calculate_fees(gas_price: int, bump_factor: float = 1.0) -> tuple:
-            """Calculate EIP-1559 fees from current gas price.
-
-            Args:
-                gas_price: Current gas price in wei from eth_gasPrice
-                bump_factor: Multiplier for retries (1.0 = no bump, 1.25 = 25% bump)
-
-            Returns:
-                (max_fee_per_gas, max_priority_fee_per_gas) in wei
-            """
-            priority_fee = max(30_000_000_000, gas_price // 4)  # min 30 gwei
-            max_fee = gas_price * 2  # 2x current for headroom
-            return int(max_fee * bump_factor), int(priority_fee * bump_factor)
-
-        def _wait_for_receipt(tx_hash: str, approval_num: int, total_approvals: int) -> Optional[dict]:
-            """Poll for tx receipt. Shows progress to user."""
-            for attempt in range(30):  # ~60s max wait
-                time.sleep(2)
-                try:
-                    receipt_data = self._request("POST", "/api/rpc/polygon", json={
-                        "jsonrpc": "2.0",
-                        "method": "eth_getTransactionReceipt",
-                        "params": [tx_hash],
-                        "id": 1,
-                    })
-                    receipt = receipt_data.get("result")
-                    if receipt:
-                        return receipt
-                except Exception:
-                    pass  # Retry polling
-                # Progress update every 10s so user knows it's still working
-                if attempt > 0 and attempt % 5 == 0:
-                    print(f"    Still waiting for on-chain confirmation... ({attempt * 2}s)")
-            return None
+        gas_oracle = self.gas_oracle
 
         # --- Step 1: Check current status ---
 
@@ -1961,9 +3134,6 @@ class SimmerClient:
 
         total = len(all_txs)
         skipped = total - len(missing_txs)
-        set_count = 0
-        failed = 0
-        details = []
 
         if not missing_txs:
             print(f"  All {total} approvals already set. Your wallet is ready to trade!\n")
@@ -1977,8 +3147,7 @@ class SimmerClient:
 
         # Check POL balance for gas
         try:
-            bal_result = _rpc_call("eth_getBalance", [self._wallet_address, "latest"])
-            pol_balance_wei = int(bal_result or "0x0", 16)
+            pol_balance_wei = self.rpc.get_balance(self._wallet_address)
             pol_balance = pol_balance_wei / 1e18
             # ~0.002 POL per approval tx at typical gas prices
             estimated_cost = len(missing_txs) * 0.002
@@ -1992,13 +3161,13 @@ class SimmerClient:
         except Exception:
             print("  Could not check POL balance — continuing anyway.")
 
-        # Fetch fresh gas price
-        try:
-            gas_price = _fetch_gas_price()
-            print(f"  Network gas price: {gas_price / 1e9:.1f} gwei")
-        except Exception:
-            gas_price = 50_000_000_000  # 50 gwei fallback
-            print(f"  Could not fetch gas price, using default: {gas_price / 1e9:.0f} gwei")
+        # Fetch fresh gas fees (falls back to 50 gwei if the RPC is unreachable)
+        fees = gas_oracle.fees(force=True)
+        if fees.source == "fallback":
+            print(f"  Could not fetch gas price, using default: {fees.max_fee_per_gas / 2e9:.0f} gwei")
+        else:
+            print(f"  Network gas: max fee {fees.max_fee_per_gas / 1e9:.1f} gwei, "
+                  f"tip {fees.max_priority_fee_per_gas / 1e9:.1f} gwei")
 
         print()
 
@@ -2007,7 +3176,88 @@ class SimmerClient:
         print(f"Step 3/3: Sending {len(missing_txs)} approval transaction(s)...")
         print(f"  Each transaction is signed locally and relayed via Simmer.\n")
 
-        MAX_RETRIES = 3
+        if parallel:
+            set_count, failed, details = self._send_approvals_parallel(Account, missing_txs, fees, stall_timeout)
+        else:
+            set_count, failed, details = self._send_approvals_sequential(Account, missing_txs, fees)
+
+        # --- Summary ---
+
+        print(f"{'='*50}")
+        print(f"  Approval Summary")
+        print(f"{'='*50}")
+        print(f"  Already set:  {skipped}")
+        print(f"  Newly set:    {set_count}")
+        if failed > 0:
+            print(f"  Failed:       {failed}")
+        print(f"  Total:        {skipped + set_count + failed}/{total}")
+        print()
+
+        if failed == 0 and (skipped + set_count) == total:
+            print("  All approvals complete. Your wallet is ready to trade on Polymarket!")
+            print(f"  Try: client.trade(market_id, 'yes', 10.0, venue='polymarket')")
+        elif failed > 0:
+            print(f"  {failed} approval(s) failed. You can re-run set_approvals() to retry —")
+            print(f"  it will skip the ones that succeeded and only attempt the remaining.")
+            if any(d.get("error") == "reverted" for d in details):
+                print(f"\n  If approvals keep reverting, check:")
+                print(f"    1. POL balance for gas: https://polygonscan.com/address/{self._wallet_address}")
+                print(f"    2. Contact Simmer support with your wallet address.")
+
+        print()
+        if self.cache is not None:
+            self.cache.invalidate_categories("approvals")
+        return {"set": set_count, "skipped": skipped, "failed": failed, "details": details}
+
+    # Attempts per approval transaction (first send plus retries with bumped gas)
+    _APPROVAL_MAX_RETRIES = 3
+
+    def _sign_approval_tx(self, Account, tx_data: Dict[str, Any], nonce: int, fees: GasFees) -> str:
+        """Build and sign one EIP-1559 approval transaction. Returns the raw tx hex."""
+        tx_fields = {
+            "to": tx_data["to"],
+            "data": bytes.fromhex(tx_data["data"][2:] if tx_data["data"].startswith("0x") else tx_data["data"]),
+            "value": 0,
+            "chainId": 137,
+            "nonce": nonce,
+            "gas": 100000,  # Match managed wallet path; USDC.e proxy needs more than 80k
+            "maxFeePerGas": fees.max_fee_per_gas,
+            "maxPriorityFeePerGas": fees.max_priority_fee_per_gas,
+            "type": 2,  # EIP-1559
+        }
+        signed = Account.sign_transaction(tx_fields, self._private_key)
+        return "0x" + signed.raw_transaction.hex()
+
+    def _missing_approvals(self) -> Optional[Set[Tuple[str, str]]]:
+        """(token, spender) of approvals not yet on chain, or None if the check fails."""
+        from .approvals import get_missing_approval_transactions
+
+        try:
+            status = self.check_approvals(no_cache=True)
+        except Exception as e:
+            print(f"       Could not re-check allowances: {e}")
+            return None
+        return {(tx["token"], tx["spender_address"]) for tx in get_missing_approval_transactions(status)}
+
+    def _send_approvals_sequential(
+        self, Account, missing_txs: List[Dict[str, Any]], fees: GasFees,
+    ) -> Tuple[int, int, List[Dict[str, Any]]]:
+        """Send approvals one at a time, waiting for each receipt. Returns (set, failed, details)."""
+        nonces = self._get_nonce_manager()
+        gas_oracle = self.gas_oracle
+
+        def _wait_for_receipt(tx_hash: str, approval_num: int, total_approvals: int) -> Optional[dict]:
+            """Wait for tx receipt (~60s max). Shows progress to user."""
+            return self._get_receipt_watcher().wait(
+                [tx_hash], 60.0,
+                # Progress update every 10s so user knows it's still working
+                on_progress=lambda left, waited: print(f"    Still waiting for on-chain confirmation... ({waited:.0f}s)"),
+            )[tx_hash]
+
+        MAX_RETRIES = self._APPROVAL_MAX_RETRIES
+        set_count = 0
+        failed = 0
+        details: List[Dict[str, Any]] = []
 
         for i, tx_data in enumerate(missing_txs):
             desc = tx_data.get("description", f"Approval {i + 1}")
@@ -2019,38 +3269,23 @@ class SimmerClient:
             tx_succeeded = False
 
             for retry in range(MAX_RETRIES):
+                nonce = None
                 try:
-                    # Fresh nonce and gas price each attempt
-                    nonce = _fetch_nonce()
+                    # Local nonce (reused on retry if the last attempt never landed)
+                    nonce = nonces.reserve()
 
                     if retry > 0:
-                        # Re-fetch gas price on retries for fresh data
-                        try:
-                            gas_price = _fetch_gas_price()
-                        except Exception:
-                            pass  # Use previous gas_price
-                        print(f"       Retry {retry}/{MAX_RETRIES - 1} — fresh nonce: {nonce}, gas: {gas_price / 1e9:.1f} gwei")
+                        # Fresh reading on retries (keeps the last one if the RPC fails)
+                        fees = gas_oracle.fees(force=True)
+                        print(f"       Retry {retry}/{MAX_RETRIES - 1} — nonce: {nonce}, "
+                              f"max fee: {fees.max_fee_per_gas / 1e9:.1f} gwei")
 
                     # On retries, bump 25% above fresh gas to replace stuck pending txs
                     bump_factor = 1.0 + (0.25 * retry)
-                    max_fee, priority_fee = _calculate_fees(gas_price, bump_factor)
-
-                    # Build transaction
-                    tx_fields = {
-                        "to": tx_data["to"],
-                        "data": bytes.fromhex(tx_data["data"][2:] if tx_data["data"].startswith("0x") else tx_data["data"]),
-                        "value": 0,
-                        "chainId": 137,
-                        "nonce": nonce,
-                        "gas": 100000,  # Match managed wallet path; USDC.e proxy needs more than 80k
-                        "maxFeePerGas": max_fee,
-                        "maxPriorityFeePerGas": priority_fee,
-                        "type": 2,  # EIP-1559
-                    }
+                    attempt_fees = fees.bumped(bump_factor)
 
                     # Sign locally — private key never leaves this machine
-                    signed = Account.sign_transaction(tx_fields, self._private_key)
-                    signed_tx_hex = "0x" + signed.raw_transaction.hex()
+                    signed_tx_hex = self._sign_approval_tx(Account, tx_data, nonce, attempt_fees)
 
                     # Broadcast via Simmer backend (Alchemy RPC)
                     result = self._request("POST", "/api/sdk/wallet/broadcast-tx", json={
@@ -2060,14 +3295,17 @@ class SimmerClient:
                     tx_hash = result.get("tx_hash")
 
                     if result.get("success") and tx_hash:
+                        nonces.mark_sent(nonce, tx_hash)
+                        sent_nonce, nonce = nonce, None
                         print(f"       Broadcast OK ({tx_hash[:18]}...) — waiting for confirmation...")
 
                         receipt = _wait_for_receipt(tx_hash, i + 1, len(missing_txs))
 
                         if receipt:
-                            status_code = int(receipt.get("status", "0x0"), 16)
-                            block_num = int(receipt.get("blockNumber", "0x0"), 16)
-                            gas_used = int(receipt.get("gasUsed", "0x0"), 16)
+                            nonces.confirm(sent_nonce)
+                            status_code = receipt.get("status", 0)
+                            block_num = receipt.get("blockNumber", 0)
+                            gas_used = receipt.get("gasUsed", 0)
                             if status_code == 1:
                                 print(f"       Confirmed in block {block_num} (gas used: {gas_used:,})")
                                 set_count += 1
@@ -2093,6 +3331,11 @@ class SimmerClient:
 
                     else:
                         error = result.get("error", "Unknown error")
+                        if "already known" in error.lower():
+                            nonces.mark_sent(nonce, "")  # In the mempool; keep it reserved
+                        else:
+                            nonces.release(nonce, error)
+                        nonce = None
                         if "underpriced" in error.lower() and retry < MAX_RETRIES - 1:
                             print(f"       Pending transaction in the way — retrying with higher gas...")
                             time.sleep(3)
@@ -2106,11 +3349,21 @@ class SimmerClient:
                             tx_succeeded = True
                             break
                         elif "nonce too low" in error.lower():
-                            # Nonce already used — approval may already be set. Re-check.
-                            print(f"       Nonce already used — this approval may have been set by a previous attempt.")
-                            set_count += 1
-                            details.append({"description": desc, "success": True, "note": "nonce_consumed"})
-                            tx_succeeded = True
+                            # Our count was behind the chain (release() resyncs it);
+                            # that says nothing about this approval, so re-check it
+                            missing = self._missing_approvals()
+                            if missing is not None and (tx_data["token"], tx_data["spender_address"]) not in missing:
+                                print(f"       Allowance already set on chain.")
+                                set_count += 1
+                                details.append({"description": desc, "success": True, "note": "already_set"})
+                                tx_succeeded = True
+                                break
+                            if retry < MAX_RETRIES - 1:
+                                print(f"       Nonce already used by another transaction — retrying with a fresh nonce...")
+                                continue
+                            print(f"       Failed: {error}")
+                            failed += 1
+                            details.append({"description": desc, "success": False, "error": error})
                             break
                         else:
                             print(f"       Failed: {error}")
@@ -2123,6 +3376,8 @@ class SimmerClient:
                             break
 
                 except Exception as e:
+                    if nonce is not None:
+                        nonces.release(nonce, e)
                     print(f"       Error: {type(e).__name__}: {e}")
                     if retry < MAX_RETRIES - 1:
                         print(f"       Retrying in 5s...")
@@ -2137,31 +3392,193 @@ class SimmerClient:
             else:
                 print()
 
-        # --- Summary ---
+        return set_count, failed, details
 
-        print(f"{'='*50}")
-        print(f"  Approval Summary")
-        print(f"{'='*50}")
-        print(f"  Already set:  {skipped}")
-        print(f"  Newly set:    {set_count}")
-        if failed > 0:
-            print(f"  Failed:       {failed}")
-        print(f"  Total:        {skipped + set_count + failed}/{total}")
-        print()
+    def _send_approvals_parallel(
+        self, Account, missing_txs: List[Dict[str, Any]], fees: GasFees, stall_timeout: float,
+    ) -> Tuple[int, int, List[Dict[str, Any]]]:
+        """
+        Send all approvals at once with consecutive nonces. Returns (set, failed, details).
 
-        if failed == 0 and (skipped + set_count) == total:
-            print("  All approvals complete. Your wallet is ready to trade on Polymarket!")
-            print(f"  Try: client.trade(market_id, 'yes', 10.0, venue='polymarket')")
-        elif failed > 0:
-            print(f"  {failed} approval(s) failed. You can re-run set_approvals() to retry —")
-            print(f"  it will skip the ones that succeeded and only attempt the remaining.")
-            if any(d.get("error") == "reverted" for d in details):
-                print(f"\n  If approvals keep reverting, check:")
-                print(f"    1. POL balance for gas: https://polygonscan.com/address/{self._wallet_address}")
-                print(f"    2. Contact Simmer support with your wallet address.")
+        Each round signs and broadcasts every approval that needs sending,
+        then waits for receipts together. An approval with no receipt after
+        stall_timeout is replaced (same nonce, gas bumped 25% per round). A
+        reverted one is re-sent with a fresh nonce. If the node says a nonce
+        is already used, the allowance is re-checked on chain and unsent
+        approvals are re-sequenced from the chain's nonce. The last round
+        waits the usual 60s before reporting a confirmation timeout.
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait as wait_futures, FIRST_COMPLETED
+
+        MAX_RETRIES = self._APPROVAL_MAX_RETRIES
+        nonces = self._get_nonce_manager()
+        watcher = self._get_receipt_watcher()
+        total = len(missing_txs)
+        details: List[Optional[Dict[str, Any]]] = [None] * total
+
+        # One job per approval; "hashes" holds every broadcast copy (original + replacements)
+        jobs = [
+            {"i": i, "tx": tx, "desc": tx.get("description", f"Approval {i + 1}"), "nonce": None, "hashes": []}
+            for i, tx in enumerate(missing_txs)
+        ]
+        for job, nonce in zip(jobs, nonces.reserve_many(total)):
+            job["nonce"] = nonce
 
+        def _label(job: Dict[str, Any]) -> str:
+            return f"  [{job['i'] + 1}/{total}] {job['desc']}"
+
+        def _finish(job: Dict[str, Any], detail: Dict[str, Any]) -> None:
+            details[job["i"]] = {"description": job["desc"], **detail}
+
+        def _broadcast(signed_tx_hex: str) -> Dict[str, Any]:
+            try:
+                return self._request("POST", "/api/sdk/wallet/broadcast-tx", json={"signed_tx": signed_tx_hex})
+            except Exception as e:
+                return {"success": False, "error": f"{type(e).__name__}: {e}"}
+
+        to_send = list(jobs)
+        with ThreadPoolExecutor(max_workers=max(1, min(8, total))) as pool:
+            for attempt in range(MAX_RETRIES):
+                last = attempt == MAX_RETRIES - 1
+                if attempt > 0:
+                    # Fresh reading on retries (keeps the last one if the RPC fails)
+                    fees = self.gas_oracle.fees(force=True)
+                # Replacements must outbid the stuck copy: bump 25% per round
+                attempt_fees = fees.bumped(1.0 + 0.25 * attempt)
+
+                # --- Sign every pending approval, then broadcast them together ---
+                signed: List[Optional[str]] = []
+                for job in to_send:
+                    try:
+                        if job["nonce"] is None:
+                            job["nonce"] = nonces.reserve()
+                        signed.append(self._sign_approval_tx(Account, job["tx"], job["nonce"], attempt_fees))
+                    except Exception as e:
+                        signed.append(None)
+                        job["error"] = f"{type(e).__name__}: {e}"
+                results = list(pool.map(
+                    lambda tx: _broadcast(tx) if tx else {"success": False}, signed,
+                ))
+
+                retry: List[Dict[str, Any]] = []
+                consumed: List[Tuple[Dict[str, Any], str]] = []
+                gaps: List[int] = []
+                for job, result in zip(to_send, results):
+                    tx_hash = result.get("tx_hash")
+                    error = result.get("error") or job.pop("error", None) or "Unknown error"
+                    if result.get("success") and tx_hash:
+                        nonces.mark_sent(job["nonce"], tx_hash)
+                        job["hashes"].append(tx_hash)
+                        print(f"{_label(job)} — broadcast OK ({tx_hash[:18]}..., nonce {job['nonce']})")
+                    elif job["hashes"]:
+                        # Replacement refused (underpriced, already known, or the
+                        # original just mined): keep watching the copies already sent
+                        continue
+                    elif "already known" in error.lower():
+                        nonces.mark_sent(job["nonce"], "")  # In the mempool; keep it reserved
+                        print(f"{_label(job)} — already submitted")
+                        _finish(job, {"success": True, "note": "already_pending"})
+                    elif "nonce too low" in error.lower():
+                        # Some other transaction took this nonce; it says nothing about this approval
+                        print(f"{_label(job)} — nonce {job['nonce']} already used by another transaction")
+                        nonces.release(job["nonce"], error)  # Resyncs from the chain
+                        job["nonce"] = None
+                        consumed.append((job, error))
+                    elif not last:
+                        print(f"{_label(job)} — broadcast failed ({error}); retrying")
+                        retry.append(job)  # Keeps its nonce so later approvals aren't stuck behind a gap
+                    else:
+                        nonces.release(job["nonce"], error)
+                        gaps.append(job["nonce"])
+                        print(f"{_label(job)} — failed: {error}")
+                        _finish(job, {"success": False, "error": error})
+
+                if consumed:
+                    # Our count was behind the chain, so the nonces held by unsent
+                    # approvals may be taken too: hand them back (highest first)
+                    # and re-sequence from the resynced nonce next round
+                    for job in sorted((j for j in retry if not j["hashes"]), key=lambda j: j["nonce"], reverse=True):
+                        nonces.release(job["nonce"])
+                        job["nonce"] = None
+                    missing = self._missing_approvals()
+                    for job, error in consumed:
+                        if missing is not None and (job["tx"]["token"], job["tx"]["spender_address"]) not in missing:
+                            print(f"{_label(job)} — allowance already set on chain")
+                            _finish(job, {"success": True, "note": "already_set"})
+                        elif not last:
+                            print(f"{_label(job)} — allowance not set; retrying with a new nonce")
+                            retry.append(job)
+                        else:
+                            print(f"{_label(job)} — failed: {error}")
+                            _finish(job, {"success": False, "error": error})
+
+                if gaps:
+                    # Approvals broadcast above a released nonce cannot mine until it is used again
+                    gap = min(gaps)
+                    for job in jobs:
+                        if details[job["i"]] is None and job["hashes"] and job["nonce"] > gap:
+                            print(f"{_label(job)} — stuck behind failed approval (nonce {gap})")
+                            _finish(job, {
+                                "success": False, "tx_hash": job["hashes"][-1],
+                                "error": f"Not confirmed: earlier approval (nonce {gap}) failed",
+                            })
+
+                # --- Wait for receipts; whichever copy of a job mines first wins ---
+                waiting = [job for job in jobs if details[job["i"]] is None and job["hashes"] and job not in retry]
+                round_timeout = 60.0 if last else stall_timeout
+                futures = {}
+                for job in waiting:
+                    for tx_hash in job["hashes"]:
+                        futures[watcher.watch(tx_hash, round_timeout)] = (job, tx_hash)
+                if futures:
+                    print(f"  Waiting for {len(waiting)} confirmation(s)...")
+                deadline = time.monotonic() + round_timeout
+                not_done = set(futures)
+                while not_done and any(details[job["i"]] is None for job in waiting):
+                    done, not_done = wait_futures(
+                        not_done, timeout=max(0.0, deadline - time.monotonic()) + 1.0, return_when=FIRST_COMPLETED,
+                    )
+                    if not done:
+                        break
+                    for future in done:
+                        job, tx_hash = futures[future]
+                        receipt = future.result()
+                        if receipt is None or details[job["i"]] is not None or job in retry:
+                            continue
+                        nonces.confirm(job["nonce"])
+                        block_num = receipt.get("blockNumber", 0)
+                        if receipt.get("status", 0) == 1:
+                            print(f"{_label(job)} — confirmed in block {block_num} "
+                                  f"(gas used: {receipt.get('gasUsed', 0):,})")
+                            _finish(job, {"success": True, "tx_hash": tx_hash})
+                        elif not last:
+                            print(f"{_label(job)} — reverted in block {block_num}; will retry with a new nonce")
+                            job["nonce"], job["hashes"] = None, []
+                            retry.append(job)
+                        else:
+                            print(f"{_label(job)} — reverted in block {block_num}")
+                            _finish(job, {"success": False, "tx_hash": tx_hash, "error": "reverted"})
+
+                for job in waiting:
+                    if details[job["i"]] is not None or job in retry:
+                        continue
+                    if last:
+                        # Broadcast but unconfirmed — likely still pending, don't count as failed
+                        tx_hash = job["hashes"][-1]
+                        print(f"{_label(job)} — confirmation timed out. Check: https://polygonscan.com/tx/{tx_hash}")
+                        _finish(job, {"success": True, "tx_hash": tx_hash, "note": "confirmation_timeout"})
+                    else:
+                        print(f"{_label(job)} — no receipt after {stall_timeout:.0f}s; replacing with higher gas")
+                        retry.append(job)
+
+                to_send = retry
+                if not to_send:
+                    break
         print()
-        return {"set": set_count, "skipped": skipped, "failed": failed, "details": details}
+
+        set_count = sum(1 for d in details if d and d["success"])
+        failed = sum(1 for d in details if d and not d["success"])
+        return set_count, failed, [d for d in details if d]
 
     @staticmethod
     def check_for_updates(warn: bool = True) -> Dict[str, Any]:
@@ -0,0 +1,143 @@
+"""
+JSON Decoding Backends
+
+Response bodies are decoded with the fastest JSON library available:
+
+- orjson:  fastest dict decoding (pip install orjson)
+- msgspec: fast dict decoding, and can decode a market or position list
+           straight into Market / Position objects with no intermediate
+           dicts (pip install msgspec)
+- json:    standard library fallback
+
+Both are optional; install them with pip install simmer-sdk[fast].
+
+Typed decoding (JSONDecoder.decode_items) is used for get_markets() and
+get_positions(). It only applies when msgspec is installed; otherwise, or
+if a response does not match the expected types (e.g. a null price), the
+body is decoded to dicts and parsed the usual way, so results are the same
+either way.
+
+Usage:
+    decoder = JSONDecoder()              # best available
+    decoder = JSONDecoder("json")        # force the standard library
+    data = decoder.loads(response.content)
+"""
+
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# In order of preference for dict decoding
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _import_backend(name: str) -> Optional[Any]:
+    try:
+        if name == "orjson":
+            import orjson
+            return orjson
+        if name == "msgspec":
+            import msgspec
+            import msgspec.json  # noqa: F401
+            return msgspec
+    except ImportError:
+        return None
+    return json
+
+
+def available_backends() -> List[str]:
+    """Installed backends, fastest first (always ends with "json")."""
+    return [name for name in BACKENDS if _import_backend(name) is not None]
+
+
+class JSONDecoder:
+    """
+    Decodes API response bodies with a pluggable JSON backend.
+
+    Thread-safe; one instance is shared by a client and its async wrapper.
+    """
+
+    def __init__(self, backend: str = "auto", typed: bool = True):
+        """
+        Args:
+            backend: "auto" (best installed), "orjson", "msgspec" or "json"
+            typed: Decode market/position lists straight into dataclasses
+                when msgspec is installed
+
+        Raises:
+            ImportError: If the requested backend is not installed
+        """
+        if backend == "auto":
+            backend = available_backends()[0]
+        elif backend not in BACKENDS:
+            raise ValueError(f"Unknown JSON backend '{backend}'. Use one of: auto, {', '.join(BACKENDS)}")
+        module = _import_backend(backend)
+        if module is None:
+            raise ImportError(
+                f"{backend} is required for this JSON backend. "
+                f"Install with: pip install {backend}"
+            )
+        self.backend = backend
+        self._msgspec = _import_backend("msgspec") if typed else None
+        if backend == "orjson":
+            self._loads: Callable[[Union[bytes, str]], Any] = module.loads
+        elif backend == "msgspec":
+            self._loads = module.json.Decoder().decode
+        else:
+            self._loads = json.loads
+        self._typed_decoders: Dict[Tuple[str, type], Any] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"JSONDecoder(backend={self.backend!r}, typed={self._msgspec is not None})"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document into dicts and lists."""
+        return self._loads(data)
+
+    def decode_items(
+        self,
+        data: Union[bytes, str],
+        key: str,
+        item_type: type,
+        parse: Callable[[Dict[str, Any]], Any],
+    ) -> List[Any]:
+        """
+        Decode the list under data[key] into item_type objects.
+
+        With msgspec the list is decoded straight into item_type (a
+        dataclass); unknown fields are skipped without being materialized.
+        Otherwise the body is decoded to dicts and each one passed to parse.
+
+        Args:
+            data: Response body, e.g. {"markets": [...], ...}
+            key: Envelope key holding the list
+            item_type: Dataclass to build, e.g. Market
+            parse: Fallback dict -> item_type parser, e.g. _parse_market
+
+        Returns:
+            List of item_type objects ([] if key is missing)
+        """
+        if self._msgspec is not None:
+            decoder = self._typed_decoder(key, item_type)
+            try:
+                return getattr(decoder.decode(data), key)
+            except self._msgspec.ValidationError as e:
+                logger.debug("Typed decode of '%s' failed (%s), falling back to dicts", key, e)
+        raw = self.loads(data)
+        return [parse(item) for item in raw.get(key) or []]
+
+    def _typed_decoder(self, key: str, item_type: type) -> Any:
+        decoder = self._typed_decoders.get((key, item_type))
+        if decoder is None:
+            msgspec = self._msgspec
+            with self._lock:
+                envelope = msgspec.defstruct(
+                    f"{item_type.__name__}List",
+                    [(key, List[item_type], msgspec.field(default_factory=list))],
+                )
+                decoder = self._typed_decoders.setdefault((key, item_type), msgspec.json.Decoder(envelope))
+        return decoder
@@ -0,0 +1,215 @@
+"""
+Gas Price Oracle
+
+Prices EIP-1559 fees for external-wallet Polygon transactions (redemptions,
+approvals) from one shared, short-lived reading instead of an eth_gasPrice
+call per transaction.
+
+Strategies:
+- "fee_history" (default): eth_feeHistory over the last few blocks. The
+  priority fee is the chosen percentile of recent tips, and the max fee is
+  twice the next block's base fee plus that tip. Falls back to "gas_price"
+  for good if the node does not support eth_feeHistory, or for one reading
+  if the call fails.
+- "gas_price": legacy eth_gasPrice with the SDK's original formula
+  (priority = max(30 gwei, price / 4), max fee = 2 x price).
+
+Concurrent callers share one RPC round-trip: the first caller fetches while
+the others wait for its result, and the reading is reused for ``ttl`` seconds.
+
+Usage:
+    oracle = GasOracle(client.rpc)
+    fees = oracle.fees()
+    tx["maxFeePerGas"] = fees.max_fee_per_gas
+    tx["maxPriorityFeePerGas"] = fees.max_priority_fee_per_gas
+
+    retry_fees = fees.bumped(1.25)   # Replace a stuck tx
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from .rpc import PolygonRPC
+
+logger = logging.getLogger(__name__)
+
+GWEI = 1_000_000_000
+
+# Polygon validators reject tips below ~25-30 gwei
+MIN_PRIORITY_FEE = 30 * GWEI
+
+# Used only when every RPC read fails
+FALLBACK_GAS_PRICE = 50 * GWEI
+
+# JSON-RPC errors meaning the node does not offer eth_feeHistory at all
+# (-32601 is "method not found"); anything else is treated as transient
+METHOD_UNSUPPORTED_MARKERS = ("-32601", "method not found", "not supported", "does not exist", "not available")
+
+DEFAULT_TTL = 3.0
+DEFAULT_PERCENTILE = 50
+DEFAULT_BLOCKS = 5
+
+
+def _method_unsupported(error: Exception) -> bool:
+    """Whether an RPC error says the method itself is unavailable."""
+    text = str(error).lower()
+    return any(marker in text for marker in METHOD_UNSUPPORTED_MARKERS)
+
+
+@dataclass(frozen=True)
+class GasFees:
+    """
+    EIP-1559 fee quote in wei.
+
+    Attributes:
+        max_fee_per_gas: maxFeePerGas for a type-2 transaction
+        max_priority_fee_per_gas: maxPriorityFeePerGas (validator tip)
+        base_fee: Next block's base fee, when known
+        source: "fee_history", "gas_price" or "fallback"
+        fetched_at: time.monotonic() of the reading
+    """
+    max_fee_per_gas: int
+    max_priority_fee_per_gas: int
+    base_fee: Optional[int] = None
+    source: str = "gas_price"
+    fetched_at: float = 0.0
+
+    def bumped(self, factor: float) -> "GasFees":
+        """Fees scaled by factor (e.g. 1.25 to replace a pending tx)."""
+        if factor == 1.0:
+            return self
+        return GasFees(
+            max_fee_per_gas=int(self.max_fee_per_gas * factor),
+            max_priority_fee_per_gas=int(self.max_priority_fee_per_gas * factor),
+            base_fee=self.base_fee,
+            source=self.source,
+            fetched_at=self.fetched_at,
+        )
+
+    @classmethod
+    def from_gas_price(cls, gas_price: int, source: str = "gas_price") -> "GasFees":
+        """The SDK's legacy formula: 2x price headroom, tip >= 30 gwei."""
+        priority = max(MIN_PRIORITY_FEE, gas_price // 4)
+        return cls(
+            max_fee_per_gas=max(gas_price * 2, priority),
+            max_priority_fee_per_gas=priority,
+            source=source,
+            fetched_at=time.monotonic(),
+        )
+
+
+class GasOracle:
+    """
+    Cached EIP-1559 fee estimator shared by a client's transactions.
+
+    Args:
+        rpc: PolygonRPC to read from, e.g. SimmerClient.rpc
+        strategy: "fee_history" or "gas_price"
+        ttl: Seconds a reading is reused
+        percentile: Tip percentile for "fee_history" (e.g. 25 cheap, 75 fast)
+        blocks: Blocks of history to sample
+        min_priority_fee: Floor for the tip, in wei
+    """
+
+    def __init__(
+        self,
+        rpc: PolygonRPC,
+        strategy: str = "fee_history",
+        ttl: float = DEFAULT_TTL,
+        percentile: float = DEFAULT_PERCENTILE,
+        blocks: int = DEFAULT_BLOCKS,
+        min_priority_fee: int = MIN_PRIORITY_FEE,
+    ):
+        if strategy not in ("fee_history", "gas_price"):
+            raise ValueError(f"Invalid strategy '{strategy}'. Must be 'fee_history' or 'gas_price'")
+        self._rpc = rpc
+        self.strategy = strategy
+        self.ttl = ttl
+        self.percentile = percentile
+        self.blocks = blocks
+        self.min_priority_fee = min_priority_fee
+        self._lock = threading.Lock()
+        self._cached: Optional[GasFees] = None
+        self._fee_history_supported = True
+        self._reads = 0
+
+    @property
+    def reads(self) -> int:
+        """RPC readings taken so far (cache misses)."""
+        return self._reads
+
+    def fees(self, force: bool = False) -> GasFees:
+        """
+        Current fee quote, from cache if fresher than ttl.
+
+        Never raises for RPC failures: the last reading (or a 50 gwei
+        fallback) is returned instead.
+        """
+        cached = self._cached
+        if not force and cached is not None and time.monotonic() - cached.fetched_at < self.ttl:
+            return cached
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock
+            cached = self._cached
+            if not force and cached is not None and time.monotonic() - cached.fetched_at < self.ttl:
+                return cached
+            self._cached = self._read(fallback=cached)
+            return self._cached
+
+    def invalidate(self) -> None:
+        """Force a fresh reading on the next fees() call."""
+        self._cached = None
+
+    def _read(self, fallback: Optional[GasFees]) -> GasFees:
+        self._reads += 1
+        if self.strategy == "fee_history" and self._fee_history_supported:
+            try:
+                return self._from_fee_history()
+            except Exception as e:
+                if _method_unsupported(e):
+                    logger.debug("eth_feeHistory not supported (%s); using eth_gasPrice from now on", e)
+                    self._fee_history_supported = False
+                else:
+                    logger.debug("eth_feeHistory failed (%s); using eth_gasPrice for this reading", e)
+        try:
+            fees = GasFees.from_gas_price(self._rpc.gas_price())
+            if fees.max_priority_fee_per_gas < self.min_priority_fee:
+                fees = GasFees(
+                    max_fee_per_gas=max(fees.max_fee_per_gas, self.min_priority_fee),
+                    max_priority_fee_per_gas=self.min_priority_fee,
+                    source=fees.source,
+                    fetched_at=fees.fetched_at,
+                )
+            return fees
+        except Exception as e:
+            logger.warning("Could not fetch gas price: %s", e)
+            if fallback is not None:
+                return GasFees(
+                    max_fee_per_gas=fallback.max_fee_per_gas,
+                    max_priority_fee_per_gas=fallback.max_priority_fee_per_gas,
+                    base_fee=fallback.base_fee,
+                    source=fallback.source,
+                    fetched_at=time.monotonic(),
+                )
+            return GasFees.from_gas_price(FALLBACK_GAS_PRICE, source="fallback")
+
+    def _from_fee_history(self) -> GasFees:
+        history = self._rpc.fee_history(self.blocks, [self.percentile])
+        if not history["base_fee_per_gas"]:
+            raise ValueError("empty eth_feeHistory response")
+
+        # The last entry is the base fee of the next (pending) block
+        base_fee = history["base_fee_per_gas"][-1]
+        tips: List[int] = sorted(row[0] for row in history["reward"] if row)
+        tip = tips[len(tips) // 2] if tips else 0
+        priority = max(self.min_priority_fee, tip)
+        return GasFees(
+            max_fee_per_gas=2 * base_fee + priority,
+            max_priority_fee_per_gas=priority,
+            base_fee=base_fee,
+            source="fee_history",
+            fetched_at=time.monotonic(),
+        )
@@ -0,0 +1,147 @@
+"""
+HTTP/2 Transport
+
+With HTTP/1.1 every in-flight request needs its own TCP (and TLS)
+connection, so a scan that fetches contexts for dozens of markets from
+several threads opens dozens of connections. HTTP/2 multiplexes concurrent
+requests as streams over one connection.
+
+HTTP2Adapter is a requests transport adapter backed by an httpx client
+with HTTP/2 enabled. SimmerClient(http2=True) mounts it for the API base
+URL, so requests still go through the same Session, retries, rate
+limiting, caching and error types (requests.exceptions.*); only the wire
+protocol changes. AsyncSimmerClient(http2=True) enables it on its httpx
+client directly.
+
+For https URLs, HTTP/2 is negotiated during the TLS handshake (ALPN), with
+a fallback to HTTP/1.1 if the server does not offer it. Plain http URLs
+(e.g. a local test server) speak HTTP/2 with prior knowledge (h2c).
+
+Requires: httpx with HTTP/2 support (pip install simmer-sdk[http2])
+
+Usage:
+    client = SimmerClient(api_key="sk_live_...", http2=True)
+
+    # Or mount it on your own session
+    session = requests.Session()
+    session.mount("https://api.simmer.markets", HTTP2Adapter())
+"""
+
+import logging
+from typing import Any, Optional, Tuple, Union
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+TimeoutArg = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+
+def require_http2() -> Any:
+    try:
+        import httpx
+        import h2  # noqa: F401  (httpx needs it for http2=True)
+    except ImportError as e:
+        raise ImportError(
+            "HTTP/2 transport requires httpx with HTTP/2 support. "
+            "Install with: pip install simmer-sdk[http2]"
+        ) from e
+    return httpx
+
+
+def uses_prior_knowledge(url: str) -> bool:
+    """Whether url is plain http, where HTTP/2 must be spoken without negotiation (h2c)."""
+    return url.lower().startswith("http://")
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    requests adapter that sends requests over an HTTP/2 connection pool.
+
+    Thread-safe: concurrent requests from many threads share one
+    connection per host as separate streams.
+    """
+
+    def __init__(self, prior_knowledge: bool = False, max_connections: int = 10, **client_kwargs: Any):
+        """
+        Args:
+            prior_knowledge: Speak HTTP/2 without negotiation (needed for
+                plain http URLs; HTTP/1.1 is then not available)
+            max_connections: Connections per pool (HTTP/2 normally needs one
+                per host)
+            **client_kwargs: Passed to httpx.Client, e.g. verify=
+
+        Raises:
+            ImportError: If httpx or h2 is not installed
+        """
+        super().__init__()
+        httpx = require_http2()
+        self._httpx = httpx
+        self.prior_knowledge = prior_knowledge
+        self._client = httpx.Client(
+            http1=not prior_knowledge,
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            **client_kwargs,
+        )
+
+    def __repr__(self) -> str:
+        return f"HTTP2Adapter(prior_knowledge={self.prior_knowledge})"
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: TimeoutArg = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> requests.Response:
+        """
+        Send a prepared request. TLS and proxy settings come from the httpx
+        client, not from these per-request arguments; responses are always
+        read in full.
+        """
+        httpx = self._httpx
+        try:
+            response = self._client.request(
+                request.method,
+                request.url,
+                headers=list(request.headers.items()),
+                content=request.body,
+                timeout=self._timeout(timeout),
+            )
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e, request=request) from e
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ReadTimeout(e, request=request) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request) from e
+        return self._build_response(request, response)
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._client.close()
+
+    def _timeout(self, timeout: TimeoutArg) -> Any:
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return self._httpx.Timeout(read, connect=connect)
+        return self._httpx.Timeout(timeout)
+
+    @staticmethod
+    def _build_response(request: requests.PreparedRequest, response: Any) -> requests.Response:
+        built = requests.Response()
+        built.status_code = response.status_code
+        built.headers = CaseInsensitiveDict(response.headers.items())
+        built.encoding = get_encoding_from_headers(built.headers)
+        built.reason = response.reason_phrase
+        built.url = request.url
+        built.request = request
+        built.elapsed = response.elapsed
+        built._content = response.content
+        built._content_consumed = True
+        return built
@@ -0,0 +1,412 @@
+"""
+Request and Trade Instrumentation
+
+Times every HTTP call the client makes and every phase of trade(), and
+keeps a latency histogram per endpoint and per phase, so slow requests
+and slow trade phases are easy to find.
+
+- RequestEvent: one per API call, with the route (IDs replaced by {id}),
+  final HTTP status, attempts and total duration including retries.
+- PhaseEvent: one per timed step of an operation, e.g. trade's
+  wallet_link, approvals, market_fetch, sign, submit and total.
+
+Durations come from time.perf_counter(). Histograms are log-linear
+(HdrHistogram-style): bucket width is at most 1/128 of the value, so
+percentiles are within 1% at any scale while memory stays a few hundred
+counters per series.
+
+Usage:
+    client = SimmerClient(api_key="sk_live_...")  # instrumentation on by default
+    client.instrumentation.add_hook(lambda event: print(event))
+    ...
+    stats = client.instrumentation.to_dict()
+    print(stats["requests"]["POST /api/sdk/trade"]["p99_ms"])
+    print(client.instrumentation.to_prometheus())
+"""
+
+import contextvars
+import logging
+import math
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Sub-buckets per power of two; relative precision is 1 / 2**PRECISION_BITS
+PRECISION_BITS = 7
+
+# Percentiles reported by to_dict() and to_prometheus()
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+# Path segments that look like IDs (UUIDs, numbers, hashes) become {id}
+_ID_SEGMENT = re.compile(r"^(?=.*\d)[\w.:-]{6,}$|^[\w-]{32,}$")
+
+# Name of the operation (e.g. "trade") the current thread or task is inside
+_current_operation = contextvars.ContextVar("simmer_operation", default=None)
+
+
+def endpoint_route(endpoint: str) -> str:
+    """Endpoint with query string dropped and IDs templated, e.g. /api/sdk/markets/{id}."""
+    path = endpoint.split("?", 1)[0]
+    return "/".join("{id}" if _ID_SEGMENT.match(seg) else seg for seg in path.split("/"))
+
+
+@dataclass
+class RequestEvent:
+    """One API call, from first attempt to final response or error."""
+    method: str
+    endpoint: str  # Route, e.g. /api/sdk/markets/{id}
+    status: Optional[int]  # Final HTTP status (None if no response)
+    duration: float  # Seconds, including retries and backoff
+    attempts: int = 1
+    error: Optional[str] = None  # Exception type name if the call raised
+    operation: Optional[str] = None  # Enclosing operation, e.g. "trade"
+    started: float = 0.0  # time.perf_counter() at the first attempt
+
+
+@dataclass
+class PhaseEvent:
+    """One timed step of an operation (phase "total" covers the whole operation)."""
+    operation: str
+    phase: str
+    duration: float  # Seconds
+    started: float = 0.0  # time.perf_counter() at the start of the phase
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+
+Event = Union[RequestEvent, PhaseEvent]
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram (HdrHistogram layout).
+
+    Values are recorded as integer microseconds. Below 2 * 2**bits every
+    microsecond has its own bucket; above that, each power of two is split
+    into 2**bits buckets. Not thread-safe; Instrumentation locks around it.
+    """
+
+    def __init__(self, precision_bits: int = PRECISION_BITS):
+        self._bits = precision_bits
+        self._sub = 1 << precision_bits
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one value in seconds."""
+        us = int(seconds * 1e6)
+        if us < 0:
+            us = 0
+        if us < self._sub << 1:
+            index = us
+        else:
+            shift = us.bit_length() - self._bits - 1
+            index = shift * self._sub + (us >> shift)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def _upper(self, index: int) -> float:
+        """Highest value (seconds) that lands in bucket index."""
+        if index < self._sub << 1:
+            return (index + 1) / 1e6
+        shift = index // self._sub - 1
+        mantissa = index - shift * self._sub
+        return ((mantissa + 1) << shift) / 1e6
+
+    def percentile(self, q: float) -> float:
+        """Value (seconds) at quantile q in [0, 1]; 0.0 when empty."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self._upper(index), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's counts (same precision)."""
+        if other._bits != self._bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        for index, n in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def summary(self) -> Dict[str, float]:
+        """count, mean, min, percentiles and max (milliseconds)."""
+        stats: Dict[str, float] = {
+            "count": self.count,
+            "mean_ms": self.mean * 1e3,
+            "min_ms": self.min * 1e3 if self.count else 0.0,
+        }
+        for q in QUANTILES:
+            stats[f"p{_quantile_label(q)}_ms"] = self.percentile(q) * 1e3
+        stats["max_ms"] = self.max * 1e3
+        return stats
+
+
+def _quantile_label(q: float) -> str:
+    """0.5 -> "50", 0.99 -> "99", 0.999 -> "999"."""
+    return f"{q * 100:g}".replace(".", "")
+
+
+class _RequestSeries:
+    __slots__ = ("histogram", "statuses", "errors", "retries")
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.statuses: Dict[str, int] = {}
+        self.errors = 0
+        self.retries = 0
+
+
+class _Phase:
+    """Context manager timing one phase; see Instrumentation.phase()."""
+    __slots__ = ("_owner", "_operation", "_phase", "_attrs", "_started", "_token")
+
+    def __init__(self, owner: "Instrumentation", operation: Optional[str], phase: str, attrs: Dict[str, Any]):
+        self._owner = owner
+        self._operation = operation
+        self._phase = phase
+        self._attrs = attrs
+        self._token = None
+
+    def __enter__(self) -> "_Phase":
+        if self._operation is not None and self._phase == "total":
+            self._token = _current_operation.set(self._operation)
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        duration = time.perf_counter() - self._started
+        if self._token is not None:
+            _current_operation.reset(self._token)
+        operation = self._operation or _current_operation.get()
+        if operation is None:
+            return  # Phase outside any operation (e.g. signing for a presigned pool)
+        if exc_type is not None:
+            self._attrs["error"] = exc_type.__name__
+        self._owner.record_phase(operation, self._phase, duration, self._started, self._attrs)
+
+
+class Instrumentation:
+    """
+    Collects request and phase timings, feeds hooks and keeps histograms.
+
+    Thread-safe. Hooks run synchronously on the calling thread; keep them
+    fast. A hook that raises is logged and otherwise ignored.
+    """
+
+    def __init__(self, histograms: bool = True):
+        """
+        Args:
+            histograms: Keep per-endpoint and per-phase histograms. Set False
+                to only forward events to hooks.
+        """
+        self.histograms = histograms
+        self._lock = threading.Lock()
+        self._hooks: Tuple[Callable[[Event], None], ...] = ()
+        self._requests: Dict[Tuple[str, str], _RequestSeries] = {}
+        self._phases: Dict[Tuple[str, str], LatencyHistogram] = {}
+
+    # ------------------------------------------------------------------
+    # Hooks
+    # ------------------------------------------------------------------
+
+    def add_hook(self, hook: Callable[[Event], None]) -> None:
+        """Call hook(event) for every RequestEvent and PhaseEvent."""
+        with self._lock:
+            self._hooks = self._hooks + (hook,)
+
+    def remove_hook(self, hook: Callable[[Event], None]) -> None:
+        with self._lock:
+            self._hooks = tuple(h for h in self._hooks if h is not hook)
+
+    def _emit(self, event: Event) -> None:
+        for hook in self._hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Instrumentation hook %r failed", hook)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def operation(self, name: str, **attrs: Any) -> _Phase:
+        """
+        Time a whole operation (recorded as phase "total").
+
+        Phases and requests inside the with-block are tagged with the
+        operation name, including across awaits in the same task.
+
+        Example:
+            with instrumentation.operation("trade", venue="polymarket"):
+                with instrumentation.phase("sign"):
+                    ...
+        """
+        return _Phase(self, name, "total", attrs)
+
+    def phase(self, name: str, **attrs: Any) -> _Phase:
+        """Time one phase of the current operation (not recorded outside one)."""
+        return _Phase(self, None, name, attrs)
+
+    def record_request(
+        self,
+        method: str,
+        endpoint: str,
+        status: Optional[int],
+        duration: float,
+        attempts: int = 1,
+        error: Optional[str] = None,
+        started: float = 0.0,
+    ) -> None:
+        """Record one API call (endpoint may be a raw path; it is templated here)."""
+        route = endpoint_route(endpoint)
+        if self.histograms:
+            with self._lock:
+                series = self._requests.get((method, route))
+                if series is None:
+                    series = self._requests[(method, route)] = _RequestSeries()
+                series.histogram.record(duration)
+                label = str(status) if status is not None else "error"
+                series.statuses[label] = series.statuses.get(label, 0) + 1
+                series.retries += attempts - 1
+                if error is not None:
+                    series.errors += 1
+        if self._hooks:
+            self._emit(RequestEvent(
+                method=method, endpoint=route, status=status, duration=duration, attempts=attempts,
+                error=error, operation=_current_operation.get(), started=started,
+            ))
+
+    def record_phase(
+        self,
+        operation: str,
+        phase: str,
+        duration: float,
+        started: float = 0.0,
+        attrs: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record one operation phase measured elsewhere (e.g. Kalshi stage timings)."""
+        if self.histograms:
+            with self._lock:
+                histogram = self._phases.get((operation, phase))
+                if histogram is None:
+                    histogram = self._phases[(operation, phase)] = LatencyHistogram()
+                histogram.record(duration)
+        if self._hooks:
+            self._emit(PhaseEvent(operation=operation, phase=phase, duration=duration,
+                                  started=started, attrs=attrs or {}))
+
+    def reset(self) -> None:
+        """Clear all histograms and counters (hooks are kept)."""
+        with self._lock:
+            self._requests.clear()
+            self._phases.clear()
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def request_histogram(self, method: str, endpoint: str) -> Optional[LatencyHistogram]:
+        """Histogram for one route, e.g. ("POST", "/api/sdk/trade")."""
+        series = self._requests.get((method, endpoint_route(endpoint)))
+        return series.histogram if series else None
+
+    def phase_histogram(self, operation: str, phase: str) -> Optional[LatencyHistogram]:
+        """Histogram for one phase, e.g. ("trade", "sign")."""
+        return self._phases.get((operation, phase))
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Latency summaries in milliseconds.
+
+        Returns:
+            {"requests": {"POST /api/sdk/trade": {...}}, "phases": {"trade.sign": {...}}}
+            where each summary has count, mean_ms, min_ms, p50_ms, p90_ms,
+            p99_ms, p999_ms and max_ms; requests also have errors, retries
+            and a per-status count.
+        """
+        with self._lock:
+            requests = {}
+            for (method, route), series in sorted(self._requests.items()):
+                stats: Dict[str, Any] = series.histogram.summary()
+                stats["errors"] = series.errors
+                stats["retries"] = series.retries
+                stats["statuses"] = dict(series.statuses)
+                requests[f"{method} {route}"] = stats
+            phases = {
+                f"{operation}.{phase}": histogram.summary()
+                for (operation, phase), histogram in sorted(self._phases.items())
+            }
+        return {"requests": requests, "phases": phases}
+
+    def to_prometheus(self, prefix: str = "simmer") -> str:
+        """
+        Prometheus text exposition format (summaries and counters).
+
+        Metrics:
+            <prefix>_request_duration_seconds{method,endpoint,quantile}
+            <prefix>_requests_total{method,endpoint,status}
+            <prefix>_request_retries_total{method,endpoint}
+            <prefix>_phase_duration_seconds{operation,phase,quantile}
+        """
+        lines: List[str] = []
+        with self._lock:
+            requests = sorted(self._requests.items())
+            phases = sorted(self._phases.items())
+
+            name = f"{prefix}_request_duration_seconds"
+            lines += [f"# HELP {name} API request latency including retries.", f"# TYPE {name} summary"]
+            for (method, route), series in requests:
+                labels = f'method="{method}",endpoint="{_escape(route)}"'
+                lines += _summary_lines(name, labels, series.histogram)
+
+            name = f"{prefix}_requests_total"
+            lines += [f"# HELP {name} API requests by final HTTP status.", f"# TYPE {name} counter"]
+            for (method, route), series in requests:
+                for status, count in sorted(series.statuses.items()):
+                    lines.append(f'{name}{{method="{method}",endpoint="{_escape(route)}",status="{status}"}} {count}')
+
+            name = f"{prefix}_request_retries_total"
+            lines += [f"# HELP {name} API request retries.", f"# TYPE {name} counter"]
+            for (method, route), series in requests:
+                lines.append(f'{name}{{method="{method}",endpoint="{_escape(route)}"}} {series.retries}')
+
+            name = f"{prefix}_phase_duration_seconds"
+            lines += [f"# HELP {name} Latency of operation phases such as trade signing.", f"# TYPE {name} summary"]
+            for (operation, phase), histogram in phases:
+                labels = f'operation="{_escape(operation)}",phase="{_escape(phase)}"'
+                lines += _summary_lines(name, labels, histogram)
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _summary_lines(name: str, labels: str, histogram: LatencyHistogram) -> List[str]:
+    lines = [f'{name}{{{labels},quantile="{q:g}"}} {histogram.percentile(q):.6f}' for q in QUANTILES]
+    lines.append(f"{name}_sum{{{labels}}} {histogram.total:.6f}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
@@ -0,0 +1,98 @@
+"""
+Connection Keep-Alive
+
+Servers and load balancers close HTTP connections that sit idle for too
+long (often 60 seconds), so a bot that trades once every few minutes pays
+DNS, TCP and TLS setup again on its most latency-sensitive request. KeepAlive
+runs a small ping from a daemon thread whenever the connection has been idle
+for `interval` seconds, so pooled connections stay open.
+
+Pings are skipped while real traffic keeps the connection busy: call
+touch() after each request and the next ping is pushed back.
+
+Usage:
+    keepalive = KeepAlive(ping=lambda: session.head(url), interval=30.0).start()
+    ...
+    keepalive.touch()   # after each real request
+    ...
+    keepalive.stop()
+
+SimmerClient wires this up for you (keepalive_interval=, start_keepalive()).
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Below common idle timeouts (AWS ALB / nginx: 60s)
+DEFAULT_INTERVAL = 30.0
+
+
+class KeepAlive:
+    """Calls ping() from a daemon thread after `interval` idle seconds."""
+
+    def __init__(self, ping: Callable[[], Any], interval: float = DEFAULT_INTERVAL):
+        """
+        Args:
+            ping: Cheap request over the connections to keep open. Exceptions
+                are logged and the next ping is tried after another interval.
+            interval: Idle seconds before a ping
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.ping = ping
+        self.interval = interval
+        self._last_activity = time.monotonic()
+        self._pings = 0
+        self._failures = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def pings(self) -> int:
+        """Pings sent so far (including failed ones)."""
+        return self._pings
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    def touch(self) -> None:
+        """Record activity on the connection; postpones the next ping."""
+        self._last_activity = time.monotonic()
+
+    def start(self) -> "KeepAlive":
+        """Start the ping thread (no-op if it is already running)."""
+        if not self.running:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="simmer-keepalive", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the ping thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            idle_for = time.monotonic() - self._last_activity
+            if idle_for < self.interval:
+                self._stop.wait(self.interval - idle_for)
+                continue
+            self._pings += 1
+            try:
+                self.ping()
+            except Exception as e:
+                self._failures += 1
+                logger.debug("Keep-alive ping failed: %s", e)
+            self.touch()
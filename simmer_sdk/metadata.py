@@ -0,0 +1,160 @@
+"""
+Market Metadata Cache
+
+Caches the static Polymarket fields that local order signing needs
+(token IDs, neg-risk flag, tick size, fee rate) separately from volatile
+prices. With metadata cached and a price supplied by the caller, a locally
+signed trade needs no market lookup at all.
+
+The cache lives in memory and can optionally be persisted to a JSON file,
+so a bot that restarts every cycle keeps its metadata between runs. Tick
+size and fee rate can change while a market is open, so entries expire
+after max_age, and SimmerClient.trade() refetches them once when the
+exchange rejects an order for its tick size or fee.
+
+Usage:
+    client = SimmerClient(api_key="...", venue="polymarket",
+                          market_metadata_path="~/.simmer/market_metadata.json")
+    client.warm_market_metadata([m.id for m in markets])
+
+    # Signed with cached metadata, no GET /api/sdk/markets/{id}
+    client.trade(market_id, "yes", 10.0, price=0.42)
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds before cached metadata is refetched (tick size and fee rate can change)
+DEFAULT_MAX_AGE = 900.0
+
+# Order rejections that mean the cached tick size or fee rate is out of date
+STALE_METADATA_MARKERS = ("tick size", "tick_size", "fee rate", "fee_rate", "feerate")
+
+
+def is_stale_metadata_error(error: Any) -> bool:
+    """Whether an order rejection points at an outdated tick size or fee rate."""
+    text = str(error or "").lower()
+    return any(marker in text for marker in STALE_METADATA_MARKERS)
+
+
+@dataclass(frozen=True)
+class MarketMetadata:
+    """Static Polymarket fields needed to sign an order for a market."""
+    market_id: str
+    yes_token_id: str
+    no_token_id: str
+    neg_risk: bool = False
+    tick_size: float = 0.01
+    fee_rate_bps: int = 0
+    fetched_at: float = 0.0
+
+    @classmethod
+    def from_market_data(cls, market_id: str, market_data: Dict[str, Any]) -> Optional["MarketMetadata"]:
+        """Extract metadata from a /api/sdk/markets/{id} market dict (None if not a Polymarket market)."""
+        yes_token = market_data.get("polymarket_token_id")
+        no_token = market_data.get("polymarket_no_token_id")
+        if not yes_token or not no_token:
+            return None
+        return cls(
+            market_id=market_id,
+            yes_token_id=yes_token,
+            no_token_id=no_token,
+            neg_risk=bool(market_data.get("polymarket_neg_risk", False)),
+            tick_size=market_data.get("tick_size", 0.01),
+            fee_rate_bps=market_data.get("fee_rate_bps", 0),
+            fetched_at=time.time(),
+        )
+
+    def token_id(self, side: str) -> str:
+        """Token ID for 'yes' or 'no'."""
+        return self.yes_token_id if side.lower() == "yes" else self.no_token_id
+
+
+class MarketMetadataCache:
+    """Thread-safe market metadata store with optional JSON persistence."""
+
+    def __init__(self, path: Optional[str] = None, max_age: Optional[float] = DEFAULT_MAX_AGE):
+        """
+        Args:
+            path: JSON file to load from and save to (None = memory only)
+            max_age: Seconds before an entry is refetched (None = never).
+                Token IDs and neg-risk never change for a market, but tick
+                size and fee rate can.
+        """
+        self.path = os.path.expanduser(path) if path else None
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._entries: Dict[str, MarketMetadata] = {}
+        if self.path:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, market_id: str) -> bool:
+        return self.get(market_id) is not None
+
+    def get(self, market_id: str) -> Optional[MarketMetadata]:
+        """Cached metadata for a market, or None if missing or expired."""
+        entry = self._entries.get(market_id)
+        if entry is None:
+            return None
+        if self.max_age is not None and time.time() - entry.fetched_at > self.max_age:
+            return None
+        return entry
+
+    def put(self, metadata: MarketMetadata) -> None:
+        """Store one entry (and persist if a path is configured)."""
+        self.put_many([metadata])
+
+    def put_many(self, entries: Iterable[MarketMetadata]) -> None:
+        """Store several entries with a single save."""
+        with self._lock:
+            changed = False
+            for m in entries:
+                if self._entries.get(m.market_id) != m:
+                    self._entries[m.market_id] = m
+                    changed = True
+            if changed and self.path:
+                self._save()
+
+    def discard(self, market_id: str) -> None:
+        """Forget a market (e.g. after an order was rejected for its tick size or fee)."""
+        with self._lock:
+            if self._entries.pop(market_id, None) is not None and self.path:
+                self._save()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path) as f:
+                raw = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable market metadata cache %s: %s", self.path, e)
+            return
+        for market_id, fields in raw.items():
+            try:
+                self._entries[market_id] = MarketMetadata(**fields)
+            except TypeError:
+                continue  # Entry written by an incompatible SDK version
+
+    def _save(self) -> None:
+        """Write atomically so a crash never leaves a truncated file. Caller holds the lock."""
+        directory = os.path.dirname(self.path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=".market_metadata.")
+            with os.fdopen(fd, "w") as f:
+                json.dump({k: asdict(v) for k, v in self._entries.items()}, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning("Could not persist market metadata cache to %s: %s", self.path, e)
@@ -0,0 +1,243 @@
+"""
+Nonce Manager
+
+Hands out Polygon transaction nonces for an external wallet locally, so
+several transactions can be signed and broadcast back to back without
+waiting for each receipt and without two of them reusing a nonce.
+
+The manager syncs with the chain's pending transaction count on first use,
+then counts locally. A nonce handed back unused is reissued before any new
+one, so a failed broadcast never leaves a gap that stalls later
+transactions. When the node rejects a nonce, the manager resyncs from the
+chain.
+Reservations that have been broadcast but not yet mined can be persisted to
+a JSON file, so a restarted bot does not reuse a nonce whose transaction is
+still in the mempool.
+
+Usage:
+    manager = NonceManager(address, fetch_pending_nonce)
+    nonce = manager.reserve()
+    try:
+        tx_hash = broadcast(sign(tx, nonce))
+    except Exception:
+        manager.release(nonce)   # Not sent: hand the nonce back
+        raise
+    manager.mark_sent(nonce, tx_hash)
+    ...
+    manager.confirm(nonce)       # Receipt seen
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Node errors that mean our local count disagrees with the chain
+NONCE_ERROR_MARKERS = ("nonce too low", "nonce too high", "invalid nonce")
+
+# Forget persisted in-flight reservations older than this (seconds)
+DEFAULT_IN_FLIGHT_TTL = 3600.0
+
+
+def is_nonce_error(error: Any) -> bool:
+    """Whether a broadcast error means the nonce was wrong or already taken."""
+    text = str(error).lower()
+    return any(marker in text for marker in NONCE_ERROR_MARKERS)
+
+
+class NonceManager:
+    """
+    Thread-safe nonce allocator for one wallet.
+
+    Example:
+        manager = NonceManager(address, lambda: int(rpc("eth_getTransactionCount", [address, "pending"]), 16))
+        first, second, third = manager.reserve_many(3)
+    """
+
+    def __init__(
+        self,
+        address: str,
+        fetch_pending_nonce: Optional[Callable[[], int]] = None,
+        path: Optional[str] = None,
+        in_flight_ttl: float = DEFAULT_IN_FLIGHT_TTL,
+    ):
+        """
+        Args:
+            address: Wallet address the nonces belong to
+            fetch_pending_nonce: Returns eth_getTransactionCount(address, "pending");
+                may be omitted if every reserve() call passes chain_nonce
+            path: JSON file for in-flight reservations (None = memory only)
+            in_flight_ttl: Seconds after which a persisted reservation is dropped
+        """
+        self.address = address.lower()
+        self._fetch = fetch_pending_nonce
+        self.path = os.path.expanduser(path) if path else None
+        self.in_flight_ttl = in_flight_ttl
+        self._lock = threading.Lock()
+        self._next: Optional[int] = None  # None = sync from chain before next reservation
+        self._stale = True
+        self._free: Set[int] = set()  # Released below _next; reissued first
+        self._in_flight: Dict[int, Dict[str, Any]] = {}
+        if self.path:
+            self._load()
+
+    @property
+    def needs_sync(self) -> bool:
+        """True if the next reserve() will query the chain (async callers fetch first)."""
+        return self._stale
+
+    @property
+    def in_flight(self) -> Dict[int, Dict[str, Any]]:
+        """Reserved or broadcast nonces not yet confirmed: {nonce: {"reserved_at", "tx_hash"}}."""
+        with self._lock:
+            return {n: dict(v) for n, v in self._in_flight.items()}
+
+    def reserve(self, chain_nonce: Optional[int] = None) -> int:
+        """
+        Reserve the next nonce.
+
+        Args:
+            chain_nonce: The chain's pending nonce if the caller already has
+                it (e.g. from a backend-built unsigned tx); saves an RPC call
+
+        Returns:
+            A nonce no other caller of this manager will receive
+        """
+        return self.reserve_many(1, chain_nonce)[0]
+
+    def reserve_many(self, count: int, chain_nonce: Optional[int] = None) -> List[int]:
+        """Reserve ``count`` nonces, lowest first (consecutive unless earlier ones were released)."""
+        with self._lock:
+            if self._stale or chain_nonce is not None:
+                if chain_nonce is None:
+                    chain_nonce = self._fetch_chain_nonce()
+                self._sync_locked(chain_nonce)
+            nonces = sorted(self._free)[:count]
+            self._free.difference_update(nonces)
+            start = self._next
+            self._next = start + count - len(nonces)
+            nonces.extend(range(start, self._next))
+            now = time.time()
+            for n in nonces:
+                self._in_flight[n] = {"reserved_at": now, "tx_hash": None}
+            self._save_locked()
+        return nonces
+
+    def mark_sent(self, nonce: int, tx_hash: str) -> None:
+        """Record that a reserved nonce was broadcast as tx_hash."""
+        with self._lock:
+            entry = self._in_flight.setdefault(nonce, {"reserved_at": time.time()})
+            entry["tx_hash"] = tx_hash
+            self._save_locked()
+
+    def confirm(self, nonce: int) -> None:
+        """Forget a nonce whose transaction was mined."""
+        with self._lock:
+            if self._in_flight.pop(nonce, None) is not None:
+                self._save_locked()
+
+    def release(self, nonce: int, error: Any = None) -> None:
+        """
+        Hand back a nonce that was never broadcast.
+
+        The nonce is reissued to the next reserve() call. If ``error`` is a
+        node error saying the nonce was wrong, the manager resyncs from the
+        chain instead.
+        """
+        with self._lock:
+            self._in_flight.pop(nonce, None)
+            if is_nonce_error(error or "") or self._next is None:
+                self._stale = True
+            elif nonce == self._next - 1:
+                self._next = nonce
+                while self._next - 1 in self._free:
+                    self._next -= 1
+                    self._free.discard(self._next)
+            elif nonce < self._next:
+                self._free.add(nonce)
+            self._save_locked()
+
+    def resync(self, chain_nonce: Optional[int] = None) -> int:
+        """Re-read the pending nonce from the chain now. Returns the next nonce to hand out."""
+        with self._lock:
+            if chain_nonce is None:
+                chain_nonce = self._fetch_chain_nonce()
+            self._stale = True
+            self._sync_locked(chain_nonce)
+            self._save_locked()
+            return self._next
+
+    def invalidate(self) -> None:
+        """Resync from the chain before the next reservation."""
+        with self._lock:
+            self._stale = True
+
+    def _fetch_chain_nonce(self) -> int:
+        if self._fetch is None:
+            raise ValueError("NonceManager has no fetch_pending_nonce; pass chain_nonce")
+        return int(self._fetch())
+
+    def _sync_locked(self, chain_nonce: int) -> None:
+        """Fold a chain reading into local state. Caller holds the lock."""
+        now = time.time()
+        # Anything below the chain's pending count is mined or in the mempool
+        for n in [n for n, v in self._in_flight.items()
+                  if n < chain_nonce or now - v.get("reserved_at", now) > self.in_flight_ttl]:
+            del self._in_flight[n]
+
+        if self._stale:
+            # Trust the chain, but never hand out a nonce another thread still
+            # holds; anything between the chain count and our held nonces is free
+            self._next = max([chain_nonce] + [n + 1 for n in self._in_flight])
+            self._free = set(range(chain_nonce, self._next)) - set(self._in_flight)
+            self._stale = False
+        else:
+            self._next = max(self._next or 0, chain_nonce)
+            self._free = {n for n in self._free if n >= chain_nonce}
+
+    def _load(self) -> None:
+        try:
+            with open(self.path) as f:
+                raw = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable nonce state %s: %s", self.path, e)
+            return
+        entries = raw.get(self.address, {}).get("in_flight", {})
+        for nonce, entry in entries.items():
+            # A reservation that was never broadcast died with the old process
+            if not isinstance(entry, dict) or entry.get("tx_hash") is None:
+                continue
+            try:
+                self._in_flight[int(nonce)] = dict(entry)
+            except (TypeError, ValueError):
+                continue
+
+    def _save_locked(self) -> None:
+        """Persist this wallet's in-flight reservations atomically. Caller holds the lock."""
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path) or "."
+        try:
+            try:
+                with open(self.path) as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = {}
+            # Only broadcast nonces matter after a restart; unsent ones are reissued
+            state[self.address] = {"in_flight": {
+                str(n): v for n, v in self._in_flight.items() if v.get("tx_hash") is not None
+            }}
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=".nonces.")
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning("Could not persist nonce state to %s: %s", self.path, e)
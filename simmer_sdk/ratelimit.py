@@ -0,0 +1,240 @@
+"""
+Client-Side Rate Limiting
+
+Token-bucket rate limiter that SimmerClient consults before every request,
+so several bots sharing one API key queue locally instead of tripping the
+server's rate limits and getting 429s.
+
+Requests are grouped into endpoint classes, each with its own bucket:
+- "trade": order submission, redemption and tx broadcast
+- "rpc":   the Polygon JSON-RPC proxy (/api/rpc/polygon)
+- "read":  everything else (market data, positions, settings, alerts, ...)
+
+Buckets are reservation-based: a request always takes a token, and if the
+bucket is empty it is told how long to wait for its turn. Waiters are
+therefore served in arrival order without spinning.
+
+Backends:
+- MemoryBackend: shared by all clients in one process (default)
+- FileLockBackend: shared by every process on the machine via a small JSON
+  state file guarded by an fcntl lock (POSIX only)
+
+Usage:
+    from simmer_sdk import SimmerClient, RateLimiter
+
+    # One budget for every client in this process using this key
+    client = SimmerClient(api_key=key, rate_limiter=True)
+
+    # One budget for every process on this machine using this key
+    limiter = RateLimiter.shared(key, cross_process=True)
+    client = SimmerClient(api_key=key, rate_limiter=limiter)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+# Endpoint classes
+READ = "read"
+TRADE = "trade"
+RPC = "rpc"
+
+# Write endpoints that count against the trade bucket
+TRADE_ENDPOINT_PREFIXES = (
+    "/api/sdk/trade",
+    "/api/sdk/redeem",
+    "/api/sdk/wallet/broadcast-tx",
+)
+
+RPC_ENDPOINT_PREFIX = "/api/rpc/"
+
+
+@dataclass(frozen=True)
+class BucketConfig:
+    """
+    Token-bucket parameters.
+
+    Attributes:
+        rate: Tokens added per second (sustained requests/second)
+        burst: Bucket capacity (requests allowed back-to-back when idle)
+    """
+    rate: float
+    burst: float
+
+
+# Conservative defaults; raise them if your plan allows more
+DEFAULT_LIMITS: Dict[str, BucketConfig] = {
+    READ: BucketConfig(rate=10.0, burst=20),
+    TRADE: BucketConfig(rate=2.0, burst=5),
+    RPC: BucketConfig(rate=10.0, burst=20),
+}
+
+
+def classify_endpoint(method: str, endpoint: str) -> str:
+    """Map a request to its rate-limit class ("read", "trade" or "rpc")."""
+    path = endpoint.split("?", 1)[0]
+    if path.startswith(RPC_ENDPOINT_PREFIX):
+        return RPC
+    if method.upper() != "GET" and path.startswith(TRADE_ENDPOINT_PREFIXES):
+        return TRADE
+    return READ
+
+
+def _reserve(state: Optional[Tuple[float, float]], config: BucketConfig, now: float) -> Tuple[Tuple[float, float], float]:
+    """
+    Take one token from a bucket.
+
+    Args:
+        state: (tokens, last_update) or None for a fresh (full) bucket
+
+    Returns:
+        (new_state, seconds the caller must wait before proceeding)
+    """
+    if state is None:
+        tokens, updated = float(config.burst), now
+    else:
+        tokens, updated = state
+    tokens = min(float(config.burst), tokens + (now - updated) * config.rate)
+    tokens -= 1.0
+    wait = 0.0 if tokens >= 0 else -tokens / config.rate
+    return (tokens, now), wait
+
+
+class MemoryBackend:
+    """Bucket state held in this process, guarded by a thread lock."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: Dict[str, Tuple[float, float]] = {}
+
+    def reserve(self, bucket: str, config: BucketConfig) -> float:
+        with self._lock:
+            self._state[bucket], wait = _reserve(self._state.get(bucket), config, time.time())
+        return wait
+
+
+class FileLockBackend:
+    """
+    Bucket state shared across processes through a JSON file.
+
+    Every reservation takes an exclusive fcntl lock on the file, reads the
+    bucket, refills it by elapsed wall-clock time, takes a token and writes
+    it back. The critical section is a few microseconds of file I/O.
+    """
+
+    def __init__(self, path: str):
+        try:
+            import fcntl  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "FileLockBackend requires fcntl (Linux/macOS). "
+                "Use the default in-process backend on this platform."
+            ) from e
+        self.path = path
+        self._thread_lock = threading.Lock()
+
+    def reserve(self, bucket: str, config: BucketConfig) -> float:
+        import fcntl
+
+        with self._thread_lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                raw = b""
+                while True:
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        break
+                    raw += chunk
+                try:
+                    state = json.loads(raw) if raw else {}
+                except ValueError:
+                    state = {}  # Corrupt/partial file: start with full buckets
+
+                prev = state.get(bucket)
+                new_state, wait = _reserve(tuple(prev) if prev else None, config, time.time())
+                state[bucket] = list(new_state)
+
+                data = json.dumps(state).encode()
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, data)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+        return wait
+
+
+class RateLimiter:
+    """
+    Per-endpoint-class token-bucket limiter.
+
+    Example:
+        limiter = RateLimiter(limits={"trade": BucketConfig(rate=1, burst=3)})
+        waited = limiter.acquire("POST", "/api/sdk/trade")
+    """
+
+    def __init__(self, limits: Optional[Dict[str, BucketConfig]] = None, backend=None):
+        """
+        Args:
+            limits: Bucket config per endpoint class; missing classes use
+                DEFAULT_LIMITS
+            backend: MemoryBackend (default) or FileLockBackend
+        """
+        self.limits = dict(DEFAULT_LIMITS)
+        if limits:
+            self.limits.update(limits)
+        self.backend = backend or MemoryBackend()
+
+    def reserve(self, method: str, endpoint: str) -> float:
+        """Take a token for this request; return seconds to wait before sending."""
+        bucket = classify_endpoint(method, endpoint)
+        config = self.limits.get(bucket)
+        if config is None:
+            return 0.0
+        return self.backend.reserve(bucket, config)
+
+    def acquire(self, method: str, endpoint: str) -> float:
+        """Block until this request may be sent. Returns seconds waited."""
+        wait = self.reserve(method, endpoint)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    _shared: Dict[Tuple[str, bool], "RateLimiter"] = {}
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(
+        cls,
+        api_key: str,
+        limits: Optional[Dict[str, BucketConfig]] = None,
+        cross_process: bool = False,
+        state_dir: Optional[str] = None,
+    ) -> "RateLimiter":
+        """
+        Get the limiter shared by every client using this API key.
+
+        Args:
+            api_key: SDK API key (only a hash of it is used as the identity)
+            limits: Bucket configs, applied when the limiter is first created
+            cross_process: Share the budget with other processes on this
+                machine via a lock file
+            state_dir: Directory for the lock file (default: system temp dir)
+        """
+        key_id = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        with cls._shared_lock:
+            limiter = cls._shared.get((key_id, cross_process))
+            if limiter is None:
+                backend = None
+                if cross_process:
+                    path = os.path.join(state_dir or tempfile.gettempdir(), f"simmer-ratelimit-{key_id}.json")
+                    backend = FileLockBackend(path)
+                limiter = cls(limits=limits, backend=backend)
+                cls._shared[(key_id, cross_process)] = limiter
+        return limiter
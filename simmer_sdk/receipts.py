@@ -0,0 +1,189 @@
+"""
+Transaction Receipt Watcher
+
+Waits for Polygon transaction receipts without a sleep-poll loop per
+transaction. One background thread polls every pending hash with a single
+PolygonRPC batch per tick and resolves a Future per hash, so N pending
+transactions cost one request per tick instead of N.
+
+The poll interval adapts: it starts short after a new hash is watched or a
+receipt arrives, then backs off while nothing changes.
+
+Usage:
+    watcher = ReceiptWatcher(client.rpc)
+    future = watcher.watch(tx_hash)            # concurrent.futures.Future
+    receipt = future.result()                  # decoded dict, or None on timeout
+    receipt["status"]                          # 1 = success (ints, not hex)
+
+    receipts = watcher.wait([h1, h2, h3])      # {tx_hash: receipt or None}
+
+    receipt = await watcher.wait_async(tx_hash)  # from asyncio code
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .rpc import PolygonRPC
+
+logger = logging.getLogger(__name__)
+
+# Polygon produces a block roughly every 2 seconds
+DEFAULT_MIN_INTERVAL = 1.0
+DEFAULT_MAX_INTERVAL = 4.0
+DEFAULT_TIMEOUT = 60.0
+
+# Multiplier applied to the interval after a tick with no new receipts
+BACKOFF_FACTOR = 1.5
+
+
+class ReceiptWatcher:
+    """
+    Shared, thread-safe receipt poller.
+
+    Args:
+        rpc: PolygonRPC used for the batched eth_getTransactionReceipt polls
+        min_interval: Seconds between polls while receipts are arriving
+        max_interval: Upper bound for the backed-off poll interval
+        timeout: Default seconds to wait for a receipt before resolving to None
+    """
+
+    def __init__(
+        self,
+        rpc: PolygonRPC,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self._rpc = rpc
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Tuple[Future, float, float]] = {}  # tx_hash -> (future, deadline, watched_at)
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._polls = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of hashes still being watched."""
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def polls(self) -> int:
+        """Batch requests sent so far."""
+        return self._polls
+
+    def watch(self, tx_hash: str, timeout: Optional[float] = None) -> Future:
+        """
+        Start watching a transaction.
+
+        Returns:
+            Future resolving to the decoded receipt (see rpc.decode_receipt),
+            or None if no receipt appeared within the timeout. Watching a
+            hash twice returns the same Future.
+        """
+        now = time.monotonic()
+        deadline = now + (self.timeout if timeout is None else timeout)
+        with self._lock:
+            entry = self._pending.get(tx_hash)
+            if entry is not None:
+                future = entry[0]
+                self._pending[tx_hash] = (future, max(entry[1], deadline), entry[2])
+                return future
+            future = Future()
+            self._pending[tx_hash] = (future, deadline, now)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="simmer-receipts", daemon=True)
+                self._thread.start()
+        self._wake.set()
+        return future
+
+    def wait(
+        self,
+        tx_hashes: List[str],
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[int, float], None]] = None,
+        progress_every: float = 10.0,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Block until every hash has a receipt or has timed out.
+
+        Args:
+            tx_hashes: Transactions to wait for
+            timeout: Seconds per transaction (default: the watcher's timeout)
+            on_progress: Called as on_progress(still_pending, seconds_waited)
+                every progress_every seconds while waiting
+
+        Returns:
+            {tx_hash: receipt dict or None}
+        """
+        from concurrent.futures import wait as wait_futures
+
+        futures = {h: self.watch(h, timeout) for h in tx_hashes}
+        started = time.monotonic()
+        not_done = set(futures.values())
+        while not_done:
+            _, not_done = wait_futures(not_done, timeout=progress_every)
+            if not_done and on_progress is not None:
+                on_progress(len(not_done), time.monotonic() - started)
+        return {h: f.result() for h, f in futures.items()}
+
+    async def wait_async(self, tx_hash: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Await a receipt from asyncio code (None on timeout)."""
+        import asyncio  # deferred: only async callers need it
+
+        return await asyncio.wrap_future(self.watch(tx_hash, timeout))
+
+    def _run(self) -> None:
+        interval = self.min_interval
+        last_poll = 0.0
+        sleep = interval
+        while True:
+            if self._wake.wait(sleep):
+                # New hash: poll again after one short interval
+                self._wake.clear()
+                interval = self.min_interval
+
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+                # Count from the last poll, or from the oldest watch if it came
+                # later, so a stream of new hashes cannot postpone polling
+                since = max(last_poll, min(entry[2] for entry in self._pending.values()))
+                sleep = since + interval - time.monotonic()
+                if sleep > 0:
+                    continue
+                hashes = list(self._pending)
+
+            try:
+                self._polls += 1
+                results = self._rpc.get_receipts(hashes)
+            except Exception as e:
+                logger.debug("Receipt poll failed: %s", e)
+                results = [None] * len(hashes)
+
+            now = time.monotonic()
+            resolved = 0
+            with self._lock:
+                for tx_hash, receipt in zip(hashes, results):
+                    entry = self._pending.get(tx_hash)
+                    if entry is None:
+                        continue
+                    future, deadline, _ = entry
+                    if receipt and not isinstance(receipt, Exception):
+                        del self._pending[tx_hash]
+                        future.set_result(receipt)
+                        resolved += 1
+                    elif now >= deadline:
+                        del self._pending[tx_hash]
+                        future.set_result(None)
+
+            last_poll = now
+            interval = self.min_interval if resolved else min(self.max_interval, interval * BACKOFF_FACTOR)
+            sleep = interval
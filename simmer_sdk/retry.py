@@ -0,0 +1,132 @@
+"""
+Retry, Backoff and Timeout Policy
+
+Controls how SimmerClient and AsyncSimmerClient retry failed API requests.
+
+Retries use exponential backoff with jitter and honour the Retry-After header
+on 429 responses. Only requests that are safe to repeat are retried:
+- GET/HEAD/OPTIONS/DELETE requests are always retryable
+- POST /api/sdk/trade is retryable only when the caller passes an
+  idempotency_key, sent as the Idempotency-Key header; without one an
+  order is submitted exactly once
+- Everything else (other POST/PATCH) is never retried
+
+Usage:
+    from simmer_sdk import SimmerClient, RetryPolicy
+
+    # Per client
+    client = SimmerClient(api_key="...", retry_policy=RetryPolicy(max_retries=5, read_timeout=10))
+
+    # Per call (trades retry only with a caller-supplied idempotency key)
+    client.trade(market_id, "yes", 10.0, idempotency_key="my-order-1",
+                 retry_policy=RetryPolicy(max_retries=5))
+"""
+
+import random
+import time
+from dataclasses import dataclass, replace
+from email.utils import parsedate_to_datetime
+from typing import Optional, Tuple
+
+# HTTP header used to make trade submissions safe to replay
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# Methods that can always be repeated without side effects
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "DELETE")
+
+# POST endpoints that may be retried when an idempotency key is attached
+IDEMPOTENT_KEY_ENDPOINTS = ("/api/sdk/trade",)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry and timeout configuration for API requests.
+
+    Attributes:
+        max_retries: Retries after the first attempt (0 disables retrying)
+        backoff_base: Delay before the first retry, in seconds
+        backoff_max: Upper bound for any single backoff delay, in seconds
+        jitter: Random spread applied to each delay (0.5 = +/-50%)
+        retry_statuses: HTTP status codes that trigger a retry
+        respect_retry_after: Use the server's Retry-After header when present
+        max_retry_after: Ignore Retry-After values longer than this (fail fast)
+        connect_timeout: Seconds to wait for a TCP/TLS connection
+        read_timeout: Seconds to wait for the response after connecting
+    """
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    jitter: float = 0.5
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    respect_retry_after: bool = True
+    max_retry_after: float = 30.0
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """(connect, read) timeout tuple, as accepted by requests."""
+        return (self.connect_timeout, self.read_timeout)
+
+    def with_overrides(self, **changes) -> "RetryPolicy":
+        """Return a copy of this policy with some fields changed."""
+        return replace(self, **changes)
+
+    def is_retryable_request(self, method: str, endpoint: str, idempotency_key: Optional[str] = None) -> bool:
+        """Whether a request may be sent more than once."""
+        method = method.upper()
+        if method in IDEMPOTENT_METHODS:
+            return True
+        if method == "POST" and idempotency_key:
+            path = endpoint.split("?", 1)[0].rstrip("/")
+            return path in IDEMPOTENT_KEY_ENDPOINTS
+        return False
+
+    def should_retry_status(self, status_code: int) -> bool:
+        """Whether an HTTP status code is worth retrying."""
+        return status_code in self.retry_statuses
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Delay before retry number ``attempt`` (1-based).
+
+        Returns None when the server asked us to wait longer than
+        max_retry_after, meaning the caller should give up instead.
+        """
+        if retry_after is not None and self.respect_retry_after:
+            if retry_after > self.max_retry_after:
+                return None
+            return max(0.0, retry_after)
+
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(0.0, delay)
+
+
+# Disable retries entirely (single attempt, default timeouts)
+NO_RETRY = RetryPolicy(max_retries=0)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds.
+
+    Accepts both forms allowed by RFC 9110: delay-seconds ("120") and an
+    HTTP-date ("Wed, 21 Oct 2015 07:28:00 GMT").
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
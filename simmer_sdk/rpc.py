@@ -0,0 +1,250 @@
+"""
+Polygon JSON-RPC Client
+
+One JSON-RPC client for every chain read the SDK makes through Simmer's
+Polygon RPC proxy (nonces, gas, balances, receipts).
+
+- call_many() sends several calls as one JSON-RPC batch (one HTTP request).
+- call() buffers calls made within a short window, from any thread, and
+  sends them together. A nonce lookup and a gas reading made at the same
+  time share a single round-trip.
+- Hex quantities ("0x1a") are decoded in one place: the typed helpers
+  return ints, and receipts come back with int status/blockNumber/gasUsed.
+
+If the proxy rejects batch arrays, the client remembers that and falls back
+to one request per call.
+
+Usage:
+    rpc = PolygonRPC(lambda payload: client._request("POST", "/api/rpc/polygon", json=payload))
+    nonce = rpc.get_transaction_count(address)
+    balance, price = rpc.call_many([
+        ("eth_getBalance", [address, "latest"]),
+        ("eth_gasPrice", []),
+    ])
+    receipt = rpc.get_receipt(tx_hash)   # None while pending
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds call() waits for other calls to join its batch
+DEFAULT_WINDOW = 0.005
+
+# Calls per JSON-RPC batch; larger batches are split
+DEFAULT_MAX_BATCH = 50
+
+# Receipt fields that are hex quantities
+RECEIPT_QUANTITY_FIELDS = (
+    "status", "blockNumber", "gasUsed", "cumulativeGasUsed",
+    "effectiveGasPrice", "transactionIndex", "type",
+)
+
+# HTTP statuses that mean the proxy refused a batch array itself (bad
+# request, method not allowed, too large, unsupported body). Auth errors and
+# rate limits (401/403/429) say nothing about batch support.
+BATCH_REJECTED_STATUSES = frozenset({400, 405, 413, 415})
+
+Call = Tuple[str, list]
+
+
+def hex_to_int(value: Any) -> int:
+    """Decode a JSON-RPC quantity ("0x1a", int or None) to int."""
+    if value is None:
+        return 0
+    if isinstance(value, int):
+        return value
+    text = str(value)
+    return int(text, 16) if text else 0
+
+
+def decode_receipt(receipt: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Copy of a transaction receipt with its quantity fields as ints (None stays None)."""
+    if not receipt:
+        return None
+    decoded = dict(receipt)
+    for field in RECEIPT_QUANTITY_FIELDS:
+        if field in decoded:
+            decoded[field] = hex_to_int(decoded[field])
+    return decoded
+
+
+class PolygonRPC:
+    """
+    Batching JSON-RPC client for Simmer's Polygon RPC proxy.
+
+    Args:
+        transport: Sends a JSON-RPC payload (one request dict or a list of
+            them) and returns the parsed response, e.g.
+            lambda payload: client._request("POST", "/api/rpc/polygon", json=payload)
+        window: Seconds call() waits to gather concurrent calls (0 = send immediately)
+        max_batch: Maximum calls per HTTP request
+    """
+
+    def __init__(
+        self,
+        transport: Callable[[Any], Any],
+        window: float = DEFAULT_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        self._transport = transport
+        self.window = window
+        self.max_batch = max(1, max_batch)
+        self._lock = threading.Lock()
+        self._queue: List[Tuple[str, list, Future]] = []
+        self._batch_supported: Optional[bool] = None  # Learned on first batch
+        self._requests = 0
+
+    @property
+    def requests(self) -> int:
+        """HTTP requests sent so far."""
+        return self._requests
+
+    # ------------------------------------------------------------------
+    # Core calls
+    # ------------------------------------------------------------------
+
+    def call(self, method: str, params: Optional[list] = None) -> Any:
+        """
+        One JSON-RPC call, batched with any others made within the window.
+
+        Returns:
+            The raw ``result`` field
+
+        Raises:
+            RuntimeError: If the node returned a JSON-RPC error
+        """
+        if self.window <= 0:
+            return self._unwrap(self.call_many([(method, params or [])])[0])
+
+        future: Future = Future()
+        with self._lock:
+            self._queue.append((method, params or [], future))
+            leader = len(self._queue) == 1
+        if leader:
+            # First caller in the window sends the batch for everyone
+            time.sleep(self.window)
+            self._flush()
+        return self._unwrap(future.result())
+
+    def call_many(self, calls: List[Call]) -> List[Any]:
+        """
+        Send calls now as one JSON-RPC batch (split into max_batch chunks).
+
+        Returns:
+            Results in call order, with an Exception in place of any call
+            that failed (including transport errors)
+        """
+        results: List[Any] = []
+        for start in range(0, len(calls), self.max_batch):
+            results.extend(self._send(calls[start:start + self.max_batch]))
+        return results
+
+    def _flush(self) -> None:
+        with self._lock:
+            queued, self._queue = self._queue, []
+        if not queued:
+            return
+        try:
+            results = self.call_many([(method, params) for method, params, _ in queued])
+        except Exception as e:
+            for _, _, future in queued:
+                future.set_exception(e)
+            return
+        for (_, _, future), result in zip(queued, results):
+            future.set_result(result)
+
+    def _send(self, calls: List[Call]) -> List[Any]:
+        if not calls:
+            return []
+        if len(calls) == 1:
+            return [self._send_one(*calls[0])]
+
+        if self._batch_supported is not False:
+            payload = [
+                {"jsonrpc": "2.0", "method": method, "params": params, "id": i}
+                for i, (method, params) in enumerate(calls)
+            ]
+            try:
+                self._requests += 1
+                resp = self._transport(payload)
+            except Exception as e:
+                status = getattr(getattr(e, "response", None), "status_code", None)
+                if status not in BATCH_REJECTED_STATUSES:
+                    return [e] * len(calls)
+                resp = None  # The proxy refused the array
+            if isinstance(resp, list):
+                self._batch_supported = True
+                by_id = {r.get("id"): r for r in resp if isinstance(r, dict)}
+                return [self._result(by_id.get(i)) for i in range(len(calls))]
+            self._batch_supported = False
+            logger.info("Polygon RPC proxy does not accept batch requests; sending calls individually")
+
+        return [self._send_one(method, params) for method, params in calls]
+
+    def _send_one(self, method: str, params: list) -> Any:
+        try:
+            self._requests += 1
+            resp = self._transport({"jsonrpc": "2.0", "method": method, "params": params, "id": 0})
+        except Exception as e:
+            return e
+        return self._result(resp)
+
+    @staticmethod
+    def _result(response: Any) -> Any:
+        if not isinstance(response, dict):
+            return RuntimeError("Missing JSON-RPC response")
+        if response.get("error"):
+            return RuntimeError(f"JSON-RPC error: {response['error']}")
+        return response.get("result")
+
+    @staticmethod
+    def _unwrap(result: Any) -> Any:
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    # ------------------------------------------------------------------
+    # Typed helpers (hex quantities decoded to int)
+    # ------------------------------------------------------------------
+
+    def get_transaction_count(self, address: str, block: str = "pending") -> int:
+        """Nonce of the next transaction from address."""
+        return hex_to_int(self.call("eth_getTransactionCount", [address, block]))
+
+    def get_balance(self, address: str, block: str = "latest") -> int:
+        """POL balance in wei."""
+        return hex_to_int(self.call("eth_getBalance", [address, block]))
+
+    def gas_price(self) -> int:
+        """Legacy gas price in wei."""
+        return hex_to_int(self.call("eth_gasPrice", []))
+
+    def fee_history(self, blocks: int, percentiles: List[float], newest: str = "latest") -> Dict[str, Any]:
+        """
+        eth_feeHistory with quantities decoded.
+
+        Returns:
+            {"base_fee_per_gas": [int, ...], "reward": [[int, ...], ...]}.
+            The last base fee is the next (pending) block's.
+        """
+        history = self.call("eth_feeHistory", [hex(blocks), newest, percentiles])
+        if not isinstance(history, dict):
+            raise RuntimeError("Invalid eth_feeHistory response")
+        return {
+            "base_fee_per_gas": [hex_to_int(v) for v in history.get("baseFeePerGas") or []],
+            "reward": [[hex_to_int(v) for v in row] for row in history.get("reward") or []],
+        }
+
+    def get_receipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """Decoded receipt, or None while the transaction is pending."""
+        return decode_receipt(self.call("eth_getTransactionReceipt", [tx_hash]))
+
+    def get_receipts(self, tx_hashes: List[str]) -> List[Any]:
+        """Decoded receipts for several transactions in one batch (None = pending, Exception = failed)."""
+        results = self.call_many([("eth_getTransactionReceipt", [h]) for h in tx_hashes])
+        return [r if isinstance(r, Exception) else decode_receipt(r) for r in results]
@@ -0,0 +1,334 @@
+"""
+Local Market Search Index
+
+An inverted index over market questions, so finding a market is a
+dictionary lookup instead of a network search or a substring scan.
+
+- Questions are split into lowercase word tokens; a few filler words
+  ("will", "the", "of", ...) are dropped.
+- Queries match every term (AND). The last term also matches as a prefix,
+  so "bitc" or "elon tw" find results while the user is still typing; pass
+  prefix=True to prefix-match every term.
+- Results are ranked by how rare the matched terms are (IDF), with a
+  bonus when the query appears verbatim in the question.
+
+The index is built incrementally from the paginated market feed
+(SimmerClient.refresh_market_index()) and can be persisted to a JSON file, so
+a bot that restarts every cycle does not rebuild it from the network.
+
+Usage:
+    index = MarketIndex("~/.simmer/market_index.json")
+    index.add_many(raw_market_dicts)
+    for market in index.search("elon musk tweets", limit=10):
+        print(market["id"], market["question"])
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import tempfile
+import threading
+import time
+import heapq
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rebuild the index from the market feed after this many seconds
+DEFAULT_MAX_AGE = 900.0
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "at", "be", "by", "for", "in", "is", "of", "on", "or", "the", "to", "will",
+})
+
+# Score multiplier for a term that only matched as a prefix
+PREFIX_WEIGHT = 0.5
+
+# Score bonus when the whole query appears verbatim in the question
+PHRASE_BONUS = 1.0
+
+
+def _idf(count: int, total: int) -> float:
+    """Inverse document frequency of a token found in count of total markets."""
+    return math.log(1 + total / max(1, count))
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of text, without stopwords."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+class MarketIndex:
+    """
+    Thread-safe inverted index over market questions.
+
+    Documents are the raw market dicts from /api/sdk/markets, keyed by "id".
+    Prices in stored documents are as of the last refresh; fetch the market
+    again before trading on them.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_age: float = DEFAULT_MAX_AGE):
+        """
+        Args:
+            path: JSON file to load from and save to (None = memory only)
+            max_age: Seconds after which the index reports itself stale
+        """
+        self.path = os.path.expanduser(path) if path else None
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._doc_tokens: Dict[str, Tuple[str, ...]] = {}
+        self._doc_text: Dict[str, str] = {}  # Normalized question, for phrase matches
+        self._postings: Dict[str, Set[str]] = {}
+        self._vocab: Optional[List[str]] = None  # Sorted tokens, rebuilt lazily for prefix lookups
+        self.updated_at = 0.0
+        if self.path:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, market_id: str) -> bool:
+        return market_id in self._docs
+
+    @property
+    def stale(self) -> bool:
+        """True if the index is empty or older than max_age."""
+        return not self._docs or time.time() - self.updated_at > self.max_age
+
+    def get(self, market_id: str) -> Optional[Dict[str, Any]]:
+        """Stored market dict, or None."""
+        return self._docs.get(market_id)
+
+    def add(self, market: Dict[str, Any]) -> None:
+        """Index one market dict (replaces any earlier version)."""
+        self.add_many([market])
+
+    def add_many(self, markets: Iterable[Dict[str, Any]], save: bool = True) -> int:
+        """
+        Index several market dicts.
+
+        Args:
+            markets: Raw market dicts with at least "id" and "question"
+            save: Persist afterwards if a path is configured
+
+        Returns:
+            Number of markets added or changed
+        """
+        changed = 0
+        with self._lock:
+            for market in markets:
+                market_id = market.get("id")
+                if not market_id:
+                    continue
+                if self._docs.get(market_id) == market:
+                    continue
+                self._index_locked(market_id, market)
+                changed += 1
+            self.updated_at = time.time()
+            if save and self.path:
+                self._save_locked()
+        return changed
+
+    def remove(self, market_id: str) -> None:
+        """Drop a market from the index."""
+        with self._lock:
+            if self._unindex_locked(market_id) and self.path:
+                self._save_locked()
+
+    def prune(
+        self,
+        keep: Iterable[str],
+        status: Optional[str] = None,
+        import_source: Optional[str] = None,
+        save: bool = True,
+    ) -> int:
+        """
+        Drop markets not in keep, e.g. those missing from a full refresh.
+
+        Args:
+            keep: Market IDs to keep
+            status: Only consider markets with this status
+            import_source: Only consider markets from this source
+            save: Persist afterwards if anything was removed
+
+        Returns:
+            Number of markets removed
+        """
+        keep_ids = set(keep)
+        with self._lock:
+            removed = [
+                market_id for market_id, doc in self._docs.items()
+                if market_id not in keep_ids
+                and (status is None or doc.get("status", "active") == status)
+                and (import_source is None or doc.get("import_source") == import_source)
+            ]
+            for market_id in removed:
+                self._unindex_locked(market_id)
+            if removed and save and self.path:
+                self._save_locked()
+        return len(removed)
+
+    def save(self) -> None:
+        """Persist now (no-op without a path)."""
+        with self._lock:
+            if self.path:
+                self._save_locked()
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = 20,
+        prefix: bool = False,
+        status: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Markets whose question matches every query term, best first.
+
+        Args:
+            query: Free text, e.g. "btc 100k" or "elon musk tw"
+            limit: Maximum results (None = all)
+            prefix: Prefix-match every term, not just the last
+            status: Only markets with this status (e.g. "active")
+
+        Returns:
+            Stored market dicts
+        """
+        hits = (self._docs.get(market_id) for _, market_id in self.search_scored(query, limit, prefix, status))
+        return [doc for doc in hits if doc is not None]
+
+    def search_scored(
+        self,
+        query: str,
+        limit: Optional[int] = 20,
+        prefix: bool = False,
+        status: Optional[str] = None,
+    ) -> List[Tuple[float, str]]:
+        """Like search(), but returns (score, market_id) pairs."""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        phrase = " ".join(_TOKEN_RE.findall(query.lower()))
+
+        with self._lock:
+            total = len(self._docs)
+            # Per term: (postings, weight) for each token it matches, best weight first
+            term_options: List[List[Tuple[Set[str], float]]] = []
+            for i, term in enumerate(terms):
+                options = self._term_options_locked(term, prefix or i == len(terms) - 1, total)
+                if not options:
+                    return []
+                term_options.append(options)
+
+            # Markets matching every term: one set intersection, smallest set first
+            matches = [
+                options[0][0] if len(options) == 1 else set().union(*(p for p, _ in options))
+                for options in term_options
+            ]
+            matches.sort(key=len)
+            candidates = matches[0].intersection(*matches[1:])
+
+            ranked: List[Tuple[float, int, str]] = []
+            for market_id in candidates:
+                if status is not None and self._docs[market_id].get("status", "active") != status:
+                    continue
+                score = 0.0
+                for options in term_options:
+                    if len(options) == 1:
+                        score += options[0][1]
+                    else:
+                        score += next(w for postings, w in options if market_id in postings)
+                text = self._doc_text[market_id]
+                if phrase in text:
+                    score += PHRASE_BONUS
+                ranked.append((-score, len(text), market_id))
+
+        # Best score first; shorter questions win ties (more specific)
+        if limit is None:
+            ranked.sort()
+        else:
+            ranked = heapq.nsmallest(limit, ranked)
+        return [(-neg_score, market_id) for neg_score, _, market_id in ranked]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _term_options_locked(self, term: str, expand: bool, total: int) -> List[Tuple[Set[str], float]]:
+        """Postings and IDF weights of term (and, if expand, of every token it prefixes)."""
+        options: List[Tuple[Set[str], float]] = []
+        exact = self._postings.get(term)
+        if exact:
+            options.append((exact, _idf(len(exact), total)))
+        if expand:
+            if self._vocab is None:
+                self._vocab = sorted(self._postings)
+            start = bisect_left(self._vocab, term)
+            for token in self._vocab[start:]:
+                if not token.startswith(term):
+                    break
+                if token != term:
+                    postings = self._postings[token]
+                    options.append((postings, _idf(len(postings), total) * PREFIX_WEIGHT))
+        options.sort(key=lambda option: -option[1])
+        return options
+
+    def _index_locked(self, market_id: str, market: Dict[str, Any]) -> None:
+        self._unindex_locked(market_id)
+        words = _TOKEN_RE.findall(str(market.get("question", "")).lower())
+        tokens = tuple(sorted({w for w in words if w not in STOPWORDS}))
+        self._docs[market_id] = market
+        self._doc_text[market_id] = " ".join(words)
+        self._doc_tokens[market_id] = tokens
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                self._postings[token] = postings = set()
+                self._vocab = None
+            postings.add(market_id)
+
+    def _unindex_locked(self, market_id: str) -> bool:
+        if market_id not in self._docs:
+            return False
+        del self._docs[market_id]
+        del self._doc_text[market_id]
+        for token in self._doc_tokens.pop(market_id, ()):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.discard(market_id)
+            if not postings:
+                del self._postings[token]
+                self._vocab = None
+        return True
+
+    def _load(self) -> None:
+        try:
+            with open(self.path) as f:
+                raw = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable market index %s: %s", self.path, e)
+            return
+        for market in raw.get("markets", []):
+            if isinstance(market, dict) and market.get("id"):
+                self._index_locked(market["id"], market)
+        self.updated_at = float(raw.get("updated_at", 0.0))
+
+    def _save_locked(self) -> None:
+        """Write the index atomically. Caller holds the lock."""
+        directory = os.path.dirname(self.path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=".market_index.")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"updated_at": self.updated_at, "markets": list(self._docs.values())}, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning("Could not persist market index to %s: %s", self.path, e)
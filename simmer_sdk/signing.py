@@ -8,9 +8,15 @@ SECURITY NOTE: The private key should NEVER be logged, transmitted, or stored
 outside of memory. It is only used for signing operations.
 """
 
-from typing import Dict, Any
+import logging
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Any, Iterable, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
+
 # Polymarket token/USDC decimals (1 share = 1e6 raw units, 1 USDC = 1e6 raw units)
 POLYMARKET_DECIMAL_FACTOR = 1e6
 
@@ -60,6 +66,413 @@ class SignedOrder:
         }
 
 
+# py_order_utils / py_clob_client names, imported on first use
+_ORDER_LIBS: Optional[Dict[str, Any]] = None
+
+
+def _load_order_libs() -> Dict[str, Any]:
+    """
+    Import py_order_utils / py_clob_client once and return the names we use.
+
+    Raises:
+        ImportError: If py_order_utils or py_clob_client is not installed
+    """
+    global _ORDER_LIBS
+    if _ORDER_LIBS is None:
+        try:
+            from py_order_utils.builders import OrderBuilder
+            from py_order_utils.signer import Signer
+            from py_order_utils.model import OrderData, EOA, POLY_PROXY, POLY_GNOSIS_SAFE as GNOSIS_SAFE
+            from py_clob_client.config import get_contract_config
+            from py_clob_client.order_builder.builder import OrderBuilder as ClobOrderBuilder, ROUNDING_CONFIG
+        except ImportError:
+            raise ImportError(
+                "py_order_utils and py_clob_client are required for local signing. "
+                "Install with: pip install py-order-utils py-clob-client"
+            )
+        _ORDER_LIBS = {
+            "OrderBuilder": OrderBuilder,
+            "Signer": Signer,
+            "OrderData": OrderData,
+            "sig_types": {0: EOA, 1: POLY_PROXY, 2: GNOSIS_SAFE},
+            "get_contract_config": get_contract_config,
+            "ClobOrderBuilder": ClobOrderBuilder,
+            "ROUNDING_CONFIG": ROUNDING_CONFIG,
+        }
+    return _ORDER_LIBS
+
+
+class OrderSigner:
+    """
+    Long-lived Polymarket order signer for one wallet.
+
+    Builds the py_order_utils Signer once, and one OrderBuilder (with its
+    exchange contract config) per neg_risk flag, then reuses them for every
+    order. Use this instead of build_and_sign_order() on latency-critical
+    paths; SimmerClient keeps one per configured wallet.
+
+    Thread-safe: builders are created under a lock and signing itself holds
+    no mutable state.
+
+    Example:
+        signer = OrderSigner(private_key, wallet_address)
+        order = signer.sign(token_id, "BUY", price=0.42, size=20)
+    """
+
+    def __init__(self, private_key: str, wallet_address: str, signature_type: int = 0):
+        if signature_type not in (0, 1, 2):
+            raise ValueError(f"Invalid signature_type {signature_type}. Must be 0, 1, or 2")
+
+        libs = _load_order_libs()
+        self.wallet_address = wallet_address
+        self.signature_type = signature_type
+        self._libs = libs
+        self._signer = libs["Signer"](key=private_key)
+        self._sig_type = libs["sig_types"].get(signature_type, libs["sig_types"][0])
+        # get_order_amounts() only uses its arguments, never instance state
+        self._amounts = libs["ClobOrderBuilder"].__new__(libs["ClobOrderBuilder"])
+        self._builders: Dict[bool, Any] = {}
+        self._lock = threading.Lock()
+
+    def _builder(self, neg_risk: bool):
+        """OrderBuilder for the CTF or Neg Risk CTF exchange, built once."""
+        builder = self._builders.get(neg_risk)
+        if builder is None:
+            with self._lock:
+                builder = self._builders.get(neg_risk)
+                if builder is None:
+                    contract_config = self._libs["get_contract_config"](POLYGON_CHAIN_ID, neg_risk)
+                    builder = self._libs["OrderBuilder"](
+                        contract_config.exchange,
+                        POLYGON_CHAIN_ID,
+                        self._signer,
+                    )
+                    self._builders[neg_risk] = builder
+        return builder
+
+    def sign(
+        self,
+        token_id: str,
+        side: str,  # "BUY" or "SELL"
+        price: float,
+        size: float,
+        neg_risk: bool = False,
+        tick_size: float = 0.01,
+        fee_rate_bps: int = 0,
+        order_type: str = "FAK",  # "FAK", "FOK", "GTC", "GTD"
+    ) -> SignedOrder:
+        """
+        Build and sign a Polymarket order.
+
+        Args are as for build_and_sign_order().
+
+        Returns:
+            SignedOrder ready for API submission
+
+        Raises:
+            ValueError: If order parameters are invalid
+        """
+        # Validate inputs
+        if side not in ("BUY", "SELL"):
+            raise ValueError(f"Invalid side '{side}'. Must be 'BUY' or 'SELL'")
+        if price <= 0 or price >= 1:
+            raise ValueError(f"Invalid price {price}. Must be between 0 and 1")
+        if size <= 0:
+            raise ValueError(f"Invalid size {size}. Must be positive")
+
+        # Use py-clob-client's OrderBuilder for tick_size-aware precision
+        # This handles rounding correctly (avoids float truncation bugs like
+        # int(0.99 * 5.05 * 1e6) = 4999499 instead of 4999500)
+        rounding = self._libs["ROUNDING_CONFIG"]
+        tick_size_str = str(tick_size)
+        if tick_size_str not in rounding:
+            tick_size_str = "0.01"  # Safe fallback (most common)
+        round_config = rounding[tick_size_str]
+
+        side_enum, maker_raw, taker_raw = self._amounts.get_order_amounts(
+            side, size, price, round_config
+        )
+
+        # CLOB enforces maker max 2 decimals for FAK/FOK (market orders).
+        # GTC/GTD (limit orders) need full precision from get_order_amounts().
+        # See _dev/active/_polymarket-rounding-precision/ for full history.
+        if order_type in ("FAK", "FOK"):
+            maker_raw = int(round(maker_raw / 1e6, 2) * 1e6)
+
+        # Check minimum order size
+        shares_raw = taker_raw if side == "BUY" else maker_raw
+        effective_shares = shares_raw / POLYMARKET_DECIMAL_FACTOR
+        if effective_shares < MIN_ORDER_SIZE_SHARES:
+            raise ValueError(
+                f"Order too small: {effective_shares:.2f} shares after rounding "
+                f"is below minimum ({MIN_ORDER_SIZE_SHARES})"
+            )
+
+        # Build OrderData
+        data = self._libs["OrderData"](
+            maker=self.wallet_address,
+            taker=ZERO_ADDRESS,
+            tokenId=token_id,
+            makerAmount=str(maker_raw),
+            takerAmount=str(taker_raw),
+            side=side_enum,
+            feeRateBps=str(fee_rate_bps),
+            nonce="0",
+            signer=self.wallet_address,
+            expiration="0",
+            signatureType=self._sig_type,
+        )
+
+        # Sign the order
+        signed = self._builder(neg_risk).build_signed_order(data)
+        order_dict = signed.dict()
+
+        return SignedOrder(
+            salt=str(order_dict["salt"]),
+            maker=order_dict["maker"],
+            signer=order_dict["signer"],
+            taker=order_dict["taker"],
+            tokenId=order_dict["tokenId"],
+            makerAmount=order_dict["makerAmount"],
+            takerAmount=order_dict["takerAmount"],
+            expiration=order_dict["expiration"],
+            nonce=order_dict["nonce"],
+            feeRateBps=order_dict["feeRateBps"],
+            side=side,
+            signatureType=self.signature_type,
+            signature=order_dict["signature"],
+        )
+
+    def sign_many(
+        self,
+        orders: List[Dict[str, Any]],
+        processes: int = 0,
+        return_exceptions: bool = False,
+        private_key: Optional[str] = None,
+    ) -> List[Union[SignedOrder, Exception]]:
+        """
+        Sign several orders in one tight loop.
+
+        Args:
+            orders: Keyword-argument dicts for sign() (token_id, side, price, size, ...)
+            processes: Spread signing across this many worker processes
+                (0 or 1 = sign in this thread). Worth it for large batches when
+                ECDSA runs in pure Python; each worker builds its own signer once.
+            return_exceptions: Put per-order exceptions in the result list
+                instead of raising the first one
+            private_key: This signer's key, needed only with processes > 1
+                so the workers can build their own signers (the signer does
+                not keep the raw key)
+
+        Returns:
+            One SignedOrder (or exception) per input order, in input order
+
+        Raises:
+            ValueError: If processes > 1 and private_key is not given
+        """
+        if processes > 1 and len(orders) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            if not private_key:
+                raise ValueError("sign_many(processes=N) needs private_key for the worker processes")
+
+            with ProcessPoolExecutor(
+                max_workers=min(processes, len(orders)),
+                initializer=_init_pool_signer,
+                initargs=(private_key, self.wallet_address, self.signature_type),
+            ) as pool:
+                results = list(pool.map(_pool_sign, orders, chunksize=max(1, len(orders) // (processes * 4))))
+        else:
+            results = [_sign_or_exception(self, order) for order in orders]
+
+        if not return_exceptions:
+            for r in results:
+                if isinstance(r, Exception):
+                    raise r
+        return results
+
+
+# Per-process signer for OrderSigner.sign_many(processes=N)
+_POOL_SIGNER: Optional[OrderSigner] = None
+
+
+def _init_pool_signer(private_key: str, wallet_address: str, signature_type: int) -> None:
+    global _POOL_SIGNER
+    _POOL_SIGNER = OrderSigner(private_key, wallet_address, signature_type)
+
+
+def _pool_sign(order: Dict[str, Any]) -> Union[SignedOrder, Exception]:
+    return _sign_or_exception(_POOL_SIGNER, order)
+
+
+def _sign_or_exception(signer: OrderSigner, order: Dict[str, Any]) -> Union[SignedOrder, Exception]:
+    try:
+        return signer.sign(**order)
+    except Exception as e:
+        return e
+
+
+def order_key(spec: Dict[str, Any]) -> Tuple:
+    """Identity of an order spec (sign() kwargs) for pre-signed order lookup."""
+    return (
+        str(spec["token_id"]),
+        spec["side"],
+        round(float(spec["price"]), 6),
+        round(float(spec["size"]), 6),
+        spec.get("order_type", "FAK"),
+        bool(spec.get("neg_risk", False)),
+        float(spec.get("tick_size", 0.01)),
+        int(spec.get("fee_rate_bps", 0)),
+    )
+
+
+class PresignedOrderPool:
+    """
+    Ready-to-submit signed orders for a fixed ladder of order specs.
+
+    Keeps ``depth`` signed orders per spec (typically YES and NO buys at a
+    few price/size levels for one market). take() hands out a matching
+    order without signing; a background thread signs replacements for
+    consumed orders and re-signs orders older than max_age.
+
+    Each signed order carries its own salt and is handed out at most once.
+
+    Example:
+        pool = PresignedOrderPool(signer, specs, depth=2)
+        pool.start()
+        order = pool.take(spec) or signer.sign(**spec)  # instant on a hit
+        pool.stop()
+    """
+
+    def __init__(
+        self,
+        signer: OrderSigner,
+        specs: Iterable[Dict[str, Any]] = (),
+        depth: int = 1,
+        max_age: Optional[float] = 300.0,
+        refresh_interval: float = 1.0,
+    ):
+        """
+        Args:
+            signer: OrderSigner for the wallet
+            specs: sign() keyword-argument dicts to keep orders ready for
+            depth: Signed orders kept per spec
+            max_age: Re-sign orders older than this many seconds (None = never)
+            refresh_interval: Seconds between background refresh passes
+        """
+        self.signer = signer
+        self.depth = max(1, depth)
+        self.max_age = max_age
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._specs: Dict[Tuple, Dict[str, Any]] = {}
+        self._ready: Dict[Tuple, Deque[Tuple[float, SignedOrder]]] = {}
+        self._failed: Dict[Tuple, str] = {}
+        self._hits = 0
+        self._misses = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.set_specs(specs)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(q) for q in self._ready.values())
+
+    def set_specs(self, specs: Iterable[Dict[str, Any]]) -> None:
+        """Replace the ladder. Orders for specs no longer in it are dropped."""
+        new_specs = {order_key(spec): dict(spec) for spec in specs}
+        with self._lock:
+            self._specs = new_specs
+            self._ready = {k: self._ready.get(k, deque()) for k in new_specs}
+            self._failed.clear()
+        self._wake.set()
+
+    def take(self, spec: Dict[str, Any]) -> Optional[SignedOrder]:
+        """Pop a ready order matching spec, or None if there is none."""
+        key = order_key(spec)
+        now = time.time()
+        with self._lock:
+            queue = self._ready.get(key)
+            while queue:
+                signed_at, order = queue.popleft()
+                if self.max_age is None or now - signed_at <= self.max_age:
+                    self._hits += 1
+                    self._wake.set()
+                    return order
+            self._misses += 1
+        return None
+
+    def refill(self) -> int:
+        """Sign whatever the ladder is missing, in the calling thread. Returns orders signed."""
+        now = time.time()
+        with self._lock:
+            todo: List[Tuple[Tuple, Dict[str, Any]]] = []
+            for key, spec in self._specs.items():
+                if key in self._failed:
+                    continue
+                queue = self._ready[key]
+                if self.max_age is not None:
+                    while queue and now - queue[0][0] > self.max_age:
+                        queue.popleft()
+                todo.extend((key, spec) for _ in range(self.depth - len(queue)))
+
+        signed = 0
+        for key, spec in todo:
+            try:
+                order = self.signer.sign(**spec)
+            except Exception as e:
+                logger.warning("Not pre-signing %s %s @ %s: %s", spec.get("side"), spec.get("size"), spec.get("price"), e)
+                with self._lock:
+                    self._failed[key] = str(e)
+                continue
+            with self._lock:
+                queue = self._ready.get(key)
+                if queue is not None and len(queue) < self.depth:
+                    queue.append((time.time(), order))
+                    signed += 1
+        return signed
+
+    def start(self) -> "PresignedOrderPool":
+        """Fill the pool now and keep it topped up from a daemon thread."""
+        self.refill()
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="simmer-presign", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the background thread (ready orders are kept)."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.refresh_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.refill()
+            except Exception as e:
+                logger.debug("Pre-sign refresh failed: %s", e)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and pool fill level."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "ready": sum(len(q) for q in self._ready.values()),
+                "specs": len(self._specs),
+                "failed": len(self._failed),
+            }
+
+
 def build_and_sign_order(
     private_key: str,
     wallet_address: str,
@@ -76,6 +489,9 @@ def build_and_sign_order(
     """
     Build and sign a Polymarket order.
 
+    One-shot convenience wrapper that creates a fresh OrderSigner per call.
+    For repeated signing with the same wallet, keep an OrderSigner instead.
+
     Args:
         private_key: Wallet private key (0x prefixed hex string)
         wallet_address: Wallet address that will sign the order
@@ -94,101 +510,16 @@ def build_and_sign_order(
         ImportError: If py_order_utils is not installed
         ValueError: If order parameters are invalid
     """
-    try:
-        from py_order_utils.builders import OrderBuilder
-        from py_order_utils.signer import Signer
-        from py_order_utils.model import OrderData, EOA, POLY_PROXY, POLY_GNOSIS_SAFE as GNOSIS_SAFE, BUY, SELL
-        from py_clob_client.config import get_contract_config
-        from py_clob_client.order_builder.builder import OrderBuilder as ClobOrderBuilder, ROUNDING_CONFIG
-    except ImportError:
-        raise ImportError(
-            "py_order_utils and py_clob_client are required for local signing. "
-            "Install with: pip install py-order-utils py-clob-client"
-        )
-
-    # Validate inputs
-    if side not in ("BUY", "SELL"):
-        raise ValueError(f"Invalid side '{side}'. Must be 'BUY' or 'SELL'")
-    if price <= 0 or price >= 1:
-        raise ValueError(f"Invalid price {price}. Must be between 0 and 1")
-    if size <= 0:
-        raise ValueError(f"Invalid size {size}. Must be positive")
-    if signature_type not in (0, 1, 2):
-        raise ValueError(f"Invalid signature_type {signature_type}. Must be 0, 1, or 2")
-
-    # Use py-clob-client's OrderBuilder for tick_size-aware precision
-    # This handles rounding correctly (avoids float truncation bugs like
-    # int(0.99 * 5.05 * 1e6) = 4999499 instead of 4999500)
-    tick_size_str = str(tick_size)
-    if tick_size_str not in ROUNDING_CONFIG:
-        tick_size_str = "0.01"  # Safe fallback (most common)
-    round_config = ROUNDING_CONFIG[tick_size_str]
-
-    dummy_builder = ClobOrderBuilder.__new__(ClobOrderBuilder)
-    side_enum, maker_raw, taker_raw = dummy_builder.get_order_amounts(
-        side, size, price, round_config
-    )
-
-    # CLOB enforces maker max 2 decimals for FAK/FOK (market orders).
-    # GTC/GTD (limit orders) need full precision from get_order_amounts().
-    # See _dev/active/_polymarket-rounding-precision/ for full history.
-    if order_type in ("FAK", "FOK"):
-        maker_raw = int(round(maker_raw / 1e6, 2) * 1e6)
-
-    # Check minimum order size
-    shares_raw = taker_raw if side == "BUY" else maker_raw
-    effective_shares = shares_raw / POLYMARKET_DECIMAL_FACTOR
-    if effective_shares < MIN_ORDER_SIZE_SHARES:
-        raise ValueError(
-            f"Order too small: {effective_shares:.2f} shares after rounding "
-            f"is below minimum ({MIN_ORDER_SIZE_SHARES})"
-        )
-
-    # Map signature type
-    sig_type_map = {0: EOA, 1: POLY_PROXY, 2: GNOSIS_SAFE}
-    sig_type = sig_type_map.get(signature_type, EOA)
-
-    # Build OrderData
-    data = OrderData(
-        maker=wallet_address,
-        taker=ZERO_ADDRESS,
-        tokenId=token_id,
-        makerAmount=str(maker_raw),
-        takerAmount=str(taker_raw),
-        side=side_enum,
-        feeRateBps=str(fee_rate_bps),
-        nonce="0",
-        signer=wallet_address,
-        expiration="0",
-        signatureType=sig_type,
-    )
-
-    # Get contract config and build signer
-    contract_config = get_contract_config(POLYGON_CHAIN_ID, neg_risk)
-    order_builder = OrderBuilder(
-        contract_config.exchange,
-        POLYGON_CHAIN_ID,
-        Signer(key=private_key),
-    )
-
-    # Sign the order
-    signed = order_builder.build_signed_order(data)
-    order_dict = signed.dict()
-
-    return SignedOrder(
-        salt=str(order_dict["salt"]),
-        maker=order_dict["maker"],
-        signer=order_dict["signer"],
-        taker=order_dict["taker"],
-        tokenId=order_dict["tokenId"],
-        makerAmount=order_dict["makerAmount"],
-        takerAmount=order_dict["takerAmount"],
-        expiration=order_dict["expiration"],
-        nonce=order_dict["nonce"],
-        feeRateBps=order_dict["feeRateBps"],
+    signer = OrderSigner(private_key, wallet_address, signature_type)
+    return signer.sign(
+        token_id=token_id,
         side=side,
-        signatureType=signature_type,
-        signature=order_dict["signature"],
+        price=price,
+        size=size,
+        neg_risk=neg_risk,
+        tick_size=tick_size,
+        fee_rate_bps=fee_rate_bps,
+        order_type=order_type,
     )
 
 
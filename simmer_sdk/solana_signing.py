@@ -13,46 +13,69 @@ Dependencies (included in simmer-sdk):
 """
 
 import os
+import base64
 import logging
-from typing import Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
 # Environment variable for Solana private key
 SOLANA_PRIVATE_KEY_ENV_VAR = "SOLANA_PRIVATE_KEY"
 
+# solders names, imported on first use
+_SOLDERS: Optional[Dict[str, Any]] = None
+
+# Process-level keypair cache: (env var value it was built from, Keypair).
+# The env value is compared on each lookup so a changed key is picked up;
+# call reload() to force a rebuild.
+_KEYPAIR_CACHE: Optional[Tuple[str, Any]] = None
+_KEYPAIR_LOCK = threading.Lock()
+
 
 def has_solana_key() -> bool:
     """Check if a Solana private key is configured."""
     return bool(os.environ.get(SOLANA_PRIVATE_KEY_ENV_VAR))
 
 
-def _load_keypair():
+def _load_solders() -> Dict[str, Any]:
     """
-    Load a solders Keypair from the SOLANA_PRIVATE_KEY env var.
-
-    Returns:
-        solders.keypair.Keypair
+    Import solders once and return the names we use.
 
     Raises:
-        ValueError: If env var is not set or key format is invalid
-        ImportError: If solders/base58 are not installed
+        ImportError: If solders is not installed
     """
-    raw = os.environ.get(SOLANA_PRIVATE_KEY_ENV_VAR)
-    if not raw:
-        raise ValueError(
-            f"{SOLANA_PRIVATE_KEY_ENV_VAR} environment variable is not set. "
-            "Set it to your base58-encoded Solana secret key."
-        )
-
+    global _SOLDERS
+    if _SOLDERS is None:
+        try:
+            from solders.keypair import Keypair
+            from solders.transaction import VersionedTransaction
+            from solders.signature import Signature as SolanaSignature
+            from solders.message import to_bytes_versioned
+        except ImportError as e:
+            raise ImportError(
+                f"Missing dependency for Solana signing: {e}. "
+                "Run: pip install simmer-sdk --upgrade"
+            ) from e
+        _SOLDERS = {
+            "Keypair": Keypair,
+            "VersionedTransaction": VersionedTransaction,
+            "Signature": SolanaSignature,
+            "to_bytes_versioned": to_bytes_versioned,
+        }
+    return _SOLDERS
+
+
+def _keypair_from_secret(raw: str):
+    """Decode a base58 secret key into a solders Keypair."""
     try:
         import base58 as _base58
-        from solders.keypair import Keypair
     except ImportError as e:
         raise ImportError(
             f"Missing dependency for Solana signing: {e}. "
             "Run: pip install simmer-sdk --upgrade"
         ) from e
+    Keypair = _load_solders()["Keypair"]
 
     try:
         key_bytes = _base58.b58decode(raw.strip())
@@ -74,6 +97,164 @@ def _load_keypair():
         raise ValueError(f"Could not load Solana keypair: {e}") from e
 
 
+def _load_keypair():
+    """
+    Load a solders Keypair from the SOLANA_PRIVATE_KEY env var.
+
+    The decoded keypair is cached for the process and rebuilt only when the
+    env var changes or reload() is called.
+
+    Returns:
+        solders.keypair.Keypair
+
+    Raises:
+        ValueError: If env var is not set or key format is invalid
+        ImportError: If solders/base58 are not installed
+    """
+    global _KEYPAIR_CACHE
+    raw = os.environ.get(SOLANA_PRIVATE_KEY_ENV_VAR)
+    if not raw:
+        raise ValueError(
+            f"{SOLANA_PRIVATE_KEY_ENV_VAR} environment variable is not set. "
+            "Set it to your base58-encoded Solana secret key."
+        )
+
+    cached = _KEYPAIR_CACHE
+    if cached is not None and cached[0] == raw:
+        return cached[1]
+    with _KEYPAIR_LOCK:
+        if _KEYPAIR_CACHE is None or _KEYPAIR_CACHE[0] != raw:
+            _KEYPAIR_CACHE = (raw, _keypair_from_secret(raw))
+        return _KEYPAIR_CACHE[1]
+
+
+def reload() -> Optional[str]:
+    """
+    Drop the cached keypair and load it again from the environment.
+
+    Call after rotating SOLANA_PRIVATE_KEY in-process.
+
+    Returns:
+        The new public key, or None if no key is configured.
+    """
+    global _KEYPAIR_CACHE
+    with _KEYPAIR_LOCK:
+        _KEYPAIR_CACHE = None
+    return get_solana_public_key()
+
+
+class SolanaSigner:
+    """
+    Signs Kalshi (DFlow) VersionedTransactions with one cached keypair.
+
+    Holds the decoded keypair and the solders types, so each signature costs
+    only the ed25519 signing itself. SimmerClient keeps one for Kalshi trades.
+
+    Example:
+        signer = SolanaSigner.from_env()
+        signed = signer.sign(quote["transaction"])
+        signed_batch = signer.sign_many([q["transaction"] for q in quotes])
+    """
+
+    def __init__(self, keypair=None):
+        """
+        Args:
+            keypair: solders Keypair (default: the cached SOLANA_PRIVATE_KEY keypair)
+        """
+        self._libs = _load_solders()
+        self._keypair = keypair if keypair is not None else _load_keypair()
+        self._pubkey = self._keypair.pubkey()
+        self.public_key = str(self._pubkey)
+
+    @classmethod
+    def from_env(cls) -> "SolanaSigner":
+        """Signer for the SOLANA_PRIVATE_KEY env var."""
+        return cls(_load_keypair())
+
+    def sign(self, unsigned_tx_base64: str) -> str:
+        """
+        Sign one base64 VersionedTransaction.
+
+        Returns:
+            Base64-encoded signed transaction
+
+        Raises:
+            ValueError: If the transaction is not valid base64
+            RuntimeError: If signing fails or this key is not a required signer
+        """
+        try:
+            tx_bytes = base64.b64decode(unsigned_tx_base64)
+        except Exception as e:
+            raise ValueError(f"Invalid base64 transaction: {e}") from e
+
+        libs = self._libs
+        try:
+            tx = libs["VersionedTransaction"].from_bytes(tx_bytes)
+            message = tx.message
+
+            # to_bytes_versioned returns the exact bytes Solana verifies signatures
+            # against — NOT the same as bytes(message) which is raw Rust serialization.
+            signature = self._keypair.sign_message(libs["to_bytes_versioned"](message))
+
+            # Find our keypair's position among the required signers.
+            # In a VersionedTransaction, account_keys[0..num_required_signatures-1] are signers.
+            pubkey = self._pubkey
+            account_keys = message.account_keys
+            num_required = message.header.num_required_signatures
+
+            signer_idx = None
+            for i in range(min(num_required, len(account_keys))):
+                if account_keys[i] == pubkey:
+                    signer_idx = i
+                    break
+
+            if signer_idx is None:
+                raise RuntimeError(
+                    f"Keypair {pubkey} not found among required signers. "
+                    f"Signers: {[str(account_keys[i]) for i in range(min(num_required, len(account_keys)))]}"
+                )
+
+            # Preserve any existing signatures (e.g., DFlow co-signatures).
+            # Only replace our own slot; leave all other slots intact.
+            existing_sigs = list(tx.signatures)
+            while len(existing_sigs) < num_required:
+                existing_sigs.append(libs["Signature"].default())
+            existing_sigs[signer_idx] = signature
+
+            signed_tx = libs["VersionedTransaction"].populate(message, existing_sigs)
+            return base64.b64encode(bytes(signed_tx)).decode()
+        except RuntimeError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Solana signing failed: {e}") from e
+
+    def sign_many(
+        self,
+        unsigned_txs_base64: List[str],
+        return_exceptions: bool = False,
+    ) -> List[Union[str, Exception]]:
+        """
+        Sign several base64 VersionedTransactions.
+
+        Args:
+            unsigned_txs_base64: Transactions to sign
+            return_exceptions: Put per-transaction exceptions in the result
+                list instead of raising the first one
+
+        Returns:
+            Signed base64 transactions (or exceptions), in input order
+        """
+        results: List[Union[str, Exception]] = []
+        for tx in unsigned_txs_base64:
+            try:
+                results.append(self.sign(tx))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+
 def get_solana_public_key() -> Optional[str]:
     """
     Get the Solana public key (wallet address) from the configured private key.
@@ -97,7 +278,8 @@ def sign_solana_transaction(unsigned_tx_base64: str) -> str:
     Sign a Solana transaction using the configured private key.
 
     The transaction must be a VersionedTransaction serialized to base64.
-    This is the format returned by DFlow for Kalshi trades.
+    This is the format returned by DFlow for Kalshi trades. Uses the cached
+    keypair; keep a SolanaSigner to sign many transactions.
 
     Args:
         unsigned_tx_base64: Base64-encoded unsigned VersionedTransaction
@@ -119,64 +301,7 @@ def sign_solana_transaction(unsigned_tx_base64: str) -> str:
         # Submit signed tx
         result = api.submit_kalshi_trade(signed_transaction=signed, ...)
     """
-    import base64
-
-    try:
-        from solders.transaction import VersionedTransaction
-        from solders.signature import Signature as SolanaSignature
-        from solders.message import to_bytes_versioned
-    except ImportError as e:
-        raise ImportError(
-            f"Missing dependency for Solana signing: {e}. "
-            "Run: pip install simmer-sdk --upgrade"
-        ) from e
-
-    keypair = _load_keypair()
-
-    try:
-        tx_bytes = base64.b64decode(unsigned_tx_base64)
-    except Exception as e:
-        raise ValueError(f"Invalid base64 transaction: {e}") from e
-
-    try:
-        tx = VersionedTransaction.from_bytes(tx_bytes)
-        message = tx.message
-
-        # to_bytes_versioned returns the exact bytes Solana verifies signatures
-        # against — NOT the same as bytes(message) which is raw Rust serialization.
-        signature = keypair.sign_message(to_bytes_versioned(message))
-
-        # Find our keypair's position among the required signers.
-        # In a VersionedTransaction, account_keys[0..num_required_signatures-1] are signers.
-        pubkey = keypair.pubkey()
-        account_keys = message.account_keys
-        num_required = message.header.num_required_signatures
-
-        signer_idx = None
-        for i in range(min(num_required, len(account_keys))):
-            if account_keys[i] == pubkey:
-                signer_idx = i
-                break
-
-        if signer_idx is None:
-            raise RuntimeError(
-                f"Keypair {pubkey} not found among required signers. "
-                f"Signers: {[str(account_keys[i]) for i in range(min(num_required, len(account_keys)))]}"
-            )
-
-        # Preserve any existing signatures (e.g., DFlow co-signatures).
-        # Only replace our own slot; leave all other slots intact.
-        existing_sigs = list(tx.signatures)
-        while len(existing_sigs) < num_required:
-            existing_sigs.append(SolanaSignature.default())
-        existing_sigs[signer_idx] = signature
-
-        signed_tx = VersionedTransaction.populate(message, existing_sigs)
-        return base64.b64encode(bytes(signed_tx)).decode()
-    except RuntimeError:
-        raise
-    except Exception as e:
-        raise RuntimeError(f"Solana signing failed: {e}") from e
+    return SolanaSigner.from_env().sign(unsigned_tx_base64)
 
 
 def validate_solana_key() -> bool:
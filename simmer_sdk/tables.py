@@ -0,0 +1,432 @@
+"""
+Compact Market and Position Storage
+
+Two lighter alternatives to lists of Market / Position dataclasses, for bots
+that hold a whole catalog or position book in memory.
+
+Slotted records: MarketRecord, PositionRecord and TradeRecord have the same
+fields as Market, Position and TradeResult but use __slots__ instead of a
+per-instance __dict__. They need roughly half the memory and give the
+garbage collector less to track.
+
+Columnar tables: MarketTable and PositionTable store each field as one
+column, built in a single pass over an API page. Prices, probabilities,
+divergence and P&L are NumPy float arrays (missing values are NaN), so
+filtering and sorting a few thousand markets is a handful of vectorized
+operations instead of a Python loop. Tables need NumPy
+(pip install simmer-sdk[tables]); the records do not.
+
+Usage:
+    table = client.get_market_table(import_source="polymarket")
+    hot = table.where(min_abs_divergence=0.1, max_probability=0.9)
+    for market in hot.sort_by("divergence", descending=True, absolute=True)[:10]:
+        print(market.question, market.divergence)
+
+    table.column("divergence")        # numpy.ndarray
+    hot.to_markets()                   # List[Market] for existing code
+"""
+
+from array import array
+from dataclasses import MISSING, fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .client import Market, Position, TradeResult
+
+_NAN = float("nan")
+
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def _load_numpy():
+    """
+    Import numpy on first use.
+
+    Raises:
+        ImportError: If numpy is not installed
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "MarketTable and PositionTable require numpy. "
+            "Install with: pip install simmer-sdk[tables]"
+        ) from e
+    return numpy
+
+
+# =============================================================================
+# Slotted records
+# =============================================================================
+
+class _Record:
+    """Base for slotted mirrors of the SDK dataclasses. Subclasses set __slots__ and _source."""
+    __slots__ = ()
+    _source: type = object
+    _defaults: Dict[str, Any] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._defaults = {f.name: f.default for f in fields(cls._source) if f.default is not MISSING}
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        names = self.__slots__
+        if len(args) > len(names):
+            raise TypeError(f"{type(self).__name__} takes at most {len(names)} positional arguments")
+        for name, value in zip(names, args):
+            if name in kwargs:
+                raise TypeError(f"{type(self).__name__} got multiple values for '{name}'")
+            kwargs[name] = value
+        for name in names:
+            if name in kwargs:
+                setattr(self, name, kwargs.pop(name))
+            elif name in self._defaults:
+                setattr(self, name, self._defaults[name])
+            else:
+                raise TypeError(f"{type(self).__name__} missing required argument '{name}'")
+        if kwargs:
+            raise TypeError(f"{type(self).__name__} got unexpected arguments: {', '.join(kwargs)}")
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]):
+        """Build from an API dict, with the same defaults as the SDK's parsers."""
+        record = object.__new__(cls)
+        defaults = cls._defaults
+        for name in cls.__slots__:
+            setattr(record, name, data.get(name, defaults[name]) if name in defaults else data[name])
+        return record
+
+    @classmethod
+    def from_dataclass(cls, obj: Any):
+        """Copy a Market / Position / TradeResult."""
+        record = object.__new__(cls)
+        for name in cls.__slots__:
+            setattr(record, name, getattr(obj, name))
+        return record
+
+    def to_dataclass(self):
+        """The equivalent Market / Position / TradeResult."""
+        return self._source(**self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is type(self):
+            return all(getattr(self, n) == getattr(other, n) for n in self.__slots__)
+        if isinstance(other, self._source):
+            return all(getattr(self, n) == getattr(other, n) for n in self.__slots__)
+        return NotImplemented
+
+    __hash__ = None  # Mutable, like the dataclasses
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{n}={getattr(self, n)!r}" for n in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+
+class MarketRecord(_Record):
+    """Market with __slots__ (same fields and attribute access)."""
+    __slots__ = _field_names(Market)
+    _source = Market
+
+
+class PositionRecord(_Record):
+    """Position with __slots__ (same fields and attribute access)."""
+    __slots__ = _field_names(Position)
+    _source = Position
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "PositionRecord":
+        record = super().from_api(data)
+        record.redeemable = bool(record.redeemable)
+        return record
+
+
+class TradeRecord(_Record):
+    """TradeResult with __slots__ (same fields and attribute access)."""
+    __slots__ = _field_names(TradeResult)
+    _source = TradeResult
+
+    @property
+    def fully_filled(self) -> bool:
+        """Check if order was fully filled (shares_bought >= shares_requested)."""
+        if self.shares_requested <= 0:
+            return self.success
+        return self.shares_bought >= self.shares_requested
+
+
+# =============================================================================
+# Columnar tables
+# =============================================================================
+
+class _Table:
+    """
+    Base for columnar tables. Subclasses list their float and bool columns;
+    every other field of _record is kept as a Python list.
+    """
+    _record: type = _Record
+    _floats: Tuple[str, ...] = ()
+    _bools: Tuple[str, ...] = ()
+
+    def __init__(self, columns: Dict[str, Any]):
+        """
+        Args:
+            columns: {field: numpy array or list}, all the same length.
+                Prefer the from_api() / from_records() constructors.
+        """
+        np = _load_numpy()
+        names = self._record.__slots__
+        missing = [n for n in names if n not in columns]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}")
+        lengths = {len(columns[n]) for n in names}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        self._np = np
+        self._columns: Dict[str, Any] = {}
+        for name in names:
+            if name in self._floats:
+                self._columns[name] = np.asarray(columns[name], dtype=np.float64)
+            elif name in self._bools:
+                self._columns[name] = np.asarray(columns[name], dtype=bool)
+            else:
+                self._columns[name] = list(columns[name])
+
+    @classmethod
+    def from_api(cls, rows: Iterable[Dict[str, Any]]):
+        """
+        Build a table in one pass over API dicts (e.g. data["markets"]).
+
+        Numeric columns are filled into compact C arrays as the rows are read,
+        then handed to NumPy without a copy; None becomes NaN.
+        """
+        np = _load_numpy()
+        record = cls._record
+        floats = {n: array("d") for n in cls._floats}
+        bools = {n: array("b") for n in cls._bools}
+        others: Dict[str, List[Any]] = {n: [] for n in record.__slots__ if n not in floats and n not in bools}
+        defaults = record._defaults
+
+        for row in rows:
+            for name in record.__slots__:
+                value = row.get(name, defaults[name]) if name in defaults else row[name]
+                if name in floats:
+                    floats[name].append(_NAN if value is None else float(value))
+                elif name in bools:
+                    bools[name].append(1 if value else 0)
+                else:
+                    others[name].append(value)
+
+        columns: Dict[str, Any] = dict(others)
+        for name, values in floats.items():
+            columns[name] = np.frombuffer(values, dtype=np.float64) if values else np.empty(0)
+        for name, values in bools.items():
+            columns[name] = np.frombuffer(values, dtype=np.int8).astype(bool) if values else np.empty(0, dtype=bool)
+        return cls(columns)
+
+    @classmethod
+    def from_records(cls, items: Iterable[Any]):
+        """Build from Market / Position objects or their records."""
+        items = list(items)
+        return cls({name: [getattr(item, name) for item in items] for name in cls._record.__slots__})
+
+    def __len__(self) -> int:
+        return len(self._columns[self._record.__slots__[0]])
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self._row(i)
+
+    def __getitem__(self, key: Union[int, slice, Sequence[int], Any]):
+        """table[i] -> record; table[slice | index array | bool mask] -> table."""
+        if isinstance(key, (int, self._np.integer)):
+            n = len(self)
+            if not -n <= key < n:
+                raise IndexError("table index out of range")
+            return self._row(key % n)
+        if isinstance(key, slice):
+            indices = self._np.arange(len(self))[key]
+        else:
+            key = self._np.asarray(key)
+            indices = self._np.flatnonzero(key) if key.dtype == bool else key
+        return self._take(indices)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} rows)"
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return self._record.__slots__
+
+    def column(self, name: str) -> Any:
+        """One column: a numpy array for numeric/bool fields, else a list."""
+        return self._columns[name]
+
+    def filter(self, mask: Any):
+        """Rows where the boolean mask is True, as a new table."""
+        return self[self._np.asarray(mask, dtype=bool)]
+
+    def sort_by(self, column: str, descending: bool = False, absolute: bool = False):
+        """
+        Rows ordered by a numeric column (NaN last), as a new table.
+
+        Args:
+            column: A float column, e.g. "divergence" or "pnl"
+            descending: Largest first
+            absolute: Order by magnitude (e.g. divergence in either direction)
+        """
+        np = self._np
+        values = self._float_column(column)
+        if absolute:
+            values = np.abs(values)
+        keys = -values if descending else values
+        # NaN sorts last either way
+        order = np.argsort(np.where(np.isnan(keys), np.inf, keys), kind="stable")
+        return self._take(order)
+
+    def top(self, n: int, column: str, absolute: bool = False):
+        """The n rows with the largest values in column."""
+        return self.sort_by(column, descending=True, absolute=absolute)[:n]
+
+    def to_records(self) -> List[Any]:
+        return list(self)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [self._row(i).to_dict() for i in range(len(self))]
+
+    def _float_column(self, name: str) -> Any:
+        if name not in self._floats:
+            raise ValueError(f"'{name}' is not a numeric column. Use one of: {', '.join(self._floats)}")
+        return self._columns[name]
+
+    def _row(self, i: int) -> Any:
+        record = object.__new__(self._record)
+        for name, values in self._columns.items():
+            value = values[i]
+            if name in self._floats:
+                value = float(value)
+                if value != value:  # NaN -> None
+                    value = None
+            elif name in self._bools:
+                value = bool(value)
+            setattr(record, name, value)
+        return record
+
+    def _take(self, indices: Any):
+        table = object.__new__(type(self))
+        table._np = self._np
+        table._columns = {
+            name: values[indices] if not isinstance(values, list) else [values[i] for i in indices]
+            for name, values in self._columns.items()
+        }
+        return table
+
+    def _range_mask(self, mask: Any, name: str, low: Optional[float], high: Optional[float], absolute: bool = False) -> Any:
+        if low is None and high is None:
+            return mask
+        values = self._columns[name]
+        if absolute:
+            values = self._np.abs(values)
+        # Comparisons with NaN are False, so rows missing the value drop out
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+        return mask
+
+    def _equals_mask(self, mask: Any, name: str, value: Optional[str]) -> Any:
+        if value is None:
+            return mask
+        return mask & self._np.fromiter((v == value for v in self._columns[name]), dtype=bool, count=len(self))
+
+
+class MarketTable(_Table):
+    """
+    Columnar markets.
+
+    Float columns: current_probability, external_price_yes, divergence.
+    Bool column: is_sdk_only. Everything else is a list.
+    """
+    _record = MarketRecord
+    _floats = ("current_probability", "external_price_yes", "divergence")
+    _bools = ("is_sdk_only",)
+
+    def where(
+        self,
+        status: Optional[str] = None,
+        import_source: Optional[str] = None,
+        min_probability: Optional[float] = None,
+        max_probability: Optional[float] = None,
+        min_divergence: Optional[float] = None,
+        max_divergence: Optional[float] = None,
+        min_abs_divergence: Optional[float] = None,
+        include_sdk_only: bool = True,
+    ) -> "MarketTable":
+        """
+        Rows matching every given condition, as a new table.
+
+        Example:
+            # Polymarket markets where Simmer's AI disagrees by 10+ points
+            table.where(import_source="polymarket", min_abs_divergence=0.1)
+        """
+        mask = self._np.ones(len(self), dtype=bool)
+        mask = self._equals_mask(mask, "status", status)
+        mask = self._equals_mask(mask, "import_source", import_source)
+        mask = self._range_mask(mask, "current_probability", min_probability, max_probability)
+        mask = self._range_mask(mask, "divergence", min_divergence, max_divergence)
+        mask = self._range_mask(mask, "divergence", min_abs_divergence, None, absolute=True)
+        if not include_sdk_only:
+            mask &= ~self._columns["is_sdk_only"]
+        return self[mask]
+
+    def to_markets(self) -> List[Market]:
+        """Convert to a list of Market dataclasses."""
+        return [record.to_dataclass() for record in self]
+
+
+class PositionTable(_Table):
+    """
+    Columnar positions.
+
+    Float columns: shares, value, P&L, cost and price fields.
+    Bool column: redeemable. Everything else is a list.
+    """
+    _record = PositionRecord
+    _floats = (
+        "shares_yes", "shares_no", "current_value", "pnl",
+        "sim_balance", "cost_basis", "avg_cost", "current_price",
+    )
+    _bools = ("redeemable",)
+
+    def where(
+        self,
+        venue: Optional[str] = None,
+        status: Optional[str] = None,
+        min_pnl: Optional[float] = None,
+        max_pnl: Optional[float] = None,
+        min_value: Optional[float] = None,
+        redeemable: Optional[bool] = None,
+    ) -> "PositionTable":
+        """Rows matching every given condition, as a new table."""
+        mask = self._np.ones(len(self), dtype=bool)
+        mask = self._equals_mask(mask, "venue", venue)
+        mask = self._equals_mask(mask, "status", status)
+        mask = self._range_mask(mask, "pnl", min_pnl, max_pnl)
+        mask = self._range_mask(mask, "current_value", min_value, None)
+        if redeemable is not None:
+            mask &= self._columns["redeemable"] == redeemable
+        return self[mask]
+
+    @property
+    def total_value(self) -> float:
+        return float(self._np.nansum(self._columns["current_value"]))
+
+    @property
+    def total_pnl(self) -> float:
+        return float(self._np.nansum(self._columns["pnl"]))
+
+    def to_positions(self) -> List[Position]:
+        """Convert to a list of Position dataclasses."""
+        return [record.to_dataclass() for record in self]
@@ -0,0 +1,394 @@
+"""
+Tracing Spans
+
+Optional tracing for the SDK and skills. When enabled, every public client
+method and every API request opens a span (request spans carry method,
+route, status code and response size), and spans nest: a skill's fetch
+helpers, the client methods it calls and their HTTP requests all end up in
+one trace.
+
+Tracing is off by default. While off, span() hands back a shared no-op
+object, so instrumented code costs one function call and a global check.
+
+Backends:
+- Built-in tracer: enable(exporter) records spans and passes finished ones
+  to exporters. InMemorySpanExporter keeps them in a list for tests.
+- OpenTelemetry: use_opentelemetry() sends spans to the opentelemetry-api
+  tracer, so they join your existing traces and exporters
+  (pip install opentelemetry-api opentelemetry-sdk).
+
+The Span API (set_attribute, set_attributes, record_exception, add_event)
+mirrors OpenTelemetry's, so instrumented code works with either backend.
+
+Usage:
+    from simmer_sdk import tracing
+
+    exporter = tracing.InMemorySpanExporter()
+    tracing.enable(exporter)
+    client.get_market_context(market_id)
+    for s in exporter.get_finished_spans():
+        print(s.name, s.attributes, s.duration)
+"""
+
+import contextvars
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Span kinds (OpenTelemetry names)
+INTERNAL = "INTERNAL"
+CLIENT = "CLIENT"
+
+_current_span = contextvars.ContextVar("simmer_span", default=None)
+
+# Active backend: None (off), a Tracer, or an _OpenTelemetryBackend
+_backend: Any = None
+
+
+class _NoopSpan:
+    """Span stand-in while tracing is off. Every method does nothing."""
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        pass
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def is_recording(self) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """
+    A span from the built-in tracer.
+
+    Use it as a context manager: entering makes it the current span (so
+    spans opened inside become its children), leaving ends it. An exception
+    escaping the block is recorded and sets status to "ERROR".
+    """
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        parent: Optional["Span"],
+        kind: str = INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent is not None else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent.span_id if parent is not None else None
+        self.attributes: Dict[str, Any] = dict(attributes) if attributes else {}
+        self.events: List[Dict[str, Any]] = []
+        self.status = "UNSET"  # "UNSET", "OK" or "ERROR"
+        self.status_description: Optional[str] = None
+        self.start_time = time.time_ns()
+        self.end_time: Optional[int] = None
+        self._tracer = tracer
+        self._token = None
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, status={self.status}, duration={self.duration:.6f}, attributes={self.attributes})"
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None:
+            self.record_exception(exc)
+            self.status = "ERROR"
+            self.status_description = f"{exc_type.__name__}: {exc}"
+        if self._token is not None:
+            _current_span.reset(self._token)
+            self._token = None
+        self.end()
+
+    @property
+    def duration(self) -> float:
+        """Seconds from start to end (to now if still open)."""
+        end = self.end_time if self.end_time is not None else time.time_ns()
+        return (end - self.start_time) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        self.attributes.update(attributes)
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        self.events.append({"name": name, "time": time.time_ns(), "attributes": attributes or {}})
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.add_event("exception", {
+            "exception.type": type(exception).__name__,
+            "exception.message": str(exception),
+        })
+
+    def is_recording(self) -> bool:
+        return self.end_time is None
+
+    def end(self) -> None:
+        """End the span and hand it to the exporters (only the first call counts)."""
+        if self.end_time is None:
+            self.end_time = time.time_ns()
+            self._tracer._export(self)
+
+
+class InMemorySpanExporter:
+    """Keeps finished spans in memory; for tests and local debugging."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spans: List[Span] = []
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+
+    def get_finished_spans(self) -> List[Span]:
+        """Finished spans, in the order they ended."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def shutdown(self) -> None:
+        pass
+
+
+class Tracer:
+    """
+    Built-in tracer. Finished spans go to every exporter, which is any
+    object with export(spans) (InMemorySpanExporter, or your own).
+    """
+
+    def __init__(self, exporters: Optional[Sequence[Any]] = None):
+        self._exporters = list(exporters or [])
+
+    def add_exporter(self, exporter: Any) -> None:
+        self._exporters.append(exporter)
+
+    def start_span(self, name: str, kind: str = INTERNAL, attributes: Optional[Dict[str, Any]] = None) -> Span:
+        """New child of the current span (or a new trace). Enter it to make it current."""
+        return Span(self, name, _current_span.get(), kind, attributes)
+
+    def current_span(self) -> Any:
+        return _current_span.get() or NOOP_SPAN
+
+    def _export(self, span: Span) -> None:
+        for exporter in self._exporters:
+            try:
+                exporter.export((span,))
+            except Exception:
+                logger.exception("Span exporter %r failed", exporter)
+
+
+class _OpenTelemetryBackend:
+    """Routes spans to an opentelemetry-api tracer."""
+
+    def __init__(self, tracer: Any):
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = tracer
+        self._kinds = {INTERNAL: trace.SpanKind.INTERNAL, CLIENT: trace.SpanKind.CLIENT}
+
+    def start_span(self, name: str, kind: str = INTERNAL, attributes: Optional[Dict[str, Any]] = None) -> Any:
+        return self._tracer.start_as_current_span(name, kind=self._kinds.get(kind), attributes=attributes)
+
+    def current_span(self) -> Any:
+        return self._trace.get_current_span()
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+def enable(exporter: Any = None) -> Tracer:
+    """
+    Turn on tracing with the built-in tracer.
+
+    Args:
+        exporter: Receives finished spans, e.g. InMemorySpanExporter()
+
+    Returns:
+        The active Tracer (add more exporters with add_exporter())
+    """
+    global _backend
+    tracer = Tracer([exporter] if exporter is not None else None)
+    _backend = tracer
+    return tracer
+
+
+def use_opentelemetry(tracer: Any = None) -> None:
+    """
+    Send spans to OpenTelemetry instead of the built-in tracer.
+
+    Args:
+        tracer: An opentelemetry Tracer (default: trace.get_tracer("simmer_sdk")
+            from the globally configured TracerProvider)
+
+    Raises:
+        ImportError: If opentelemetry-api is not installed
+    """
+    global _backend
+    try:
+        from opentelemetry import trace
+    except ImportError as e:
+        raise ImportError(
+            "opentelemetry-api is required for use_opentelemetry(). "
+            "Install with: pip install opentelemetry-api opentelemetry-sdk"
+        ) from e
+    _backend = _OpenTelemetryBackend(tracer or trace.get_tracer("simmer_sdk"))
+
+
+def disable() -> None:
+    """Turn tracing off (spans become no-ops again)."""
+    global _backend
+    _backend = None
+
+
+def is_enabled() -> bool:
+    return _backend is not None
+
+
+# =============================================================================
+# Instrumentation API
+# =============================================================================
+
+def span(name: str, attributes: Optional[Dict[str, Any]] = None, kind: str = INTERNAL) -> Any:
+    """
+    Context manager opening a span as a child of the current one.
+
+    Returns a shared no-op span while tracing is off.
+
+    Example:
+        with tracing.span("weather.noaa_forecast", {"location": "NYC"}) as s:
+            data = fetch(...)
+            s.set_attribute("periods", len(data))
+    """
+    backend = _backend
+    if backend is None:
+        return NOOP_SPAN
+    return backend.start_span(name, kind, attributes)
+
+
+def current_span() -> Any:
+    """The innermost open span (a no-op span if none or tracing is off)."""
+    backend = _backend
+    if backend is None:
+        return NOOP_SPAN
+    return backend.current_span()
+
+
+def http_span(method: str, endpoint: str) -> Any:
+    """Client span for one API request, named "<METHOD> <route>"."""
+    backend = _backend
+    if backend is None:
+        return NOOP_SPAN
+    from .instrumentation import endpoint_route
+
+    route = endpoint_route(endpoint)
+    return backend.start_span(f"{method} {route}", CLIENT, {
+        "http.request.method": method,
+        "http.route": route,
+        "url.path": endpoint.split("?", 1)[0],
+    })
+
+
+def request_span(name: str, method: str, url: str) -> Any:
+    """
+    Client span for an HTTP call made outside the SDK client, e.g. a skill's
+    fetch helper. url may be absolute or a path.
+
+    Only the scheme, host and path are recorded: query strings can carry
+    API keys and search terms.
+    """
+    backend = _backend
+    if backend is None:
+        return NOOP_SPAN
+    from urllib.parse import urlsplit
+
+    parts = urlsplit(url)
+    attributes = {"http.request.method": method, "url.path": parts.path}
+    if parts.hostname:
+        attributes["url.scheme"] = parts.scheme
+        attributes["server.address"] = parts.hostname
+    return backend.start_span(name, CLIENT, attributes)
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """
+    Decorator running a function (sync or async) inside a span.
+
+    Generators are left as they are, since their work happens after the
+    call returns.
+
+    Args:
+        name: Span name (default: the function's qualified name)
+    """
+    def decorate(fn: Callable) -> Callable:
+        if inspect.isgeneratorfunction(fn) or inspect.isasyncgenfunction(fn):
+            return fn
+        span_name = name or fn.__qualname__
+        attributes = {"code.function": fn.__name__}
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if _backend is None:
+                    return await fn(*args, **kwargs)
+                with _backend.start_span(span_name, INTERNAL, attributes):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _backend is None:
+                return fn(*args, **kwargs)
+            with _backend.start_span(span_name, INTERNAL, attributes):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    return decorate
+
+
+def trace_public_methods(cls: type) -> type:
+    """
+    Class decorator wrapping every public method of cls with traced().
+
+    Spans are named "<Class>.<method>". Properties, static/class methods
+    and generators are left alone.
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value):
+            continue
+        setattr(cls, attr, traced(f"{cls.__name__}.{attr}")(value))
+    return cls
@@ -21,6 +21,8 @@ from pathlib import Path
 from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 
+from simmer_sdk.tracing import request_span
+
 # Force line-buffered stdout so output is visible in non-TTY environments (cron, Docker, OpenClaw)
 sys.stdout.reconfigure(line_buffering=True)
 
@@ -95,7 +97,8 @@ def api_request(api_key: str, endpoint: str) -> dict:
         "Content-Type": "application/json"
     })
     try:
-        with urlopen(req, timeout=30) as resp:
+        with request_span("ai_divergence.api_request", "GET", endpoint), \
+                urlopen(req, timeout=30) as resp:
             return json.loads(resp.read().decode())
     except HTTPError as e:
         error_body = e.read().decode() if e.fp else ""
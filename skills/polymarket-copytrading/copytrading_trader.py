@@ -32,6 +32,8 @@ from datetime import datetime
 from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 
+from simmer_sdk.tracing import request_span
+
 # Force line-buffered stdout so output is visible in non-TTY environments (cron, Docker, OpenClaw)
 sys.stdout.reconfigure(line_buffering=True)
 
@@ -200,7 +202,8 @@ def api_request(method: str, endpoint: str, data: dict = None) -> dict:
     req = Request(url, data=body, headers=headers, method=method)
 
     try:
-        with urlopen(req, timeout=60) as response:
+        with request_span("copytrading.api_request", method, endpoint), \
+                urlopen(req, timeout=60) as response:
             return json.loads(response.read().decode("utf-8"))
     except HTTPError as e:
         error_body = e.read().decode("utf-8")
@@ -26,6 +26,8 @@ import argparse
 from urllib.request import urlopen, Request
 from urllib.error import HTTPError, URLError
 
+from simmer_sdk.tracing import request_span
+
 # Force line-buffered stdout so output is visible in non-TTY environments (cron, Docker, OpenClaw)
 sys.stdout.reconfigure(line_buffering=True)
 
@@ -154,6 +156,7 @@ TIME_TO_RESOLUTION_MIN_HOURS = 1  # Tweet markets are shorter, allow closer-to-r
 # =============================================================================
 
 _client = None
+_index_refreshed = False  # Market index rebuilt during this run_strategy() cycle
 
 def get_client():
     """Lazy-init SimmerClient singleton."""
@@ -169,7 +172,13 @@ def get_client():
             print("Error: SIMMER_API_KEY environment variable not set")
             print("Get your API key from: simmer.markets/dashboard → SDK tab")
             sys.exit(1)
-        _client = SimmerClient(api_key=api_key, venue="polymarket")
+        # Keep the market search index next to this skill between runs
+        index_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "market_index.json")
+        try:
+            _client = SimmerClient(api_key=api_key, venue="polymarket", market_index_path=index_path)
+        except TypeError:
+            # Older simmer-sdk without a market index
+            _client = SimmerClient(api_key=api_key, venue="polymarket")
     return _client
 
 # =============================================================================
@@ -180,7 +189,7 @@ def fetch_json(url, headers=None):
     """Fetch JSON from URL with error handling."""
     try:
         req = Request(url, headers=headers or {})
-        with urlopen(req, timeout=30) as response:
+        with request_span("elon_tweets.fetch_json", "GET", url), urlopen(req, timeout=30) as response:
             return json.loads(response.read().decode())
     except HTTPError as e:
         print(f"  HTTP Error {e.code}: {url}")
@@ -323,10 +332,30 @@ def execute_sell(market_id, shares):
         return {"error": str(e)}
 
 
-def search_markets(query):
-    """Search Simmer for markets matching a query."""
+def search_markets(query, refresh=False):
+    """
+    Search Simmer for markets matching a query.
+
+    Looks in the SDK's local market index first, so most cycles need no
+    search request. The index is rebuilt when stale or when refresh=True,
+    but at most once per cycle. Falls back to the server-side search if the
+    index has no match.
+    """
+    global _index_refreshed
+    client = get_client()
+    index = getattr(client, "market_index", None)
+    if index is not None:
+        try:
+            if (refresh or index.stale) and not _index_refreshed:
+                _index_refreshed = True
+                client.refresh_market_index()
+            hits = index.search(query, limit=100, status="active")
+            if hits:
+                return hits
+        except Exception as e:
+            print(f"  ⚠️  Market index search failed ({e}) — using server search")
     try:
-        data = get_client()._request("GET", "/api/sdk/markets", params={
+        data = client._request("GET", "/api/sdk/markets", params={
             "q": query, "status": "active", "limit": 100
         })
         return data.get("markets", [])
@@ -550,6 +579,9 @@ def run_strategy(dry_run=True, positions_only=False, show_config=False,
                  show_stats=False, smart_sizing=False, use_safeguards=True,
                  quiet=False):
     """Run the Elon tweet trading strategy."""
+    global _index_refreshed
+    _index_refreshed = False
+
     def log(msg, force=False):
         if not quiet or force:
             print(msg)
@@ -685,7 +717,7 @@ def run_strategy(dry_run=True, positions_only=False, show_config=False,
                     }
                 elif event_id:
                     # Response didn't include markets — fall back to search
-                    mkt_list = search_markets(title[:50])
+                    mkt_list = search_markets(title[:50], refresh=True)
                     if mkt_list:
                         events[event_id] = {
                             "name": result.get("event_name", title),
@@ -25,6 +25,8 @@ from urllib.request import urlopen, Request
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode, quote
 
+from simmer_sdk.tracing import request_span
+
 # Force line-buffered stdout for non-TTY environments (cron, Docker, OpenClaw)
 sys.stdout.reconfigure(line_buffering=True)
 
@@ -211,7 +213,7 @@ def _api_request(url, method="GET", data=None, headers=None, timeout=15):
             body = json.dumps(data).encode("utf-8")
             req_headers["Content-Type"] = "application/json"
         req = Request(url, data=body, headers=req_headers, method=method)
-        with urlopen(req, timeout=timeout) as resp:
+        with request_span("fastloop.api_request", method, url), urlopen(req, timeout=timeout) as resp:
             return json.loads(resp.read().decode("utf-8"))
     except HTTPError as e:
         try:
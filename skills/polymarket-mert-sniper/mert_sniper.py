@@ -24,6 +24,8 @@ from urllib.request import urlopen, Request
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
 
+from simmer_sdk.tracing import request_span
+
 # Force line-buffered stdout so output is visible in non-TTY environments (cron, Docker, OpenClaw)
 sys.stdout.reconfigure(line_buffering=True)
 
@@ -117,7 +119,7 @@ SLIPPAGE_MAX_PCT = 0.15
 def fetch_json(url, headers=None):
     try:
         req = Request(url, headers=headers or {})
-        with urlopen(req, timeout=30) as response:
+        with request_span("mert_sniper.fetch_json", "GET", url), urlopen(req, timeout=30) as response:
             return json.loads(response.read().decode())
     except HTTPError as e:
         print(f"  HTTP Error {e.code}: {url}")
@@ -151,7 +153,8 @@ def sdk_request(api_key, method, endpoint, data=None):
         else:
             body = json.dumps(data).encode() if data else None
             req = Request(url, data=body, headers=headers, method=method)
-        with urlopen(req, timeout=30) as response:
+        with request_span("mert_sniper.sdk_request", method, endpoint), \
+                urlopen(req, timeout=30) as response:
             return json.loads(response.read().decode())
     except HTTPError as e:
         error_body = e.read().decode() if e.fp else str(e)
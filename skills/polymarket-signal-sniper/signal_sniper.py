@@ -34,6 +34,8 @@ sys.stdout.reconfigure(line_buffering=True)
 from urllib.parse import urlparse
 from xml.etree import ElementTree as ET
 
+from simmer_sdk.tracing import request_span
+
 # Try to use defusedxml for secure XML parsing (XXE protection)
 try:
     import defusedxml.ElementTree as DefusedET
@@ -378,7 +380,8 @@ def sdk_request(method: str, endpoint: str, data: Optional[Dict] = None) -> Dict
         req = Request(url, data=body, headers=headers, method=method)
 
     try:
-        with urlopen(req, timeout=REQUEST_TIMEOUT_SECONDS) as response:
+        with request_span("signal_sniper.sdk_request", method, endpoint), \
+                urlopen(req, timeout=REQUEST_TIMEOUT_SECONDS) as response:
             return json.loads(response.read())
     except HTTPError as e:
         # Parse error safely without exposing potentially sensitive content
@@ -25,6 +25,8 @@ from urllib.request import urlopen, Request
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
 
+from simmer_sdk.tracing import request_span, traced
+
 # Force line-buffered stdout so output is visible in non-TTY environments (cron, Docker, OpenClaw)
 sys.stdout.reconfigure(line_buffering=True)
 
@@ -161,7 +163,7 @@ def fetch_json(url, headers=None):
     """Fetch JSON from URL with error handling."""
     try:
         req = Request(url, headers=headers or {})
-        with urlopen(req, timeout=30) as response:
+        with request_span("weather.fetch_json", "GET", url), urlopen(req, timeout=30) as response:
             return json.loads(response.read().decode())
     except HTTPError as e:
         print(f"  HTTP Error {e.code}: {url}")
@@ -343,7 +345,7 @@ def sdk_request(api_key: str, method: str, endpoint: str, data: dict = None) ->
             body = json.dumps(data).encode() if data else None
             req = Request(url, data=body, headers=headers, method=method)
 
-        with urlopen(req, timeout=30) as response:
+        with request_span("weather.sdk_request", method, endpoint), urlopen(req, timeout=30) as response:
             return json.loads(response.read().decode())
     except HTTPError as e:
         error_body = e.read().decode() if e.fp else str(e)
@@ -702,6 +704,7 @@ def check_exit_opportunities(api_key: str, dry_run: bool = False, use_safeguards
 # Main Strategy Logic
 # =============================================================================
 
+@traced("weather.run_strategy")
 def run_weather_strategy(dry_run: bool = True, positions_only: bool = False,
                          show_config: bool = False, smart_sizing: bool = False,
                          use_safeguards: bool = True, use_trends: bool = True,
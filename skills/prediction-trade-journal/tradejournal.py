@@ -33,6 +33,8 @@ from urllib.error import HTTPError, URLError
 sys.stdout.reconfigure(line_buffering=True)
 from urllib.parse import urlencode
 
+from simmer_sdk.tracing import request_span
+
 
 # =============================================================================
 # Configuration (config.json > env vars > defaults)
@@ -196,7 +198,8 @@ def api_request(method: str, endpoint: str, params: Dict = None) -> Dict:
     req = Request(url, headers=headers, method=method)
 
     try:
-        with urlopen(req, timeout=REQUEST_TIMEOUT_SECONDS) as response:
+        with request_span("tradejournal.api_request", method, endpoint), \
+                urlopen(req, timeout=REQUEST_TIMEOUT_SECONDS) as response:
             return json.loads(response.read().decode("utf-8"))
     except HTTPError as e:
         error_body = e.read().decode("utf-8")
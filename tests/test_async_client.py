@@ -0,0 +1,52 @@
+import asyncio
+import threading
+
+import httpx
+
+from simmer_sdk import AsyncSimmerClient
+from simmer_sdk.ratelimit import FileLockBackend, RateLimiter
+
+
+class RecordingFileBackend(FileLockBackend):
+    """FileLockBackend that records which thread took each reservation."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.threads = []
+
+    def reserve(self, bucket, config):
+        self.threads.append(threading.get_ident())
+        return super().reserve(bucket, config)
+
+
+def _client(rate_limiter):
+    client = AsyncSimmerClient(api_key="sk_test", rate_limiter=rate_limiter)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": True}))
+    client._http = httpx.AsyncClient(base_url=client.base_url, transport=transport)
+    return client
+
+
+def test_file_lock_reservation_runs_off_the_event_loop(tmp_path):
+    backend = RecordingFileBackend(str(tmp_path / "ratelimit.json"))
+
+    async def main():
+        async with _client(RateLimiter(backend=backend)) as client:
+            assert await client._request("GET", "/api/sdk/health", use_cache=False) == {"ok": True}
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(main())
+    assert backend.threads and loop_thread not in backend.threads
+
+
+def test_memory_reservation_stays_on_the_event_loop():
+    limiter = RateLimiter()
+    threads = []
+    reserve = limiter.backend.reserve
+    limiter.backend.reserve = lambda bucket, config: threads.append(threading.get_ident()) or reserve(bucket, config)
+
+    async def main():
+        async with _client(limiter) as client:
+            await client._request("GET", "/api/sdk/health", use_cache=False)
+        return threading.get_ident()
+
+    assert threads == [asyncio.run(main())]
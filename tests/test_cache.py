@@ -0,0 +1,120 @@
+import pytest
+
+from simmer_sdk import SimmerClient, cache
+from simmer_sdk.cache import ResponseCache, cache_category, cache_key
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache.time, "monotonic", clock)
+    return clock
+
+
+def test_cache_category():
+    assert cache_category("/api/sdk/markets/abc") == "market"
+    assert cache_category("/api/sdk/markets/importable") is None
+    assert cache_category("/api/sdk/context/abc") == "context"
+    assert cache_category("/api/sdk/user/settings") == "settings"
+    assert cache_category("/api/polymarket/allowances/0xabc") == "approvals"
+    assert cache_category("/api/polymarket/allowances/0xabc?no_cache=1") is None
+    assert cache_category("/api/sdk/markets") is None
+
+
+def test_cache_key_ignores_param_order():
+    assert cache_key("/x", {"a": 1, "b": 2}) == cache_key("/x", {"b": "2", "a": "1"})
+    assert cache_key("/x", None) == ("/x",)
+
+
+def test_entries_expire_after_ttl(clock):
+    responses = ResponseCache(ttls={"market": 5})
+    responses.set(("/m",), "market", {"id": "m"})
+    clock.now += 4.9
+    assert responses.get(("/m",), "market") == (True, {"id": "m"})
+    clock.now += 0.2
+    assert responses.get(("/m",), "market") == (False, None)
+    assert responses.stats()["size"] == 0
+
+
+def test_zero_ttl_disables_category(clock):
+    responses = ResponseCache(ttls={"context": 0})
+    responses.set(("/c",), "context", {})
+    assert responses.get(("/c",), "context") == (False, None)
+
+
+def test_lru_eviction(clock):
+    responses = ResponseCache(max_size=2)
+    responses.set(("a",), "market", 1)
+    responses.set(("b",), "market", 2)
+    responses.get(("a",), "market")  # "b" is now least recently used
+    responses.set(("c",), "market", 3)
+    assert responses.get(("b",), "market") == (False, None)
+    assert responses.get(("a",), "market") == (True, 1)
+    assert responses.stats()["evictions"] == 1
+
+
+def test_values_are_private_copies(clock):
+    responses = ResponseCache()
+    value = {"positions": [1]}
+    responses.set(("p",), "positions", value)
+    value["positions"].append(2)
+    _, cached = responses.get(("p",), "positions")
+    cached["positions"].append(3)
+    assert responses.get(("p",), "positions") == (True, {"positions": [1]})
+
+
+def test_invalidate_after_trade(clock):
+    responses = ResponseCache()
+    for key, category in [
+        (("/api/sdk/markets/m1",), "market"),
+        (("/api/sdk/context/m1",), "context"),
+        (("/api/sdk/markets/m2",), "market"),
+        (("/api/sdk/positions",), "positions"),
+        (("/api/sdk/user/settings",), "settings"),
+    ]:
+        responses.set(key, category, {})
+    assert responses.invalidate_after_trade("m1") == 3
+    assert responses.get(("/api/sdk/markets/m2",), "market")[0]
+    assert responses.get(("/api/sdk/user/settings",), "settings")[0]
+
+
+class Response:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, body):
+        self.content = body
+
+    def raise_for_status(self):
+        pass
+
+
+class Session:
+    def __init__(self):
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        return Response(b'{"market": {"id": "m1"}}')
+
+    def close(self):
+        pass
+
+
+def test_client_serves_repeated_reads_from_cache():
+    with SimmerClient(api_key="sk_test") as client:
+        client._session = Session()
+        client._request("GET", "/api/sdk/markets/m1")
+        client._request("GET", "/api/sdk/markets/m1")
+        assert client._session.calls == 1
+        client._request("GET", "/api/sdk/markets/m1", use_cache=False)
+        assert client._session.calls == 2
+        assert client.cache.stats()["by_category"]["market"] == {"hits": 1, "misses": 1}
@@ -0,0 +1,40 @@
+import time
+
+from simmer_sdk.metadata import MarketMetadata, MarketMetadataCache, is_stale_metadata_error
+
+MARKET = {"polymarket_token_id": "111", "polymarket_no_token_id": "222", "tick_size": 0.001, "fee_rate_bps": 100}
+
+
+def test_from_market_data():
+    metadata = MarketMetadata.from_market_data("m1", MARKET)
+    assert metadata.token_id("yes") == "111"
+    assert metadata.token_id("NO") == "222"
+    assert metadata.tick_size == 0.001
+    assert MarketMetadata.from_market_data("m1", {"question": "not polymarket"}) is None
+
+
+def test_entries_expire_after_max_age():
+    cache = MarketMetadataCache(max_age=60)
+    cache.put(MarketMetadata.from_market_data("m1", MARKET))
+    assert "m1" in cache
+    old = MarketMetadata("m2", "1", "2", fetched_at=time.time() - 120)
+    cache.put(old)
+    assert cache.get("m2") is None
+
+
+def test_discard_and_persistence(tmp_path):
+    path = str(tmp_path / "metadata.json")
+    cache = MarketMetadataCache(path)
+    cache.put_many([MarketMetadata.from_market_data(m, MARKET) for m in ("m1", "m2")])
+    cache.discard("m1")
+
+    reloaded = MarketMetadataCache(path)
+    assert reloaded.get("m1") is None
+    assert reloaded.get("m2").fee_rate_bps == 100
+
+
+def test_is_stale_metadata_error():
+    assert is_stale_metadata_error("order breaks minimum tick size rule: 0.01")
+    assert is_stale_metadata_error("invalid fee rate (0), current market's taker fee: 200")
+    assert not is_stale_metadata_error("not enough balance")
+    assert not is_stale_metadata_error(None)
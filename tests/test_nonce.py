@@ -0,0 +1,100 @@
+import json
+
+from simmer_sdk.nonce import NonceManager, is_nonce_error
+
+
+class Chain:
+    """Pending transaction count for one wallet, as the RPC would report it."""
+
+    def __init__(self, nonce):
+        self.nonce = nonce
+        self.reads = 0
+
+    def __call__(self):
+        self.reads += 1
+        return self.nonce
+
+
+def test_reserve_counts_locally_after_first_sync():
+    chain = Chain(5)
+    manager = NonceManager("0xabc", chain)
+    assert manager.reserve() == 5
+    assert manager.reserve_many(3) == [6, 7, 8]
+    assert chain.reads == 1
+
+
+def test_released_nonce_is_reissued_first():
+    manager = NonceManager("0xabc", Chain(5))
+    first, second, third = manager.reserve_many(3)
+    manager.release(second)
+    assert manager.reserve() == second
+    manager.release(third)
+    assert manager.reserve() == third
+
+
+def test_nonce_error_resyncs_from_chain():
+    chain = Chain(5)
+    manager = NonceManager("0xabc", chain)
+    nonce = manager.reserve()
+    chain.nonce = 9  # Another process sent transactions meanwhile
+    manager.release(nonce, "nonce too low")
+    assert manager.needs_sync
+    assert manager.reserve() == 9
+
+
+def test_resync_keeps_nonces_still_held():
+    chain = Chain(5)
+    manager = NonceManager("0xabc", chain)
+    held = manager.reserve_many(2)
+    manager.mark_sent(held[1], "0xsent")
+    manager.invalidate()
+    assert manager.reserve() == 7
+
+
+def test_restart_does_not_restore_unsent_reservation(tmp_path):
+    path = str(tmp_path / "nonces.json")
+    manager = NonceManager("0xabc", lambda: 5, path=path)
+    assert manager.reserve() == 5
+
+    # Process dies before broadcasting; the chain nonce is still 5
+    restarted = NonceManager("0xabc", lambda: 5, path=path)
+    assert restarted.in_flight == {}
+    assert restarted.reserve() == 5
+
+
+def test_restart_keeps_broadcast_reservation(tmp_path):
+    path = str(tmp_path / "nonces.json")
+    manager = NonceManager("0xabc", lambda: 5, path=path)
+    nonce = manager.reserve()
+    manager.mark_sent(nonce, "0xdead")
+
+    # Broadcast but not mined: the RPC may not count it yet
+    restarted = NonceManager("0xabc", lambda: 5, path=path)
+    assert set(restarted.in_flight) == {5}
+    assert restarted.reserve() == 6
+
+
+def test_confirm_removes_persisted_entry(tmp_path):
+    path = tmp_path / "nonces.json"
+    manager = NonceManager("0xabc", lambda: 5, path=str(path))
+    nonce = manager.reserve()
+    manager.mark_sent(nonce, "0xdead")
+    manager.confirm(nonce)
+    assert json.loads(path.read_text())["0xabc"]["in_flight"] == {}
+
+
+def test_load_ignores_unsent_entries_from_older_files(tmp_path):
+    path = tmp_path / "nonces.json"
+    path.write_text(json.dumps({"0xabc": {"in_flight": {
+        "5": {"reserved_at": 1e12, "tx_hash": None},
+        "6": {"reserved_at": 1e12, "tx_hash": "0xdead"},
+    }}}))
+    manager = NonceManager("0xabc", lambda: 5, path=str(path))
+    assert set(manager.in_flight) == {6}
+    assert manager.reserve() == 5
+
+
+def test_is_nonce_error():
+    assert is_nonce_error("replacement: Nonce too low")
+    assert is_nonce_error(RuntimeError("invalid nonce"))
+    assert not is_nonce_error("insufficient funds")
@@ -0,0 +1,84 @@
+import threading
+
+import pytest
+
+from simmer_sdk.ratelimit import (
+    READ, RPC, TRADE, BucketConfig, FileLockBackend, RateLimiter, _reserve, classify_endpoint,
+)
+
+
+def test_classify_endpoint():
+    assert classify_endpoint("POST", "/api/sdk/trade") == TRADE
+    assert classify_endpoint("post", "/api/sdk/redeem?x=1") == TRADE
+    assert classify_endpoint("GET", "/api/sdk/trades") == READ
+    assert classify_endpoint("POST", "/api/rpc/polygon") == RPC
+    assert classify_endpoint("GET", "/api/sdk/markets") == READ
+
+
+def test_reserve_burst_then_wait():
+    config = BucketConfig(rate=2, burst=2)
+    state, waits = None, []
+    for _ in range(4):
+        state, wait = _reserve(state, config, now=100.0)
+        waits.append(wait)
+    # Two tokens back-to-back, then each waiter queues half a second behind the last
+    assert waits == [0, 0, 0.5, 1.0]
+
+
+def test_reserve_refills_over_time():
+    config = BucketConfig(rate=1, burst=3)
+    state, _ = _reserve(None, config, now=0.0)
+    state, _ = _reserve(state, config, now=0.0)
+    state, _ = _reserve(state, config, now=0.0)
+    state, wait = _reserve(state, config, now=10.0)
+    assert wait == 0
+    assert state[0] == 2  # Refill is capped at burst
+
+
+def test_limiter_uses_per_class_buckets():
+    limiter = RateLimiter(limits={TRADE: BucketConfig(rate=1, burst=1)})
+    assert limiter.reserve("POST", "/api/sdk/trade") == 0
+    assert limiter.reserve("POST", "/api/sdk/trade") > 0
+    assert limiter.reserve("GET", "/api/sdk/markets") == 0
+
+
+def test_limiter_is_thread_safe():
+    limiter = RateLimiter(limits={READ: BucketConfig(rate=1, burst=10)})
+    waits = []
+    lock = threading.Lock()
+
+    def worker():
+        wait = limiter.reserve("GET", "/api/sdk/markets")
+        with lock:
+            waits.append(wait)
+
+    threads = [threading.Thread(target=worker) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sum(1 for w in waits if w == 0) == 10
+
+
+def test_shared_limiter_is_per_key():
+    assert RateLimiter.shared("sk_a") is RateLimiter.shared("sk_a")
+    assert RateLimiter.shared("sk_a") is not RateLimiter.shared("sk_b")
+
+
+def test_file_backend_shares_state_across_instances(tmp_path):
+    pytest.importorskip("fcntl")
+    path = str(tmp_path / "ratelimit.json")
+    config = {TRADE: BucketConfig(rate=0.1, burst=2)}
+    first = RateLimiter(limits=config, backend=FileLockBackend(path))
+    second = RateLimiter(limits=config, backend=FileLockBackend(path))
+    assert first.reserve("POST", "/api/sdk/trade") == 0
+    assert second.reserve("POST", "/api/sdk/trade") == 0
+    assert first.reserve("POST", "/api/sdk/trade") > 0
+
+
+def test_file_backend_recovers_from_corrupt_state(tmp_path):
+    pytest.importorskip("fcntl")
+    path = tmp_path / "ratelimit.json"
+    path.write_text("{not json")
+    limiter = RateLimiter(backend=FileLockBackend(str(path)))
+    assert limiter.reserve("GET", "/api/sdk/markets") == 0
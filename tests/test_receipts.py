@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+
+from simmer_sdk.receipts import ReceiptWatcher
+
+
+class RPC:
+    """Fake PolygonRPC: a hash gets a receipt once it is in ``mined``."""
+
+    def __init__(self):
+        self.mined = {}
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def get_receipts(self, hashes):
+        with self.lock:
+            self.batches.append(list(hashes))
+            return [self.mined.get(h) for h in hashes]
+
+
+def _watcher(rpc, **kwargs):
+    kwargs.setdefault("min_interval", 0.01)
+    kwargs.setdefault("max_interval", 0.02)
+    return ReceiptWatcher(rpc, **kwargs)
+
+
+def test_resolves_receipts_in_one_batch_per_tick():
+    rpc = RPC()
+    rpc.mined = {"0xa": {"status": 1}, "0xb": {"status": 0}}
+    receipts = _watcher(rpc).wait(["0xa", "0xb"], timeout=2)
+    assert receipts == {"0xa": {"status": 1}, "0xb": {"status": 0}}
+    assert rpc.batches[0] == ["0xa", "0xb"]
+
+
+def test_timeout_resolves_to_none():
+    watcher = _watcher(RPC())
+    assert watcher.watch("0xa", timeout=0.05).result(timeout=2) is None
+    assert watcher.pending == 0
+
+
+def test_watching_twice_returns_the_same_future():
+    watcher = _watcher(RPC())
+    assert watcher.watch("0xa", timeout=0.2) is watcher.watch("0xa", timeout=0.2)
+
+
+def test_poll_errors_are_retried():
+    rpc = RPC()
+    calls = []
+
+    def flaky(hashes):
+        calls.append(hashes)
+        if len(calls) == 1:
+            raise ConnectionError("rpc down")
+        return [{"status": 1}]
+
+    rpc.get_receipts = flaky
+    assert _watcher(rpc).watch("0xa", timeout=2).result(timeout=2) == {"status": 1}
+    assert len(calls) >= 2
+
+
+def test_frequent_watches_do_not_postpone_polling():
+    rpc = RPC()
+    watcher = _watcher(rpc, min_interval=0.05, max_interval=0.05)
+    first = watcher.watch("0xfirst", timeout=5)
+    rpc.mined["0xfirst"] = {"status": 1}
+    # A new hash every 10ms would keep resetting a naive "poll after a quiet interval" timer
+    deadline = time.monotonic() + 0.5
+    i = 0
+    while not first.done() and time.monotonic() < deadline:
+        watcher.watch(f"0x{i}", timeout=0.1)
+        i += 1
+        time.sleep(0.01)
+    assert first.result(timeout=0) == {"status": 1}
+
+
+def test_wait_async():
+    rpc = RPC()
+    rpc.mined["0xa"] = {"status": 1}
+    watcher = _watcher(rpc)
+
+    async def main():
+        return await asyncio.gather(watcher.wait_async("0xa", 2), watcher.wait_async("0xb", 0.05))
+
+    assert asyncio.run(main()) == [{"status": 1}, None]
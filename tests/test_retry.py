@@ -0,0 +1,99 @@
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+
+from simmer_sdk import SimmerClient
+from simmer_sdk.retry import IDEMPOTENCY_HEADER, RetryPolicy, parse_retry_after
+
+FAST = RetryPolicy(max_retries=2, backoff_base=0, jitter=0)
+
+
+class Response:
+    def __init__(self, status, body=b"{}", headers=None):
+        self.status_code = status
+        self.content = body
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"HTTP {self.status_code}")
+
+    def close(self):
+        pass
+
+
+class Session:
+    """Replays canned responses and records every request."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def client():
+    client = SimmerClient(api_key="sk_test", retry_policy=FAST)
+    yield client
+    client.close()
+
+
+def test_retryable_requests():
+    policy = RetryPolicy()
+    assert policy.is_retryable_request("get", "/api/sdk/markets")
+    assert policy.is_retryable_request("DELETE", "/api/sdk/orders/1")
+    assert not policy.is_retryable_request("POST", "/api/sdk/trade")
+    assert policy.is_retryable_request("POST", "/api/sdk/trade/", idempotency_key="k1")
+    assert not policy.is_retryable_request("POST", "/api/sdk/wallet/link", idempotency_key="k1")
+    assert not policy.is_retryable_request("PATCH", "/api/sdk/settings", idempotency_key="k1")
+
+
+def test_backoff_grows_and_is_capped():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=0)
+    assert [policy.backoff(n) for n in (1, 2, 3, 4)] == [1, 2, 4, 5]
+
+
+def test_backoff_honours_retry_after():
+    policy = RetryPolicy(max_retry_after=10)
+    assert policy.backoff(1, retry_after=3) == 3
+    assert policy.backoff(1, retry_after=60) is None
+    assert RetryPolicy(respect_retry_after=False, jitter=0).backoff(1, retry_after=60) == 0.5
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("-5") == 0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert 25 < parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
+    assert parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0
+
+
+def test_get_retried_after_429(client, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    client._session = Session(Response(429, headers={"Retry-After": "2"}), Response(200, b'{"ok": true}'))
+    assert client._request("GET", "/api/sdk/health", use_cache=False) == {"ok": True}
+    assert sleeps == [2]
+
+
+def test_trade_post_without_key_is_sent_once(client):
+    client._session = Session(Response(503), Response(200))
+    with pytest.raises(requests.exceptions.HTTPError):
+        client._request("POST", "/api/sdk/trade", json={})
+    assert len(client._session.calls) == 1
+    assert client._session.calls[0][2]["headers"] is None
+
+
+def test_trade_post_with_key_is_retried(client):
+    client._session = Session(Response(503), Response(200, b'{"success": true}'))
+    assert client._request("POST", "/api/sdk/trade", json={}, idempotency_key="k1") == {"success": True}
+    assert [call[2]["headers"] for call in client._session.calls] == [{IDEMPOTENCY_HEADER: "k1"}] * 2
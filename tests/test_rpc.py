@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+import requests
+
+from simmer_sdk.rpc import PolygonRPC, decode_receipt, hex_to_int
+
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(f"HTTP {status}", response=response)
+
+
+class Node:
+    """Fake RPC proxy: answers eth_* calls with their method name, optionally failing batches."""
+
+    def __init__(self, batch_error=None):
+        self.batch_error = batch_error
+        self.payloads = []
+
+    def __call__(self, payload):
+        self.payloads.append(payload)
+        if isinstance(payload, list):
+            if self.batch_error is not None:
+                raise self.batch_error
+            # Out of order on purpose: results are matched by id
+            return [{"jsonrpc": "2.0", "id": p["id"], "result": p["method"]} for p in reversed(payload)]
+        return {"jsonrpc": "2.0", "id": payload["id"], "result": payload["method"]}
+
+
+CALLS = [("eth_gasPrice", []), ("eth_blockNumber", [])]
+
+
+def test_call_many_sends_one_batch():
+    node = Node()
+    rpc = PolygonRPC(node)
+    assert rpc.call_many(CALLS) == ["eth_gasPrice", "eth_blockNumber"]
+    assert rpc.requests == 1
+
+
+def test_call_many_splits_large_batches():
+    node = Node()
+    rpc = PolygonRPC(node, max_batch=2)
+    assert len(rpc.call_many(CALLS * 2 + CALLS[:1])) == 5
+    assert [len(p) if isinstance(p, list) else 1 for p in node.payloads] == [2, 2, 1]
+
+
+@pytest.mark.parametrize("status", [400, 405, 413, 415])
+def test_rejected_batch_falls_back_to_single_calls(status):
+    node = Node(batch_error=http_error(status))
+    rpc = PolygonRPC(node)
+    assert rpc.call_many(CALLS) == ["eth_gasPrice", "eth_blockNumber"]
+    node.payloads.clear()
+    rpc.call_many(CALLS)
+    assert not any(isinstance(p, list) for p in node.payloads)  # Remembered
+
+
+@pytest.mark.parametrize("error", [http_error(401), http_error(429), http_error(500), ConnectionError("down")])
+def test_other_errors_keep_batching(error):
+    node = Node(batch_error=error)
+    rpc = PolygonRPC(node)
+    assert rpc.call_many(CALLS) == [error, error]
+    node.batch_error = None
+    assert rpc.call_many(CALLS) == ["eth_gasPrice", "eth_blockNumber"]
+    assert isinstance(node.payloads[-1], list)
+
+
+def test_non_list_batch_response_disables_batching():
+    def transport(payload):
+        if isinstance(payload, list):
+            return {"error": "batch not supported"}
+        return {"result": "0x1"}
+
+    rpc = PolygonRPC(transport)
+    assert rpc.call_many(CALLS) == ["0x1", "0x1"]
+
+
+def test_json_rpc_errors_are_per_call():
+    rpc = PolygonRPC(lambda payload: [
+        {"id": 0, "result": "0x1"},
+        {"id": 1, "error": {"code": -32000, "message": "boom"}},
+    ])
+    ok, failed = rpc.call_many(CALLS)
+    assert ok == "0x1" and isinstance(failed, RuntimeError)
+
+
+def test_concurrent_calls_share_one_request():
+    node = Node()
+    rpc = PolygonRPC(node, window=0.05)
+    results = {}
+    barrier = threading.Barrier(3)
+
+    def worker(method):
+        barrier.wait()
+        results[method] = rpc.call(method)
+
+    threads = [threading.Thread(target=worker, args=(m,)) for m in ("eth_a", "eth_b", "eth_c")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == {"eth_a": "eth_a", "eth_b": "eth_b", "eth_c": "eth_c"}
+    assert rpc.requests == 1
+
+
+def test_decoding():
+    assert hex_to_int("0x1a") == 26
+    assert hex_to_int(None) == 0
+    assert decode_receipt({"status": "0x1", "blockNumber": "0x10", "logs": []}) == {
+        "status": 1, "blockNumber": 16, "logs": [],
+    }
+    assert decode_receipt(None) is None